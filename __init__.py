@@ -1 +0,0 @@
-# Frontend UI
@@ -1,11 +1,13 @@
 """
 Mythos Bytecode Compiler - Compiles AST to bytecode
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Set, Any, NamedTuple
 from compiler.ast.nodes import *
-from enum import Enum, auto
+from enum import IntEnum, auto
 
-class OpCode(Enum):
+class OpCode(IntEnum):
+    # Values are baked into the cached Numba VM kernel: add new opcodes at the end
+    
     # Stack operations
     LOAD_CONST = auto()
     LOAD_VAR = auto()
@@ -64,23 +66,89 @@ class OpCode(Enum):
     # Web
     CREATE_WEB_APP = auto()
     ADD_ROUTE = auto()
+    
+    # Variables resolved at compile time inside functions
+    LOAD_LOCAL = auto()
+    STORE_LOCAL = auto()
+    LOAD_GLOBAL = auto()
+    
+    # One-argument math builtins called inline
+    CALL_SQRT = auto()
+    CALL_SIN = auto()
+    CALL_COS = auto()
+    CALL_TAN = auto()
+    CALL_ABS = auto()
+    CALL_FLOOR = auto()
+    CALL_CEIL = auto()
 
-class Instruction:
-    def __init__(self, opcode: OpCode, arg=None):
-        self.opcode = opcode
-        self.arg = arg
+class Instruction(NamedTuple):
+    # A tuple so the VM can unpack opcode and arg in one step
+    opcode: OpCode
+    arg: Any = None
     
     def __repr__(self):
         if self.arg is not None:
             return f"{self.opcode.name} {self.arg}"
         return self.opcode.name
 
+class FunctionCode(NamedTuple):
+    """Compiled function, stored as a constant; the VM wraps it in a function object"""
+    name: str
+    params: List[str]
+    instructions: List[Instruction]
+    constants: List[Any]
+    # Local variable names indexed by slot; parameters come first
+    local_names: List[str]
+    
+    def __repr__(self):
+        return f"<code {self.name}>"
+
+# Builtin calls compiled to a single opcode when the name is not reassigned
+KNOWN_BUILTINS = {
+    'sqrt': OpCode.CALL_SQRT,
+    'sin': OpCode.CALL_SIN,
+    'cos': OpCode.CALL_COS,
+    'tan': OpCode.CALL_TAN,
+    'abs': OpCode.CALL_ABS,
+    'floor': OpCode.CALL_FLOOR,
+    'ceil': OpCode.CALL_CEIL,
+}
+
+# Nodes that leave a value on the stack; as statements the value is popped
+EXPRESSION_NODES = (
+    NumberNode, StringNode, BooleanNode, NullNode, IdentifierNode, BinaryOpNode, UnaryOpNode,
+    CallNode, MemberAccessNode, IndexAccessNode, ArrayNode, ObjectNode,
+)
+
+def assigned_names(node: Any) -> Set[str]:
+    """Names a program assigns anywhere: variables, functions and parameters"""
+    names: Set[str] = set()
+    pending = [node]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, list):
+            pending.extend(item)
+        elif isinstance(item, dict):
+            pending.extend(item.values())
+        elif isinstance(item, ASTNode):
+            if isinstance(item, (AssignmentNode, VariableDeclarationNode)):
+                names.add(item.name)
+            elif isinstance(item, FunctionNode):
+                names.add(item.name)
+                names.update(item.parameters)
+            elif isinstance(item, ForNode):
+                names.add(item.variable)
+            pending.extend(vars(item).values())
+    return names
+
 class BytecodeCompiler:
     def __init__(self):
         self.instructions: List[Instruction] = []
         self.constants: List[Any] = []
         self.labels: Dict[str, int] = {}
         self.label_counter = 0
+        # Builtin names the program reassigns, which must be called normally
+        self.shadowed: Set[str] = set()
         
     def new_label(self) -> str:
         label = f"L{self.label_counter}"
@@ -99,11 +167,17 @@ class BytecodeCompiler:
     def mark_label(self, label: str):
         self.labels[label] = len(self.instructions)
     
+    def compile_statement(self, stmt: ASTNode):
+        """Compile a statement, discarding the value of an expression statement"""
+        self.compile(stmt)
+        if isinstance(stmt, EXPRESSION_NODES):
+            self.emit(OpCode.POP)
+    
     def compile(self, node: ASTNode):
         if isinstance(node, ProgramNode):
+            self.shadowed = assigned_names(node) & KNOWN_BUILTINS.keys()
             for stmt in node.statements:
-                self.compile(stmt)
-                # Don't auto-pop - let statements handle their own stack management
+                self.compile_statement(stmt)
         
         elif isinstance(node, NumberNode):
             const_idx = self.add_constant(node.value)
@@ -170,6 +244,12 @@ class BytecodeCompiler:
             self.emit(OpCode.STORE_VAR, node.name)
             # Don't leave value on stack
         
+        elif (isinstance(node, CallNode) and isinstance(node.callee, IdentifierNode)
+              and node.callee.name in KNOWN_BUILTINS and node.callee.name not in self.shadowed
+              and len(node.arguments) == 1):
+            self.compile(node.arguments[0])
+            self.emit(KNOWN_BUILTINS[node.callee.name])
+        
         elif isinstance(node, CallNode):
             # Compile callee first
             self.compile(node.callee)
@@ -213,14 +293,14 @@ class BytecodeCompiler:
             
             # Then body
             for stmt in node.then_body:
-                self.compile(stmt)
+                self.compile_statement(stmt)
             self.emit(OpCode.JUMP, end_label)
             
             # Else body
             self.mark_label(else_label)
             if node.else_body:
                 for stmt in node.else_body:
-                    self.compile(stmt)
+                    self.compile_statement(stmt)
             
             self.mark_label(end_label)
         
@@ -233,7 +313,7 @@ class BytecodeCompiler:
             self.emit(OpCode.JUMP_IF_FALSE, end_label)
             
             for stmt in node.body:
-                self.compile(stmt)
+                self.compile_statement(stmt)
             
             self.emit(OpCode.JUMP, start_label)
             self.mark_label(end_label)
@@ -254,7 +334,7 @@ class BytecodeCompiler:
             # ... iterator logic would go here
             
             for stmt in node.body:
-                self.compile(stmt)
+                self.compile_statement(stmt)
             
             self.emit(OpCode.JUMP, start_label)
             self.mark_label(end_label)
@@ -262,19 +342,24 @@ class BytecodeCompiler:
         elif isinstance(node, FunctionNode):
             # Create a new compiler for the function body
             func_compiler = BytecodeCompiler()
+            func_compiler.shadowed = self.shadowed
             for stmt in node.body:
-                func_compiler.compile(stmt)
+                func_compiler.compile_statement(stmt)
+            # Falling off the end returns null
+            func_compiler.emit(OpCode.LOAD_CONST, func_compiler.add_constant(None))
             func_compiler.emit(OpCode.RETURN)
+            local_names = func_compiler.resolve_slots(node.parameters)
             
-            # Store function as constant
-            func_data = {
-                'name': node.name,
-                'params': node.parameters,
-                'instructions': func_compiler.instructions,
-                'constants': func_compiler.constants
-            }
-            const_idx = self.add_constant(func_data)
-            self.emit(OpCode.MAKE_FUNCTION, const_idx)
+            # Load the compiled function as a constant
+            func = FunctionCode(
+                node.name,
+                node.parameters,
+                func_compiler.instructions,
+                func_compiler.constants,
+                local_names
+            )
+            const_idx = self.add_constant(func)
+            self.emit(OpCode.LOAD_CONST, const_idx)
             self.emit(OpCode.STORE_VAR, node.name)
         
         elif isinstance(node, ReturnNode):
@@ -318,8 +403,9 @@ class BytecodeCompiler:
             
             # Compile route handler as function
             route_compiler = BytecodeCompiler()
+            route_compiler.shadowed = self.shadowed
             for stmt in node.body:
-                route_compiler.compile(stmt)
+                route_compiler.compile_statement(stmt)
             
             route_data = {
                 'instructions': route_compiler.instructions,
@@ -328,11 +414,35 @@ class BytecodeCompiler:
             handler_idx = self.add_constant(route_data)
             self.emit(OpCode.ADD_ROUTE, handler_idx)
     
+    def resolve_slots(self, params: List[str]) -> List[str]:
+        """Rewrite variable access in a function body to use local slots
+        
+        Parameters and every name the body assigns become locals, numbered
+        in that order; other names are globals. Returns the local names
+        indexed by slot.
+        """
+        local_names = list(params)
+        slots = {name: i for i, name in enumerate(local_names)}
+        for instr in self.instructions:
+            if instr.opcode == OpCode.STORE_VAR and instr.arg not in slots:
+                slots[instr.arg] = len(local_names)
+                local_names.append(instr.arg)
+        
+        for i, instr in enumerate(self.instructions):
+            if instr.opcode == OpCode.STORE_VAR:
+                self.instructions[i] = Instruction(OpCode.STORE_LOCAL, slots[instr.arg])
+            elif instr.opcode == OpCode.LOAD_VAR:
+                if instr.arg in slots:
+                    self.instructions[i] = Instruction(OpCode.LOAD_LOCAL, slots[instr.arg])
+                else:
+                    self.instructions[i] = Instruction(OpCode.LOAD_GLOBAL, instr.arg)
+        return local_names
+    
     def resolve_labels(self):
         """Resolve label references to actual instruction indices"""
         for i, instr in enumerate(self.instructions):
             if isinstance(instr.arg, str) and instr.arg in self.labels:
-                instr.arg = self.labels[instr.arg]
+                self.instructions[i] = instr._replace(arg=self.labels[instr.arg])
     
     def get_bytecode(self):
         self.resolve_labels()
@@ -2,9 +2,10 @@
 Mythos Lexer - Tokenizes source code into tokens
 """
 import re
+import sys
 from enum import Enum, auto
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 class TokenType(Enum):
     # Literals
@@ -65,22 +66,59 @@ class TokenType(Enum):
 @dataclass
 class Token:
     type: TokenType
-    value: any
+    value: Any
     line: int
     column: int
     
     def __repr__(self):
         return f"Token({self.type.name}, {self.value!r}, {self.line}:{self.column})"
 
+KEYWORDS = frozenset({
+    'if', 'else', 'elif', 'while', 'for', 'in', 'break', 'continue',
+    'function', 'return', 'class', 'extends', 'new', 'this', 'super',
+    'import', 'from', 'export', 'as', 'true', 'false', 'null',
+    'and', 'or', 'not', 'is', 'scene', 'route', 'web', 'ui',
+    'let', 'const', 'var', 'async', 'await', 'try', 'catch', 'finally',
+    'throw', 'with', 'match', 'case', 'default'
+})
+
+# Token rules tried in order at each position by one combined pattern
+_TOKEN_RE = re.compile(r"""
+    (?P<WS>[ \t\r]+)
+  | (?P<IDENT>[^\W\d]\w*)
+  | (?P<NEWLINE>\n)
+  | (?P<NUMBER>\d+(?:\.\d*)?)
+  | (?P<OP>\+=|-=|->|==|!=|<=|>=|[-+*/^%=!<>(){}\[\],.:;])
+  | (?P<STRING>"(?P<DQ>(?:[^"\\]|\\.)*)"?|'(?P<SQ>(?:[^'\\]|\\.)*)'?)
+  | (?P<COMMENT>\#[^\n]*)
+""", re.VERBOSE | re.DOTALL)
+
+_OPERATORS = {
+    '+': TokenType.PLUS, '+=': TokenType.PLUS_ASSIGN,
+    '-': TokenType.MINUS, '-=': TokenType.MINUS_ASSIGN, '->': TokenType.ARROW,
+    '*': TokenType.MULTIPLY, '/': TokenType.DIVIDE,
+    '^': TokenType.POWER, '%': TokenType.MODULO,
+    '=': TokenType.ASSIGN, '==': TokenType.EQUAL,
+    '!': None, '!=': TokenType.NOT_EQUAL,  # A lone '!' produces no token
+    '<': TokenType.LESS_THAN, '<=': TokenType.LESS_EQUAL,
+    '>': TokenType.GREATER_THAN, '>=': TokenType.GREATER_EQUAL,
+    '(': TokenType.LPAREN, ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE, '}': TokenType.RBRACE,
+    '[': TokenType.LBRACKET, ']': TokenType.RBRACKET,
+    ',': TokenType.COMMA, '.': TokenType.DOT,
+    ':': TokenType.COLON, ';': TokenType.SEMICOLON,
+}
+
+# Any other escaped character stands for itself
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+
+def _unescape(match: re.Match) -> str:
+    char = match.group(1)
+    return _ESCAPES.get(char, char)
+
 class Lexer:
-    KEYWORDS = {
-        'if', 'else', 'elif', 'while', 'for', 'in', 'break', 'continue',
-        'function', 'return', 'class', 'extends', 'new', 'this', 'super',
-        'import', 'from', 'export', 'as', 'true', 'false', 'null',
-        'and', 'or', 'not', 'is', 'scene', 'route', 'web', 'ui',
-        'let', 'const', 'var', 'async', 'await', 'try', 'catch', 'finally',
-        'throw', 'with', 'match', 'case', 'default'
-    }
+    KEYWORDS = KEYWORDS
     
     def __init__(self, source: str):
         self.source = source
@@ -89,223 +127,77 @@ class Lexer:
         self.column = 1
         self.tokens: List[Token] = []
         self.indent_stack = [0]
-        
-    def current_char(self) -> Optional[str]:
-        if self.pos >= len(self.source):
-            return None
-        return self.source[self.pos]
-    
-    def peek_char(self, offset=1) -> Optional[str]:
-        pos = self.pos + offset
-        if pos >= len(self.source):
-            return None
-        return self.source[pos]
-    
-    def advance(self):
-        if self.pos < len(self.source):
-            if self.source[self.pos] == '\n':
-                self.line += 1
-                self.column = 1
-            else:
-                self.column += 1
-            self.pos += 1
-    
-    def skip_whitespace(self):
-        while self.current_char() and self.current_char() in ' \t\r':
-            self.advance()
-    
-    def skip_comment(self):
-        if self.current_char() == '#':
-            while self.current_char() and self.current_char() != '\n':
-                self.advance()
-    
-    def read_number(self) -> Token:
-        start_line, start_col = self.line, self.column
-        num_str = ''
-        has_dot = False
-        
-        while self.current_char() and (self.current_char().isdigit() or self.current_char() == '.'):
-            if self.current_char() == '.':
-                if has_dot:
-                    break
-                has_dot = True
-            num_str += self.current_char()
-            self.advance()
-        
-        value = float(num_str) if has_dot else int(num_str)
-        return Token(TokenType.NUMBER, value, start_line, start_col)
-    
-    def read_string(self, quote_char: str) -> Token:
-        start_line, start_col = self.line, self.column
-        self.advance()  # Skip opening quote
-        string_val = ''
-        
-        while self.current_char() and self.current_char() != quote_char:
-            if self.current_char() == '\\':
-                self.advance()
-                escape_char = self.current_char()
-                if escape_char == 'n':
-                    string_val += '\n'
-                elif escape_char == 't':
-                    string_val += '\t'
-                elif escape_char == 'r':
-                    string_val += '\r'
-                elif escape_char == '\\':
-                    string_val += '\\'
-                elif escape_char == quote_char:
-                    string_val += quote_char
-                else:
-                    string_val += escape_char
-                self.advance()
-            else:
-                string_val += self.current_char()
-                self.advance()
-        
-        self.advance()  # Skip closing quote
-        return Token(TokenType.STRING, string_val, start_line, start_col)
     
-    def read_identifier(self) -> Token:
-        start_line, start_col = self.line, self.column
-        identifier = ''
-        
-        while self.current_char() and (self.current_char().isalnum() or self.current_char() == '_'):
-            identifier += self.current_char()
-            self.advance()
+    def _identifier_token(self, identifier: str, line: int, column: int) -> Token:
+        # Interned so the parser can compare keywords with `is` and repeated
+        # names share one string (and hit dict lookups by identity)
+        identifier = sys.intern(identifier)
         
         # Check if it's a keyword
         if identifier in self.KEYWORDS:
             if identifier in ('true', 'false'):
-                return Token(TokenType.BOOLEAN, identifier == 'true', start_line, start_col)
+                return Token(TokenType.BOOLEAN, identifier == 'true', line, column)
             elif identifier == 'null':
-                return Token(TokenType.NULL, None, start_line, start_col)
-            return Token(TokenType.KEYWORD, identifier, start_line, start_col)
+                return Token(TokenType.NULL, None, line, column)
+            return Token(TokenType.KEYWORD, identifier, line, column)
         
-        return Token(TokenType.IDENTIFIER, identifier, start_line, start_col)
+        return Token(TokenType.IDENTIFIER, identifier, line, column)
     
     def tokenize(self) -> List[Token]:
-        while self.pos < len(self.source):
-            self.skip_whitespace()
-            
-            if not self.current_char():
-                break
-            
-            # Comments
-            if self.current_char() == '#':
-                self.skip_comment()
-                continue
-            
-            # Newlines
-            if self.current_char() == '\n':
-                self.tokens.append(Token(TokenType.NEWLINE, '\n', self.line, self.column))
-                self.advance()
-                continue
-            
-            # Numbers
-            if self.current_char().isdigit():
-                self.tokens.append(self.read_number())
-                continue
+        source = self.source
+        tokens = self.tokens
+        match = _TOKEN_RE.match
+        pos = self.pos
+        line = self.line
+        line_start = pos - (self.column - 1)  # Source index of column 1
+        
+        while pos < len(source):
+            m = match(source, pos)
+            if m is None:
+                raise SyntaxError(f"Unexpected character '{source[pos]}' at {line}:{pos - line_start + 1}")
             
-            # Strings
-            if self.current_char() in ('"', "'"):
-                self.tokens.append(self.read_string(self.current_char()))
-                continue
+            kind = m.lastgroup
+            column = pos - line_start + 1
+            pos = m.end()
             
-            # Identifiers and keywords
-            if self.current_char().isalpha() or self.current_char() == '_':
-                self.tokens.append(self.read_identifier())
+            if kind == 'WS' or kind == 'COMMENT':
                 continue
             
-            # Operators and delimiters
-            char = self.current_char()
-            line, col = self.line, self.column
-            
-            if char == '+':
-                self.advance()
-                if self.current_char() == '=':
-                    self.advance()
-                    self.tokens.append(Token(TokenType.PLUS_ASSIGN, '+=', line, col))
-                else:
-                    self.tokens.append(Token(TokenType.PLUS, '+', line, col))
-            elif char == '-':
-                self.advance()
-                if self.current_char() == '=':
-                    self.advance()
-                    self.tokens.append(Token(TokenType.MINUS_ASSIGN, '-=', line, col))
-                elif self.current_char() == '>':
-                    self.advance()
-                    self.tokens.append(Token(TokenType.ARROW, '->', line, col))
-                else:
-                    self.tokens.append(Token(TokenType.MINUS, '-', line, col))
-            elif char == '*':
-                self.advance()
-                self.tokens.append(Token(TokenType.MULTIPLY, '*', line, col))
-            elif char == '/':
-                self.advance()
-                self.tokens.append(Token(TokenType.DIVIDE, '/', line, col))
-            elif char == '^':
-                self.advance()
-                self.tokens.append(Token(TokenType.POWER, '^', line, col))
-            elif char == '%':
-                self.advance()
-                self.tokens.append(Token(TokenType.MODULO, '%', line, col))
-            elif char == '=':
-                self.advance()
-                if self.current_char() == '=':
-                    self.advance()
-                    self.tokens.append(Token(TokenType.EQUAL, '==', line, col))
-                else:
-                    self.tokens.append(Token(TokenType.ASSIGN, '=', line, col))
-            elif char == '!':
-                self.advance()
-                if self.current_char() == '=':
-                    self.advance()
-                    self.tokens.append(Token(TokenType.NOT_EQUAL, '!=', line, col))
-            elif char == '<':
-                self.advance()
-                if self.current_char() == '=':
-                    self.advance()
-                    self.tokens.append(Token(TokenType.LESS_EQUAL, '<=', line, col))
-                else:
-                    self.tokens.append(Token(TokenType.LESS_THAN, '<', line, col))
-            elif char == '>':
-                self.advance()
-                if self.current_char() == '=':
-                    self.advance()
-                    self.tokens.append(Token(TokenType.GREATER_EQUAL, '>=', line, col))
+            if kind == 'IDENT':
+                tokens.append(self._identifier_token(m.group(), line, column))
+            elif kind == 'OP':
+                token_type = _OPERATORS[m.group()]
+                if token_type is not None:
+                    tokens.append(Token(token_type, m.group(), line, column))
+            elif kind == 'NEWLINE':
+                tokens.append(Token(TokenType.NEWLINE, '\n', line, column))
+                line += 1
+                line_start = pos
+            elif kind == 'NUMBER':
+                text = m.group()
+                # Not a conditional expression: mypy types that as float, and
+                # mypyc would then convert integer literals to float
+                value: Any
+                if '.' in text:
+                    value = float(text)
                 else:
-                    self.tokens.append(Token(TokenType.GREATER_THAN, '>', line, col))
-            elif char == '(':
-                self.advance()
-                self.tokens.append(Token(TokenType.LPAREN, '(', line, col))
-            elif char == ')':
-                self.advance()
-                self.tokens.append(Token(TokenType.RPAREN, ')', line, col))
-            elif char == '{':
-                self.advance()
-                self.tokens.append(Token(TokenType.LBRACE, '{', line, col))
-            elif char == '}':
-                self.advance()
-                self.tokens.append(Token(TokenType.RBRACE, '}', line, col))
-            elif char == '[':
-                self.advance()
-                self.tokens.append(Token(TokenType.LBRACKET, '[', line, col))
-            elif char == ']':
-                self.advance()
-                self.tokens.append(Token(TokenType.RBRACKET, ']', line, col))
-            elif char == ',':
-                self.advance()
-                self.tokens.append(Token(TokenType.COMMA, ',', line, col))
-            elif char == '.':
-                self.advance()
-                self.tokens.append(Token(TokenType.DOT, '.', line, col))
-            elif char == ':':
-                self.advance()
-                self.tokens.append(Token(TokenType.COLON, ':', line, col))
-            elif char == ';':
-                self.advance()
-                self.tokens.append(Token(TokenType.SEMICOLON, ';', line, col))
-            else:
-                raise SyntaxError(f"Unexpected character '{char}' at {line}:{col}")
+                    value = int(text)
+                tokens.append(Token(TokenType.NUMBER, value, line, column))
+            else:  # STRING
+                body = m.group('DQ')
+                if body is None:
+                    body = m.group('SQ')
+                tokens.append(Token(TokenType.STRING, _ESCAPE_RE.sub(_unescape, body), line, column))
+                
+                # Strings may span lines
+                text = m.group()
+                newlines = text.count('\n')
+                if newlines:
+                    line += newlines
+                    line_start = m.start() + text.rindex('\n') + 1
         
-        self.tokens.append(Token(TokenType.EOF, None, self.line, self.column))
-        return self.tokens
+        self.pos = pos
+        self.line = line
+        self.column = pos - line_start + 1
+        tokens.append(Token(TokenType.EOF, None, self.line, self.column))
+        return tokens
@@ -1,25 +1,60 @@
 """
 Mythos Parser - Builds Abstract Syntax Tree from tokens
 """
+import sys
 from typing import List, Optional, Union
 from compiler.lexer.lexer import Token, TokenType
-from compiler.ast.nodes import *
+# Explicit names: mypyc does not resolve star imports in compiled modules
+from compiler.ast.nodes import (
+    ASTNode, ProgramNode, NumberNode, StringNode, BooleanNode, NullNode, IdentifierNode,
+    BinaryOpNode, UnaryOpNode, AssignmentNode, VariableDeclarationNode, CallNode,
+    MemberAccessNode, IndexAccessNode, ArrayNode, ObjectNode, IfNode, WhileNode, ForNode,
+    FunctionNode, ClassNode, ReturnNode, BreakNode, ContinueNode, ImportNode, SceneNode,
+    SceneElementNode, WebAppNode, RouteNode,
+)
+
+# Keyword values are interned by the lexer, so these compare with `is`
+_IF = sys.intern('if')
+_ELSE = sys.intern('else')
+_WHILE = sys.intern('while')
+_FOR = sys.intern('for')
+_FUNCTION = sys.intern('function')
+_CLASS = sys.intern('class')
+_EXTENDS = sys.intern('extends')
+_RETURN = sys.intern('return')
+_IMPORT = sys.intern('import')
+_SCENE = sys.intern('scene')
+_WEB = sys.intern('web')
+_LET = sys.intern('let')
+_CONST = sys.intern('const')
+_VAR = sys.intern('var')
+_BREAK = sys.intern('break')
+_CONTINUE = sys.intern('continue')
+_AND = sys.intern('and')
+_OR = sys.intern('or')
+_NOT = sys.intern('not')
+
+# Binary operator token types mapped to their operator strings, per precedence level
+_EQUALITY_OPS = {TokenType.EQUAL: '==', TokenType.NOT_EQUAL: '!='}
+_COMPARISON_OPS = {
+    TokenType.LESS_THAN: '<', TokenType.GREATER_THAN: '>',
+    TokenType.LESS_EQUAL: '<=', TokenType.GREATER_EQUAL: '>=',
+}
+_ADDITIVE_OPS = {TokenType.PLUS: '+', TokenType.MINUS: '-'}
+_MULTIPLICATIVE_OPS = {TokenType.MULTIPLY: '*', TokenType.DIVIDE: '/', TokenType.MODULO: '%'}
 
 class Parser:
     def __init__(self, tokens: List[Token]):
         self.tokens = tokens
+        self.n = len(tokens)
         self.pos = 0
         
     def current_token(self) -> Optional[Token]:
-        if self.pos >= len(self.tokens):
-            return None
-        return self.tokens[self.pos]
+        return self.tokens[self.pos] if self.pos < self.n else None
     
     def peek_token(self, offset=1) -> Optional[Token]:
         pos = self.pos + offset
-        if pos >= len(self.tokens):
-            return None
-        return self.tokens[pos]
+        return self.tokens[pos] if pos < self.n else None
     
     def advance(self):
         self.pos += 1
@@ -35,9 +70,12 @@ class Parser:
         return token
     
     def parse(self) -> ProgramNode:
-        statements = []
-        while self.current_token() and self.current_token().type != TokenType.EOF:
-            if self.current_token().type == TokenType.NEWLINE:
+        statements: List[ASTNode] = []
+        while True:
+            token = self.current_token()
+            if token is None or token.type == TokenType.EOF:
+                break
+            if token.type == TokenType.NEWLINE:
                 self.advance()
                 continue
             stmt = self.parse_statement()
@@ -45,7 +83,7 @@ class Parser:
                 statements.append(stmt)
         return ProgramNode(statements)
     
-    def parse_statement(self):
+    def parse_statement(self) -> Optional[ASTNode]:
         token = self.current_token()
         
         if not token:
@@ -59,35 +97,35 @@ class Parser:
         if token.type == TokenType.KEYWORD:
             keyword = token.value
             
-            if keyword == 'if':
+            if keyword is _IF:
                 return self.parse_if_statement()
-            elif keyword == 'while':
+            elif keyword is _WHILE:
                 return self.parse_while_statement()
-            elif keyword == 'for':
+            elif keyword is _FOR:
                 return self.parse_for_statement()
-            elif keyword == 'function':
+            elif keyword is _FUNCTION:
                 return self.parse_function_declaration()
-            elif keyword == 'class':
+            elif keyword is _CLASS:
                 return self.parse_class_declaration()
-            elif keyword == 'return':
+            elif keyword is _RETURN:
                 return self.parse_return_statement()
-            elif keyword == 'import':
+            elif keyword is _IMPORT:
                 return self.parse_import_statement()
-            elif keyword == 'scene':
+            elif keyword is _SCENE:
                 return self.parse_scene_declaration()
-            elif keyword == 'web':
+            elif keyword is _WEB:
                 return self.parse_web_declaration()
-            elif keyword in ('let', 'const', 'var'):
+            elif keyword is _LET or keyword is _CONST or keyword is _VAR:
                 return self.parse_variable_declaration()
-            elif keyword == 'break':
+            elif keyword is _BREAK:
                 self.advance()
                 return BreakNode()
-            elif keyword == 'continue':
+            elif keyword is _CONTINUE:
                 self.advance()
                 return ContinueNode()
         
         # Expression statement
-        return self.parse_expression_statement()
+        return self.parse_expression()
     
     def parse_variable_declaration(self):
         kind_token = self.current_token()
@@ -105,6 +143,15 @@ class Parser:
         return VariableDeclarationNode(name, value, kind)
     
     def parse_assignment_or_expression(self):
+        # Fast path for the common `name = value` form
+        next_token = self.peek_token()
+        if next_token and next_token.type == TokenType.ASSIGN:
+            name = self.current_token().value
+            self.advance()
+            self.advance()
+            value = self.parse_expression()
+            return AssignmentNode(name, value)
+        
         expr = self.parse_expression()
         
         # Check for assignment
@@ -117,34 +164,35 @@ class Parser:
         
         return expr
     
-    def parse_expression_statement(self):
-        expr = self.parse_expression()
-        return expr
+    def _parse_block(self) -> List[ASTNode]:
+        """Parse a brace-delimited list of statements"""
+        self.expect(TokenType.LBRACE)
+        body = []
+        rbrace = TokenType.RBRACE
+        newline = TokenType.NEWLINE
+        while True:
+            token = self.current_token()
+            if not token or token.type == rbrace:
+                break
+            if token.type == newline:
+                self.advance()
+                continue
+            stmt = self.parse_statement()
+            if stmt is not None:
+                body.append(stmt)
+        self.expect(rbrace)
+        return body
     
     def parse_if_statement(self):
         self.expect(TokenType.KEYWORD)  # 'if'
         condition = self.parse_expression()
         
-        self.expect(TokenType.LBRACE)
-        then_body = []
-        while self.current_token() and self.current_token().type != TokenType.RBRACE:
-            if self.current_token().type == TokenType.NEWLINE:
-                self.advance()
-                continue
-            then_body.append(self.parse_statement())
-        self.expect(TokenType.RBRACE)
+        then_body = self._parse_block()
         
         else_body = None
-        if self.current_token() and self.current_token().type == TokenType.KEYWORD and self.current_token().value == 'else':
+        if self.current_token() and self.current_token().type == TokenType.KEYWORD and self.current_token().value is _ELSE:
             self.advance()
-            self.expect(TokenType.LBRACE)
-            else_body = []
-            while self.current_token() and self.current_token().type != TokenType.RBRACE:
-                if self.current_token().type == TokenType.NEWLINE:
-                    self.advance()
-                    continue
-                else_body.append(self.parse_statement())
-            self.expect(TokenType.RBRACE)
+            else_body = self._parse_block()
         
         return IfNode(condition, then_body, else_body)
     
@@ -152,14 +200,7 @@ class Parser:
         self.expect(TokenType.KEYWORD)  # 'while'
         condition = self.parse_expression()
         
-        self.expect(TokenType.LBRACE)
-        body = []
-        while self.current_token() and self.current_token().type != TokenType.RBRACE:
-            if self.current_token().type == TokenType.NEWLINE:
-                self.advance()
-                continue
-            body.append(self.parse_statement())
-        self.expect(TokenType.RBRACE)
+        body = self._parse_block()
         
         return WhileNode(condition, body)
     
@@ -171,14 +212,7 @@ class Parser:
         self.expect(TokenType.KEYWORD)  # 'in'
         iterable = self.parse_expression()
         
-        self.expect(TokenType.LBRACE)
-        body = []
-        while self.current_token() and self.current_token().type != TokenType.RBRACE:
-            if self.current_token().type == TokenType.NEWLINE:
-                self.advance()
-                continue
-            body.append(self.parse_statement())
-        self.expect(TokenType.RBRACE)
+        body = self._parse_block()
         
         return ForNode(var_name, iterable, body)
     
@@ -196,14 +230,7 @@ class Parser:
                 self.advance()
         self.expect(TokenType.RPAREN)
         
-        self.expect(TokenType.LBRACE)
-        body = []
-        while self.current_token() and self.current_token().type != TokenType.RBRACE:
-            if self.current_token().type == TokenType.NEWLINE:
-                self.advance()
-                continue
-            body.append(self.parse_statement())
-        self.expect(TokenType.RBRACE)
+        body = self._parse_block()
         
         return FunctionNode(name, params, body)
     
@@ -213,7 +240,7 @@ class Parser:
         name = name_token.value
         
         parent = None
-        if self.current_token() and self.current_token().type == TokenType.KEYWORD and self.current_token().value == 'extends':
+        if self.current_token() and self.current_token().type == TokenType.KEYWORD and self.current_token().value is _EXTENDS:
             self.advance()
             parent_token = self.expect(TokenType.IDENTIFIER)
             parent = parent_token.value
@@ -224,7 +251,7 @@ class Parser:
             if self.current_token().type == TokenType.NEWLINE:
                 self.advance()
                 continue
-            if self.current_token().type == TokenType.KEYWORD and self.current_token().value == 'function':
+            if self.current_token().type == TokenType.KEYWORD and self.current_token().value is _FUNCTION:
                 methods.append(self.parse_function_declaration())
         self.expect(TokenType.RBRACE)
         
@@ -294,14 +321,7 @@ class Parser:
         path_token = self.expect(TokenType.STRING)
         path = path_token.value
         
-        self.expect(TokenType.LBRACE)
-        body = []
-        while self.current_token() and self.current_token().type != TokenType.RBRACE:
-            if self.current_token().type == TokenType.NEWLINE:
-                self.advance()
-                continue
-            body.append(self.parse_statement())
-        self.expect(TokenType.RBRACE)
+        body = self._parse_block()
         
         return RouteNode(path, body)
     
@@ -311,7 +331,7 @@ class Parser:
     def parse_logical_or(self):
         left = self.parse_logical_and()
         
-        while self.current_token() and self.current_token().type == TokenType.KEYWORD and self.current_token().value == 'or':
+        while self.current_token() and self.current_token().type == TokenType.KEYWORD and self.current_token().value is _OR:
             self.advance()
             right = self.parse_logical_and()
             left = BinaryOpNode('or', left, right)
@@ -321,7 +341,7 @@ class Parser:
     def parse_logical_and(self):
         left = self.parse_equality()
         
-        while self.current_token() and self.current_token().type == TokenType.KEYWORD and self.current_token().value == 'and':
+        while self.current_token() and self.current_token().type == TokenType.KEYWORD and self.current_token().value is _AND:
             self.advance()
             right = self.parse_equality()
             left = BinaryOpNode('and', left, right)
@@ -331,8 +351,11 @@ class Parser:
     def parse_equality(self):
         left = self.parse_comparison()
         
-        while self.current_token() and self.current_token().type in (TokenType.EQUAL, TokenType.NOT_EQUAL):
-            op = self.current_token().value
+        while True:
+            token = self.current_token()
+            op = _EQUALITY_OPS.get(token.type) if token else None
+            if op is None:
+                break
             self.advance()
             right = self.parse_comparison()
             left = BinaryOpNode(op, left, right)
@@ -342,8 +365,11 @@ class Parser:
     def parse_comparison(self):
         left = self.parse_addition()
         
-        while self.current_token() and self.current_token().type in (TokenType.LESS_THAN, TokenType.GREATER_THAN, TokenType.LESS_EQUAL, TokenType.GREATER_EQUAL):
-            op = self.current_token().value
+        while True:
+            token = self.current_token()
+            op = _COMPARISON_OPS.get(token.type) if token else None
+            if op is None:
+                break
             self.advance()
             right = self.parse_addition()
             left = BinaryOpNode(op, left, right)
@@ -353,8 +379,11 @@ class Parser:
     def parse_addition(self):
         left = self.parse_multiplication()
         
-        while self.current_token() and self.current_token().type in (TokenType.PLUS, TokenType.MINUS):
-            op = self.current_token().value
+        while True:
+            token = self.current_token()
+            op = _ADDITIVE_OPS.get(token.type) if token else None
+            if op is None:
+                break
             self.advance()
             right = self.parse_multiplication()
             left = BinaryOpNode(op, left, right)
@@ -364,8 +393,11 @@ class Parser:
     def parse_multiplication(self):
         left = self.parse_power()
         
-        while self.current_token() and self.current_token().type in (TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULO):
-            op = self.current_token().value
+        while True:
+            token = self.current_token()
+            op = _MULTIPLICATIVE_OPS.get(token.type) if token else None
+            if op is None:
+                break
             self.advance()
             right = self.parse_power()
             left = BinaryOpNode(op, left, right)
@@ -388,7 +420,7 @@ class Parser:
             expr = self.parse_unary()
             return UnaryOpNode('-', expr)
         
-        if self.current_token() and self.current_token().type == TokenType.KEYWORD and self.current_token().value == 'not':
+        if self.current_token() and self.current_token().type == TokenType.KEYWORD and self.current_token().value is _NOT:
             self.advance()
             expr = self.parse_unary()
             return UnaryOpNode('not', expr)
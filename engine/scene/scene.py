@@ -16,6 +16,7 @@ class Entity:
         self.children: List['Entity'] = []
         self.components: Dict[str, Any] = {}
         self.active = True
+        self._scene_idx = -1  # Index in Scene.entities, -1 when not in a scene
     
     def add_child(self, child: 'Entity'):
         """Add child entity"""
@@ -24,9 +25,11 @@ class Entity:
     
     def remove_child(self, child: 'Entity'):
         """Remove child entity"""
-        if child in self.children:
-            child.parent = None
+        try:
             self.children.remove(child)
+        except ValueError:
+            return
+        child.parent = None
     
     def add_component(self, name: str, component: Any):
         """Add component to entity"""
@@ -36,6 +39,10 @@ class Entity:
         """Get component by name"""
         return self.components.get(name)
     
+    def _on_added(self, scene: 'Scene'):
+        """Called by the scene after this entity is added"""
+        pass
+    
     def update(self, delta_time: float):
         """Update entity and children"""
         if not self.active:
@@ -80,6 +87,11 @@ class CameraEntity(Entity):
         super().__init__(name)
         self.camera = Camera()
     
+    def _on_added(self, scene: 'Scene'):
+        """Become the scene camera if none is set"""
+        if not scene.camera:
+            scene.camera = self
+    
     def update(self, delta_time: float):
         """Update camera entity"""
         super().update(delta_time)
@@ -91,6 +103,10 @@ class LightEntity(Entity):
         super().__init__(name)
         self.light = Light(light_type)
     
+    def _on_added(self, scene: 'Scene'):
+        """Register with the scene lights"""
+        scene.lights.append(self)
+    
     def update(self, delta_time: float):
         """Update light entity"""
         super().update(delta_time)
@@ -108,6 +124,7 @@ class Scene:
     
     def add_entity(self, entity: Entity, parent: Entity = None):
         """Add entity to scene"""
+        entity._scene_idx = len(self.entities)
         self.entities.append(entity)
         
         if parent:
@@ -116,18 +133,28 @@ class Scene:
             self.root.add_child(entity)
         
         # Track cameras and lights
-        if isinstance(entity, CameraEntity):
-            if not self.camera:
-                self.camera = entity
-        elif isinstance(entity, LightEntity):
-            self.lights.append(entity)
+        entity._on_added(self)
     
     def remove_entity(self, entity: Entity):
-        """Remove entity from scene"""
-        if entity in self.entities:
-            self.entities.remove(entity)
-            if entity.parent:
-                entity.parent.remove_child(entity)
+        """Remove entity from scene (does not preserve entity order)"""
+        i = entity._scene_idx
+        if i < 0 or i >= len(self.entities) or self.entities[i] is not entity:
+            # The index only tracks the latest add, so an entity that is in
+            # several scenes (or in this one twice) is looked up instead
+            try:
+                i = self.entities.index(entity)
+            except ValueError:
+                return
+        
+        # Swap with the last entity and pop for O(1) removal
+        last = self.entities.pop()
+        if last is not entity:
+            self.entities[i] = last
+            last._scene_idx = i
+        entity._scene_idx = -1
+        
+        if entity.parent:
+            entity.parent.remove_child(entity)
     
     def find_entity(self, name: str) -> Optional[Entity]:
         """Find entity by name"""
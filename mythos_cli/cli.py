@@ -32,6 +32,7 @@ class MythosCLI:
         run_parser = subparsers.add_parser('run', help='Run a Mythos file')
         run_parser.add_argument('file', help='Mythos file to run')
         run_parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+        run_parser.add_argument('--jit', action='store_true', help='Compile numeric loops with Numba (not interruptible)')
         
         # Build command
         build_parser = subparsers.add_parser('build', help='Build a Mythos project')
@@ -68,7 +69,7 @@ class MythosCLI:
             return
         
         if args.command == 'run':
-            self.run_file(args.file, args.debug)
+            self.run_file(args.file, args.debug, args.jit)
         elif args.command == 'build':
             self.build_file(args.file, args.output)
         elif args.command == 'web':
@@ -80,7 +81,7 @@ class MythosCLI:
         elif args.command == 'init':
             self.init_project(args.name, args.type)
     
-    def run_file(self, filename: str, debug: bool = False):
+    def run_file(self, filename: str, debug: bool = False, jit: bool = False):
         """Run a Mythos file"""
         if not os.path.exists(filename):
             print(f"Error: File '{filename}' not found")
@@ -123,7 +124,7 @@ class MythosCLI:
             if debug:
                 print("\nExecuting...")
             
-            vm = VirtualMachine()
+            vm = VirtualMachine(numeric_jit=jit or None)
             vm.execute(bytecode['instructions'], bytecode['constants'])
             
             if debug:
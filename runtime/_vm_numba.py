@@ -0,0 +1,261 @@
+"""
+Mythos Virtual Machine - Numba-compiled numeric fast path (optional, requires numba)
+
+Runs top-level bytecode that only touches numbers: constants, global
+variables, arithmetic, comparisons, logic and jumps. Values are tagged so
+Python's int/float/bool results are reproduced exactly. Anything the kernel
+cannot reproduce bit-for-bit (int64 overflow, division by zero, undefined
+variables, stack underflow) makes it bail out so the VM can rerun the code
+on the normal interpreter loop.
+"""
+from numba import njit
+from compiler.bytecode.compiler import OpCode
+
+# Value tags
+TAG_INT = 0
+TAG_FLOAT = 1
+TAG_BOOL = 2
+
+# Kernel status
+OK = 0
+BAIL = 1
+
+STACK_SIZE = 1024
+
+# Ints beyond this do not convert to float exactly, so mixed int/float
+# comparisons and int true division bail instead of rounding
+_EXACT_FLOAT_INT = 2 ** 53
+# Operands inside this range cannot overflow int64 when multiplied
+_SAFE_MUL = 3037000499
+_INT64_MIN = -2 ** 63
+
+_LOAD_CONST = int(OpCode.LOAD_CONST)
+_LOAD_VAR = int(OpCode.LOAD_VAR)
+_STORE_VAR = int(OpCode.STORE_VAR)
+_POP = int(OpCode.POP)
+_DUP = int(OpCode.DUP)
+_ADD = int(OpCode.ADD)
+_SUB = int(OpCode.SUB)
+_MUL = int(OpCode.MUL)
+_DIV = int(OpCode.DIV)
+_MOD = int(OpCode.MOD)
+_NEG = int(OpCode.NEG)
+_EQ = int(OpCode.EQ)
+_NE = int(OpCode.NE)
+_LT = int(OpCode.LT)
+_GT = int(OpCode.GT)
+_LE = int(OpCode.LE)
+_GE = int(OpCode.GE)
+_AND = int(OpCode.AND)
+_OR = int(OpCode.OR)
+_NOT = int(OpCode.NOT)
+_JUMP = int(OpCode.JUMP)
+_JUMP_IF_FALSE = int(OpCode.JUMP_IF_FALSE)
+_JUMP_IF_TRUE = int(OpCode.JUMP_IF_TRUE)
+
+@njit(cache=True)
+def _truthy(tag, i, f):
+    if tag == TAG_FLOAT:
+        return f != 0.0
+    return i != 0
+
+@njit(cache=True)
+def _compare(op, ta, ia, fa, tb, ib, fb):
+    """Return 0/1 for the comparison, or -1 if it cannot be done exactly"""
+    if ta != TAG_FLOAT and tb != TAG_FLOAT:
+        a = ia
+        b = ib
+        if op == _EQ:
+            return int(a == b)
+        if op == _NE:
+            return int(a != b)
+        if op == _LT:
+            return int(a < b)
+        if op == _GT:
+            return int(a > b)
+        if op == _LE:
+            return int(a <= b)
+        return int(a >= b)
+
+    if ta == TAG_FLOAT:
+        x = fa
+    else:
+        if ia > _EXACT_FLOAT_INT or ia < -_EXACT_FLOAT_INT:
+            return -1
+        x = float(ia)
+    if tb == TAG_FLOAT:
+        y = fb
+    else:
+        if ib > _EXACT_FLOAT_INT or ib < -_EXACT_FLOAT_INT:
+            return -1
+        y = float(ib)
+    if op == _EQ:
+        return int(x == y)
+    if op == _NE:
+        return int(x != y)
+    if op == _LT:
+        return int(x < y)
+    if op == _GT:
+        return int(x > y)
+    if op == _LE:
+        return int(x <= y)
+    return int(x >= y)
+
+@njit(cache=True)
+def execute_numeric(ops, args, const_tags, const_ints, const_floats,
+                    var_tags, var_ints, var_floats, var_defined, var_written,
+                    stack_tags, stack_ints, stack_floats):
+    """Run numeric bytecode; returns (status, stack size)
+
+    Variables are updated in place. On BAIL the caller must discard all
+    outputs and run the bytecode on the interpreter instead.
+    """
+    n = len(ops)
+    sp = 0
+    ip = 0
+    while ip < n:
+        op = ops[ip]
+        arg = args[ip]
+        ip += 1
+
+        if op == _LOAD_CONST or op == _LOAD_VAR:
+            if sp == STACK_SIZE:
+                return BAIL, sp
+            if op == _LOAD_CONST:
+                stack_tags[sp] = const_tags[arg]
+                stack_ints[sp] = const_ints[arg]
+                stack_floats[sp] = const_floats[arg]
+            else:
+                if not var_defined[arg]:
+                    return BAIL, sp
+                stack_tags[sp] = var_tags[arg]
+                stack_ints[sp] = var_ints[arg]
+                stack_floats[sp] = var_floats[arg]
+            sp += 1
+            continue
+
+        if op == _JUMP:
+            ip = arg
+            continue
+
+        if sp == 0:
+            return BAIL, sp
+
+        if op == _STORE_VAR:
+            sp -= 1
+            var_tags[arg] = stack_tags[sp]
+            var_ints[arg] = stack_ints[sp]
+            var_floats[arg] = stack_floats[sp]
+            var_defined[arg] = True
+            var_written[arg] = True
+        elif op == _POP:
+            sp -= 1
+        elif op == _DUP:
+            if sp == STACK_SIZE:
+                return BAIL, sp
+            stack_tags[sp] = stack_tags[sp - 1]
+            stack_ints[sp] = stack_ints[sp - 1]
+            stack_floats[sp] = stack_floats[sp - 1]
+            sp += 1
+        elif op == _JUMP_IF_FALSE or op == _JUMP_IF_TRUE:
+            sp -= 1
+            truth = _truthy(stack_tags[sp], stack_ints[sp], stack_floats[sp])
+            if truth == (op == _JUMP_IF_TRUE):
+                ip = arg
+        elif op == _NOT:
+            top = sp - 1
+            truth = _truthy(stack_tags[top], stack_ints[top], stack_floats[top])
+            stack_tags[top] = TAG_BOOL
+            stack_ints[top] = 0 if truth else 1
+        elif op == _NEG:
+            top = sp - 1
+            if stack_tags[top] == TAG_FLOAT:
+                stack_floats[top] = -stack_floats[top]
+            else:
+                if stack_ints[top] == _INT64_MIN:
+                    return BAIL, sp
+                stack_tags[top] = TAG_INT
+                stack_ints[top] = -stack_ints[top]
+        else:
+            # Binary operators: the left operand is replaced in place
+            if sp < 2:
+                return BAIL, sp
+            sp -= 1
+            left = sp - 1
+            ta = stack_tags[left]
+            ia = stack_ints[left]
+            fa = stack_floats[left]
+            tb = stack_tags[sp]
+            ib = stack_ints[sp]
+            fb = stack_floats[sp]
+
+            if op == _AND or op == _OR:
+                # Python semantics: the result is one of the operands
+                if _truthy(ta, ia, fa) == (op == _OR):
+                    continue
+                stack_tags[left] = tb
+                stack_ints[left] = ib
+                stack_floats[left] = fb
+            elif (op == _EQ or op == _NE or op == _LT or
+                  op == _GT or op == _LE or op == _GE):
+                result = _compare(op, ta, ia, fa, tb, ib, fb)
+                if result < 0:
+                    return BAIL, sp
+                stack_tags[left] = TAG_BOOL
+                stack_ints[left] = result
+            elif op == _DIV:
+                if (tb == TAG_FLOAT and fb == 0.0) or (tb != TAG_FLOAT and ib == 0):
+                    return BAIL, sp
+                if ta != TAG_FLOAT:
+                    if ia > _EXACT_FLOAT_INT or ia < -_EXACT_FLOAT_INT:
+                        return BAIL, sp
+                    fa = float(ia)
+                if tb != TAG_FLOAT:
+                    if ib > _EXACT_FLOAT_INT or ib < -_EXACT_FLOAT_INT:
+                        return BAIL, sp
+                    fb = float(ib)
+                stack_tags[left] = TAG_FLOAT
+                stack_floats[left] = fa / fb
+            elif ta == TAG_FLOAT or tb == TAG_FLOAT:
+                if ta != TAG_FLOAT:
+                    fa = float(ia)
+                if tb != TAG_FLOAT:
+                    fb = float(ib)
+                if op == _ADD:
+                    r = fa + fb
+                elif op == _SUB:
+                    r = fa - fb
+                elif op == _MUL:
+                    r = fa * fb
+                elif op == _MOD:
+                    if fb == 0.0:
+                        return BAIL, sp
+                    r = fa % fb
+                else:
+                    return BAIL, sp
+                stack_tags[left] = TAG_FLOAT
+                stack_floats[left] = r
+            else:
+                if op == _ADD:
+                    ir = ia + ib
+                    if ((ia ^ ir) & (ib ^ ir)) < 0:
+                        return BAIL, sp
+                elif op == _SUB:
+                    ir = ia - ib
+                    if ((ia ^ ib) & (ia ^ ir)) < 0:
+                        return BAIL, sp
+                elif op == _MUL:
+                    if (ia > _SAFE_MUL or ia < -_SAFE_MUL or
+                            ib > _SAFE_MUL or ib < -_SAFE_MUL):
+                        return BAIL, sp
+                    ir = ia * ib
+                elif op == _MOD:
+                    if ib == 0 or ia == _INT64_MIN:
+                        return BAIL, sp
+                    ir = ia % ib
+                else:
+                    return BAIL, sp
+                stack_tags[left] = TAG_INT
+                stack_ints[left] = ir
+
+    return OK, sp
@@ -2,64 +2,152 @@
 Mythos Virtual Machine - Executes bytecode
 """
 from typing import List, Dict, Any, Optional
-from compiler.bytecode.compiler import OpCode, Instruction
+from compiler.bytecode.compiler import OpCode, Instruction, FunctionCode
 import math
+import os
+import numpy as np
+
+# Returned by an opcode handler to make execute return self._return_value
+_RETURN = object()
+# Returned by CALL after pushing a frame; execute switches to its code
+_CALL = object()
+# Value of a local slot that has not been assigned in the current call
+_UNSET = object()
+
+# Opcodes the Numba kernel in runtime._vm_numba can run
+_NUMERIC_OPCODES = frozenset({
+    OpCode.LOAD_CONST, OpCode.LOAD_VAR, OpCode.STORE_VAR, OpCode.POP, OpCode.DUP,
+    OpCode.ADD, OpCode.SUB, OpCode.MUL, OpCode.DIV, OpCode.MOD, OpCode.NEG,
+    OpCode.EQ, OpCode.NE, OpCode.LT, OpCode.GT, OpCode.LE, OpCode.GE,
+    OpCode.AND, OpCode.OR, OpCode.NOT,
+    OpCode.JUMP, OpCode.JUMP_IF_FALSE, OpCode.JUMP_IF_TRUE,
+})
+_JUMP_OPCODES = (OpCode.JUMP, OpCode.JUMP_IF_FALSE, OpCode.JUMP_IF_TRUE)
+
+# Builtins with a dedicated call opcode: opcode -> (global name, function)
+_MATH_BUILTINS = {
+    OpCode.CALL_SQRT: ('sqrt', math.sqrt),
+    OpCode.CALL_SIN: ('sin', math.sin),
+    OpCode.CALL_COS: ('cos', math.cos),
+    OpCode.CALL_TAN: ('tan', math.tan),
+    OpCode.CALL_ABS: ('abs', abs),
+    OpCode.CALL_FLOOR: ('floor', math.floor),
+    OpCode.CALL_CEIL: ('ceil', math.ceil),
+}
+
+# runtime._vm_numba once loaded, False if numba is not installed
+_numeric_kernel = None
+
+def _load_numeric_kernel():
+    """Import the Numba kernel on first use (numba is optional and slow to import)"""
+    global _numeric_kernel
+    if _numeric_kernel is None:
+        try:
+            from runtime import _vm_numba
+            _numeric_kernel = _vm_numba
+        except ImportError:
+            _numeric_kernel = False
+    return _numeric_kernel
 
 class MythosFunction:
-    def __init__(self, name: str, params: List[str], instructions: List[Instruction], constants: List[Any]):
+    __slots__ = ('name', 'params', 'instructions', 'constants', 'local_names', 'slots')
+    
+    def __init__(self, name: str, params: List[str], instructions: List[Instruction], constants: List[Any],
+                 local_names: List[str] = None):
         self.name = name
         self.params = params
         self.instructions = instructions
         self.constants = constants
+        # Local variable names indexed by slot; parameters come first
+        self.local_names = local_names if local_names is not None else list(params)
+        self.slots = {name: i for i, name in enumerate(self.local_names)}
+    
+    @classmethod
+    def from_code(cls, code: FunctionCode) -> 'MythosFunction':
+        """Wrap a compiled function, including the functions among its constants"""
+        return cls(code.name, code.params, code.instructions, _link_constants(code.constants),
+                   code.local_names)
     
     def __repr__(self):
         return f"<function {self.name}>"
 
-class MythosObject:
-    def __init__(self, properties: Dict[str, Any] = None):
-        self.properties = properties or {}
+def _link_constants(constants: List[Any]) -> List[Any]:
+    """Constant pool with FunctionCode entries wrapped as MythosFunction objects
+    
+    Done once per pool when it is loaded, so running a function declaration
+    is a plain LOAD_CONST. Returns the list itself if it holds no functions.
+    """
+    if not any(type(const) is FunctionCode for const in constants):
+        return constants
+    return [MythosFunction.from_code(const) if type(const) is FunctionCode else const
+            for const in constants]
+
+class MythosObject(dict):
+    """Mythos object: a plain dict of properties"""
+    __slots__ = ()
     
-    def get(self, key: str):
-        return self.properties.get(key)
+    @property
+    def properties(self) -> Dict[str, Any]:
+        return self
     
     def set(self, key: str, value: Any):
-        self.properties[key] = value
+        self[key] = value
     
     def __repr__(self):
-        return f"<object {self.properties}>"
+        return f"<object {dict.__repr__(self)}>"
 
 class CallFrame:
+    __slots__ = ('function', 'return_address', 'locals', 'extra_locals', 'instructions', 'constants', 'ip')
+    
     def __init__(self, function: MythosFunction, return_address: int):
         self.function = function
         self.return_address = return_address
-        self.locals: Dict[str, Any] = {}
+        self.locals: List[Any] = [_UNSET] * len(function.local_names)
+        self.extra_locals: Optional[Dict[str, Any]] = None  # Names set without a slot
+        self.instructions = function.instructions
+        self.constants = function.constants
         self.ip = 0  # Instruction pointer
+    
+    def variables(self) -> Dict[str, Any]:
+        """Locals assigned so far, by name"""
+        variables = {name: value for name, value in zip(self.function.local_names, self.locals)
+                     if value is not _UNSET}
+        if self.extra_locals:
+            variables.update(self.extra_locals)
+        return variables
 
 class VirtualMachine:
-    def __init__(self):
+    """Bytecode interpreter
+    
+    numeric_jit opts in to running numeric-only top-level loops on the Numba
+    kernel (defaults to the MYTHOS_NUMERIC_JIT=1 environment variable). It is
+    off by default: compiled loops cannot be interrupted with Ctrl-C, the
+    first run pays the numba import and compile, and a bail-out reruns the
+    whole program on the interpreter.
+    """
+    def __init__(self, numeric_jit: Optional[bool] = None):
+        if numeric_jit is None:
+            numeric_jit = os.environ.get('MYTHOS_NUMERIC_JIT') == '1'
+        self.numeric_jit = numeric_jit
         self.stack: List[Any] = []
         self.globals: Dict[str, Any] = {}
         self.call_stack: List[CallFrame] = []
         self.current_frame: Optional[CallFrame] = None
         self.ip = 0  # Instruction pointer
+        self._return_value: Any = None
         
         # Initialize built-in functions
         self._init_builtins()
+        self._init_dispatch()
     
     def _init_builtins(self):
         """Initialize built-in functions and constants"""
         self.globals['print'] = self._builtin_print
         self.globals['len'] = self._builtin_len
         self.globals['range'] = self._builtin_range
-        self.globals['sqrt'] = lambda x: math.sqrt(x)
-        self.globals['sin'] = lambda x: math.sin(x)
-        self.globals['cos'] = lambda x: math.cos(x)
-        self.globals['tan'] = lambda x: math.tan(x)
-        self.globals['abs'] = lambda x: abs(x)
+        self.globals.update(_MATH_BUILTINS.values())
         self.globals['min'] = lambda *args: min(args)
         self.globals['max'] = lambda *args: max(args)
-        self.globals['floor'] = lambda x: math.floor(x)
-        self.globals['ceil'] = lambda x: math.ceil(x)
         self.globals['round'] = lambda x: round(x)
         self.globals['pi'] = math.pi
         self.globals['e'] = math.e
@@ -69,12 +157,11 @@ class VirtualMachine:
         return None
     
     def _builtin_len(self, obj):
-        if isinstance(obj, (list, str, dict)):
-            return len(obj)
-        return 0
+        return len(obj)
     
     def _builtin_range(self, *args):
-        return list(range(*args))
+        # Lazy: supports len, indexing and iteration without building a list
+        return range(*args)
     
     def push(self, value: Any):
         self.stack.append(value)
@@ -91,8 +178,14 @@ class VirtualMachine:
     
     def get_variable(self, name: str) -> Any:
         # Check local scope first
-        if self.current_frame and name in self.current_frame.locals:
-            return self.current_frame.locals[name]
+        frame = self.current_frame
+        if frame:
+            slot = frame.function.slots.get(name)
+            if slot is not None:
+                if frame.locals[slot] is not _UNSET:
+                    return frame.locals[slot]
+            elif frame.extra_locals and name in frame.extra_locals:
+                return frame.extra_locals[name]
         
         # Then check global scope
         if name in self.globals:
@@ -101,238 +194,471 @@ class VirtualMachine:
         raise NameError(f"Variable '{name}' is not defined")
     
     def set_variable(self, name: str, value: Any):
-        # Set in current frame if exists, otherwise global
-        if self.current_frame:
-            self.current_frame.locals[name] = value
+        # Set in current frame if exists, otherwise global; names the compiler
+        # gave no slot (e.g. STORE_VAR in hand-built bytecode) stay frame-local
+        frame = self.current_frame
+        if frame:
+            slot = frame.function.slots.get(name)
+            if slot is not None:
+                frame.locals[slot] = value
+            elif frame.extra_locals is None:
+                frame.extra_locals = {name: value}
+            else:
+                frame.extra_locals[name] = value
         else:
             self.globals[name] = value
     
+    def _init_dispatch(self):
+        """Build the opcode -> handler table used by execute"""
+        handlers = {
+            OpCode.LOAD_CONST: self._op_load_const,
+            OpCode.LOAD_VAR: self._op_load_var,
+            OpCode.STORE_VAR: self._op_store_var,
+            OpCode.POP: self._op_pop,
+            OpCode.DUP: self._op_dup,
+            OpCode.LOAD_LOCAL: self._op_load_local,
+            OpCode.STORE_LOCAL: self._op_store_local,
+            OpCode.LOAD_GLOBAL: self._op_load_global,
+            OpCode.ADD: self._op_add,
+            OpCode.SUB: self._op_sub,
+            OpCode.MUL: self._op_mul,
+            OpCode.DIV: self._op_div,
+            OpCode.POW: self._op_pow,
+            OpCode.MOD: self._op_mod,
+            OpCode.NEG: self._op_neg,
+            OpCode.EQ: self._op_eq,
+            OpCode.NE: self._op_ne,
+            OpCode.LT: self._op_lt,
+            OpCode.GT: self._op_gt,
+            OpCode.LE: self._op_le,
+            OpCode.GE: self._op_ge,
+            OpCode.AND: self._op_and,
+            OpCode.OR: self._op_or,
+            OpCode.NOT: self._op_not,
+            OpCode.JUMP: self._op_jump,
+            OpCode.JUMP_IF_FALSE: self._op_jump_if_false,
+            OpCode.JUMP_IF_TRUE: self._op_jump_if_true,
+            OpCode.CALL: self._op_call,
+            OpCode.RETURN: self._op_return,
+            OpCode.MAKE_FUNCTION: self._op_make_function,
+            OpCode.MAKE_ARRAY: self._op_make_array,
+            OpCode.MAKE_OBJECT: self._op_make_object,
+            OpCode.GET_MEMBER: self._op_get_member,
+            OpCode.GET_INDEX: self._op_get_index,
+        }
+        for opcode, (name, func) in _MATH_BUILTINS.items():
+            handlers[opcode] = self._make_math_handler(name, func)
+        # List indexed by opcode value; opcodes without a handler are no-ops
+        self._dispatch_fast = [self._op_nop] * (max(OpCode) + 1)
+        for opcode, handler in handlers.items():
+            self._dispatch_fast[opcode] = handler
+        # Tools such as the profiler swap in an instrumented table
+        self._dispatch = self._dispatch_fast
+    
+    def _make_math_handler(self, name: str, func):
+        """Handler calling func on the top of the stack while globals[name] is func"""
+        def handler(arg, constants):
+            stack = self.stack
+            if self.globals.get(name) is func:
+                stack[-1] = func(stack[-1])
+                return None
+            # Reassigned by code compiled separately (e.g. an earlier REPL line)
+            stack.insert(len(stack) - 1, self.get_variable(name))
+            return self._op_call(1, constants)
+        return handler
+    
     def execute(self, instructions: List[Instruction], constants: List[Any]):
         """Execute bytecode instructions"""
-        self.ip = 0
+        # Mythos calls run in this same loop: CALL pushes a CallFrame and
+        # the loop switches to its code, RETURN pops back to the caller
+        base_depth = len(self.call_stack)
+        constants = _link_constants(constants)
+        if (self.numeric_jit and base_depth == 0 and self.current_frame is None
+                and self._dispatch is self._dispatch_fast):
+            if self._execute_numeric(instructions, constants):
+                return None
+        base_instructions, base_constants = instructions, constants
+        dispatch = self._dispatch
+        # The instruction pointer lives in a local; self.ip is only updated
+        # when execution leaves this loop
+        ip = 0
         
-        while self.ip < len(instructions):
-            instr = instructions[self.ip]
-            opcode = instr.opcode
-            arg = instr.arg
-            
-            # Stack operations
-            if opcode == OpCode.LOAD_CONST:
-                self.push(constants[arg])
-            
-            elif opcode == OpCode.LOAD_VAR:
-                value = self.get_variable(arg)
-                self.push(value)
-            
-            elif opcode == OpCode.STORE_VAR:
-                value = self.pop()
-                self.set_variable(arg, value)
-                # Don't push back - assignments don't return values
-            
-            elif opcode == OpCode.POP:
-                self.pop()
-            
-            elif opcode == OpCode.DUP:
-                self.push(self.peek())
-            
-            # Arithmetic operations
-            elif opcode == OpCode.ADD:
-                right = self.pop()
-                left = self.pop()
-                self.push(left + right)
-            
-            elif opcode == OpCode.SUB:
-                right = self.pop()
-                left = self.pop()
-                self.push(left - right)
-            
-            elif opcode == OpCode.MUL:
-                right = self.pop()
-                left = self.pop()
-                self.push(left * right)
-            
-            elif opcode == OpCode.DIV:
-                right = self.pop()
-                left = self.pop()
-                if right == 0:
-                    raise ZeroDivisionError("Division by zero")
-                self.push(left / right)
-            
-            elif opcode == OpCode.POW:
-                right = self.pop()
-                left = self.pop()
-                self.push(left ** right)
-            
-            elif opcode == OpCode.MOD:
-                right = self.pop()
-                left = self.pop()
-                self.push(left % right)
-            
-            elif opcode == OpCode.NEG:
-                value = self.pop()
-                self.push(-value)
-            
-            # Comparison operations
-            elif opcode == OpCode.EQ:
-                right = self.pop()
-                left = self.pop()
-                self.push(left == right)
-            
-            elif opcode == OpCode.NE:
-                right = self.pop()
-                left = self.pop()
-                self.push(left != right)
-            
-            elif opcode == OpCode.LT:
-                right = self.pop()
-                left = self.pop()
-                self.push(left < right)
-            
-            elif opcode == OpCode.GT:
-                right = self.pop()
-                left = self.pop()
-                self.push(left > right)
-            
-            elif opcode == OpCode.LE:
-                right = self.pop()
-                left = self.pop()
-                self.push(left <= right)
-            
-            elif opcode == OpCode.GE:
-                right = self.pop()
-                left = self.pop()
-                self.push(left >= right)
-            
-            # Logical operations
-            elif opcode == OpCode.AND:
-                right = self.pop()
-                left = self.pop()
-                self.push(left and right)
-            
-            elif opcode == OpCode.OR:
-                right = self.pop()
-                left = self.pop()
-                self.push(left or right)
-            
-            elif opcode == OpCode.NOT:
-                value = self.pop()
-                self.push(not value)
-            
-            # Control flow
-            elif opcode == OpCode.JUMP:
-                self.ip = arg
-                continue
-            
-            elif opcode == OpCode.JUMP_IF_FALSE:
-                condition = self.pop()
-                if not condition:
-                    self.ip = arg
-                    continue
-            
-            elif opcode == OpCode.JUMP_IF_TRUE:
-                condition = self.pop()
-                if condition:
-                    self.ip = arg
-                    continue
-            
-            # Function operations
-            elif opcode == OpCode.CALL:
-                arg_count = arg
-                args = [self.pop() for _ in range(arg_count)]
-                args.reverse()
-                
-                callee = self.pop()
+        try:
+            while True:
+                if ip < len(instructions):
+                    opcode, arg = instructions[ip]
+                    
+                    # Handlers return None to fall through to the next instruction,
+                    # a new instruction pointer to jump, _CALL to enter a function
+                    # or _RETURN to leave the current one
+                    next_ip = dispatch[opcode](arg, constants)
+                    if next_ip is None:
+                        ip += 1
+                        continue
+                    if next_ip is _CALL:
+                        frame = self.current_frame
+                        frame.return_address = ip + 1
+                        instructions, constants = frame.instructions, frame.constants
+                        ip = 0
+                        continue
+                    if next_ip is not _RETURN:
+                        ip = next_ip
+                        continue
+                    value = self._return_value
+                else:
+                    # Ran off the end of the code without a RETURN
+                    value = None
                 
-                # Handle built-in functions
-                if callable(callee) and not isinstance(callee, MythosFunction):
-                    result = callee(*args)
-                    # Only push result if it's not None (print returns None)
-                    # This prevents stack buildup
+                if len(self.call_stack) == base_depth:
+                    return value
                 
-                # Handle Mythos functions
-                elif isinstance(callee, MythosFunction):
-                    # Create new call frame
-                    frame = CallFrame(callee, self.ip + 1)
-                    
-                    # Bind parameters
-                    for i, param in enumerate(callee.params):
-                        if i < len(args):
-                            frame.locals[param] = args[i]
-                        else:
-                            frame.locals[param] = None
-                    
-                    # Push frame and execute
-                    self.call_stack.append(frame)
-                    old_frame = self.current_frame
-                    self.current_frame = frame
-                    
-                    # Execute function
-                    result = self.execute(callee.instructions, callee.constants)
-                    
-                    # Restore frame
-                    self.call_stack.pop()
-                    self.current_frame = old_frame
-                    
-                    self.push(result if result is not None else None)
-                    self.ip = frame.return_address
+                # Pop the finished frame and resume the caller
+                frame = self.call_stack.pop()
+                self.stack.append(value)
+                self.current_frame = self.call_stack[-1] if self.call_stack else None
+                if len(self.call_stack) > base_depth:
+                    caller = self.call_stack[-1]
+                    instructions, constants = caller.instructions, caller.constants
+                else:
+                    instructions, constants = base_instructions, base_constants
+                ip = frame.return_address
+        finally:
+            self.ip = ip
+    
+    def _execute_numeric(self, instructions: List[Instruction], constants: List[Any]) -> bool:
+        """Run numeric-only top-level code on the Numba kernel
+        
+        Used only when numeric_jit is enabled. Only code with a loop is worth
+        compiling. Returns False, leaving the
+        VM untouched, when the code is not eligible, numba is missing or the
+        kernel bails out.
+        """
+        has_loop = False
+        for i, (opcode, arg) in enumerate(instructions):
+            if opcode not in _NUMERIC_OPCODES:
+                return False
+            if opcode in _JUMP_OPCODES:
+                if type(arg) is not int:
+                    return False
+                if arg <= i:
+                    has_loop = True
+        if not has_loop:
+            return False
+        
+        kernel = _load_numeric_kernel()
+        if not kernel:
+            return False
+        
+        def tag_of(value):
+            kind = type(value)
+            if kind is bool:
+                return kernel.TAG_BOOL
+            if kind is int:
+                return kernel.TAG_INT if -2 ** 63 <= value < 2 ** 63 else None
+            if kind is float:
+                return kernel.TAG_FLOAT
+            return None
+        
+        # Encode operands: constants and variables become compact indices
+        n = len(instructions)
+        ops = np.empty(n, dtype=np.int64)
+        args = np.zeros(n, dtype=np.int64)
+        const_index: Dict[int, int] = {}
+        const_values: List[Any] = []
+        slots: Dict[str, int] = {}
+        for i, (opcode, arg) in enumerate(instructions):
+            ops[i] = opcode
+            if opcode == OpCode.LOAD_CONST:
+                if arg not in const_index:
+                    value = constants[arg]
+                    if tag_of(value) is None:
+                        return False
+                    const_index[arg] = len(const_values)
+                    const_values.append(value)
+                args[i] = const_index[arg]
+            elif opcode == OpCode.LOAD_VAR or opcode == OpCode.STORE_VAR:
+                args[i] = slots.setdefault(arg, len(slots))
+            elif opcode in _JUMP_OPCODES:
+                args[i] = arg
+        
+        def pack(values):
+            count = len(values)
+            tags = np.zeros(count, dtype=np.int64)
+            ints = np.zeros(count, dtype=np.int64)
+            floats = np.zeros(count, dtype=np.float64)
+            defined = np.zeros(count, dtype=np.bool_)
+            for k, value in enumerate(values):
+                tag = tag_of(value)
+                if tag is None:
                     continue
-            
-            elif opcode == OpCode.RETURN:
-                value = self.pop()
-                return value
-            
-            elif opcode == OpCode.MAKE_FUNCTION:
-                func_data = constants[arg]
-                func = MythosFunction(
-                    func_data['name'],
-                    func_data['params'],
-                    func_data['instructions'],
-                    func_data['constants']
-                )
-                self.push(func)
-            
-            # Object operations
-            elif opcode == OpCode.MAKE_ARRAY:
-                count = arg
-                elements = [self.pop() for _ in range(count)]
-                elements.reverse()
-                self.push(elements)
-            
-            elif opcode == OpCode.MAKE_OBJECT:
-                count = arg
-                obj = MythosObject()
-                for _ in range(count):
-                    value = self.pop()
-                    key = self.pop()
-                    obj.set(key, value)
-                self.push(obj)
-            
-            elif opcode == OpCode.GET_MEMBER:
-                member_name = constants[arg]
-                obj = self.pop()
-                
-                if isinstance(obj, MythosObject):
-                    self.push(obj.get(member_name))
-                elif isinstance(obj, dict):
-                    self.push(obj.get(member_name))
+                tags[k] = tag
+                defined[k] = True
+                if tag == kernel.TAG_FLOAT:
+                    floats[k] = value
                 else:
-                    raise AttributeError(f"Object has no member '{member_name}'")
-            
-            elif opcode == OpCode.GET_INDEX:
-                index = self.pop()
-                obj = self.pop()
-                
-                if isinstance(obj, (list, str, dict)):
-                    self.push(obj[index])
+                    ints[k] = value
+            return tags, ints, floats, defined
+        
+        def unpack(tag, i, f):
+            if tag == kernel.TAG_FLOAT:
+                return float(f)
+            if tag == kernel.TAG_BOOL:
+                return bool(i)
+            return int(i)
+        
+        const_tags, const_ints, const_floats, _ = pack(const_values)
+        # Globals that are missing or not numbers start undefined
+        names = list(slots)
+        var_tags, var_ints, var_floats, var_defined = pack(
+            [self.globals.get(name) for name in names])
+        var_written = np.zeros(len(names), dtype=np.bool_)
+        stack_tags = np.empty(kernel.STACK_SIZE, dtype=np.int64)
+        stack_ints = np.empty(kernel.STACK_SIZE, dtype=np.int64)
+        stack_floats = np.empty(kernel.STACK_SIZE, dtype=np.float64)
+        
+        status, sp = kernel.execute_numeric(
+            ops, args, const_tags, const_ints, const_floats,
+            var_tags, var_ints, var_floats, var_defined, var_written,
+            stack_tags, stack_ints, stack_floats)
+        if status != kernel.OK:
+            return False
+        
+        for k, name in enumerate(names):
+            if var_written[k]:
+                self.globals[name] = unpack(var_tags[k], var_ints[k], var_floats[k])
+        for k in range(sp):
+            self.stack.append(unpack(stack_tags[k], stack_ints[k], stack_floats[k]))
+        self.ip = n
+        return True
+    
+    # Handlers work on self.stack directly rather than through push/pop:
+    # compiled bytecode never underflows, so the emptiness checks are skipped
+    
+    # Stack operations
+    def _op_nop(self, arg, constants):
+        pass
+    
+    def _op_load_const(self, arg, constants):
+        self.stack.append(constants[arg])
+    
+    def _op_load_var(self, arg, constants):
+        self.stack.append(self.get_variable(arg))
+    
+    def _op_store_var(self, arg, constants):
+        # Don't push back - assignments don't return values
+        self.set_variable(arg, self.stack.pop())
+    
+    def _op_pop(self, arg, constants):
+        self.stack.pop()
+    
+    def _op_dup(self, arg, constants):
+        stack = self.stack
+        stack.append(stack[-1])
+    
+    def _op_load_local(self, arg, constants):
+        frame = self.current_frame
+        value = frame.locals[arg]
+        if value is _UNSET:
+            # Not assigned yet in this call: the name resolves globally
+            value = self.get_variable(frame.function.local_names[arg])
+        self.stack.append(value)
+    
+    def _op_store_local(self, arg, constants):
+        self.current_frame.locals[arg] = self.stack.pop()
+    
+    def _op_load_global(self, arg, constants):
+        value = self.globals.get(arg, _UNSET)
+        if value is _UNSET:
+            raise NameError(f"Variable '{arg}' is not defined")
+        self.stack.append(value)
+    
+    # Arithmetic operations (the left operand is replaced in place)
+    def _op_add(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] + right
+    
+    def _op_sub(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] - right
+    
+    def _op_mul(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] * right
+    
+    def _op_div(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        if right == 0:
+            raise ZeroDivisionError("Division by zero")
+        stack[-1] = stack[-1] / right
+    
+    def _op_pow(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] ** right
+    
+    def _op_mod(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] % right
+    
+    def _op_neg(self, arg, constants):
+        stack = self.stack
+        stack[-1] = -stack[-1]
+    
+    # Comparison operations
+    def _op_eq(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] == right
+    
+    def _op_ne(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] != right
+    
+    def _op_lt(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] < right
+    
+    def _op_gt(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] > right
+    
+    def _op_le(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] <= right
+    
+    def _op_ge(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] >= right
+    
+    # Logical operations
+    def _op_and(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] and right
+    
+    def _op_or(self, arg, constants):
+        stack = self.stack
+        right = stack.pop()
+        stack[-1] = stack[-1] or right
+    
+    def _op_not(self, arg, constants):
+        stack = self.stack
+        stack[-1] = not stack[-1]
+    
+    # Control flow
+    def _op_jump(self, arg, constants):
+        return arg
+    
+    def _op_jump_if_false(self, arg, constants):
+        if not self.stack.pop():
+            return arg
+    
+    def _op_jump_if_true(self, arg, constants):
+        if self.stack.pop():
+            return arg
+    
+    # Function operations
+    def _op_call(self, arg, constants):
+        stack = self.stack
+        arg_count = arg
+        if arg_count:
+            args = stack[-arg_count:]
+            del stack[-arg_count:]
+        else:
+            args = []
+        
+        callee = stack.pop()
+        
+        # Handle built-in functions; expression statements pop the result
+        if callable(callee) and not isinstance(callee, MythosFunction):
+            stack.append(callee(*args))
+        
+        # Handle Mythos functions
+        elif isinstance(callee, MythosFunction):
+            # Create new call frame
+            frame = CallFrame(callee, -1)  # execute sets the return address
+            
+            # Bind parameters to the first slots
+            for i in range(len(callee.params)):
+                if i < len(args):
+                    frame.locals[i] = args[i]
                 else:
-                    raise TypeError("Object is not indexable")
+                    frame.locals[i] = None
             
-            # Import
-            elif opcode == OpCode.IMPORT:
-                module_name = constants[arg]
-                # Import logic would go here
-                pass
-            
-            self.ip += 1
+            # Push frame; execute continues in the function's code
+            self.call_stack.append(frame)
+            self.current_frame = frame
+            return _CALL
         
-        return None
+        else:
+            raise TypeError(f"{callee!r} is not callable")
+    
+    def _op_return(self, arg, constants):
+        self._return_value = self.stack.pop()
+        return _RETURN
+    
+    def _op_make_function(self, arg, constants):
+        # The compiler now emits prebuilt functions as constants; this
+        # handles bytecode that still carries function data dicts
+        func_data = constants[arg]
+        func = MythosFunction(
+            func_data['name'],
+            func_data['params'],
+            func_data['instructions'],
+            func_data['constants'],
+            func_data.get('locals')
+        )
+        self.stack.append(func)
+    
+    # Object operations
+    def _op_make_array(self, arg, constants):
+        stack = self.stack
+        count = arg
+        if count:
+            elements = stack[-count:]
+            del stack[-count:]
+        else:
+            elements = []
+        stack.append(elements)
+    
+    def _op_make_object(self, arg, constants):
+        stack = self.stack
+        count = arg * 2
+        if count:
+            items = stack[-count:]
+            del stack[-count:]
+        else:
+            items = []
+        # Items alternate key, value in source order
+        stack.append(MythosObject(zip(items[0::2], items[1::2])))
+    
+    def _op_get_member(self, arg, constants):
+        stack = self.stack
+        member_name = constants[arg]
+        obj = stack.pop()
+        
+        # Mythos objects are dicts
+        if isinstance(obj, dict):
+            stack.append(obj.get(member_name))
+        else:
+            raise AttributeError(f"Object has no member '{member_name}'")
+    
+    def _op_get_index(self, arg, constants):
+        stack = self.stack
+        index = stack.pop()
+        obj = stack.pop()
+        
+        if isinstance(obj, (list, str, dict, range)):
+            stack.append(obj[index])
+        else:
+            raise TypeError("Object is not indexable")
@@ -1,11 +1,22 @@
 """
 Mythos Programming Language Setup
 """
+import os
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optionally compile the lexer and parser to C extensions with mypyc.
+# Opt in with MYTHOS_MYPYC=1; the pure-Python wheel is built otherwise.
+ext_modules = []
+if os.environ.get("MYTHOS_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        "compiler/lexer/lexer.py",
+        "compiler/parser/parser.py",
+    ])
+
 setup(
     name="mythos-lang",
     version="1.0.0",
@@ -15,7 +26,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/mythos-lang/mythos",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -38,10 +49,14 @@ setup(
             "pytest-cov>=2.0",
             "black>=21.0",
             "flake8>=3.9",
+            "mypy>=1.0",
         ],
         "web": [
             "aiohttp>=3.8",
         ],
+        "jit": [
+            "numba>=0.56",
+        ],
         "graphics": [
             "pygame>=2.0",
             "PyOpenGL>=3.1",
@@ -52,6 +67,7 @@ setup(
             "mythos=mythos_cli.cli:main",
         ],
     },
+    ext_modules=ext_modules,
     include_package_data=True,
     zip_safe=False,
 )
@@ -0,0 +1,136 @@
+"""
+Mythos AI - Numba-compiled A* kernel (optional, requires numba)
+"""
+import math
+import numpy as np
+from numba import njit
+
+DIAGONAL_COST = 1.414  # Must match astar's diagonal move cost
+
+@njit(cache=True)
+def _heuristic(kind, x, y, gx, gy):
+    dx = abs(x - gx)
+    dy = abs(y - gy)
+    if kind == 0:  # Manhattan
+        return float(dx + dy)
+    if kind == 1:  # Euclidean
+        return math.sqrt(dx * dx + dy * dy)
+    if kind == 2:  # Diagonal (Chebyshev)
+        return float(max(dx, dy))
+    if kind == 4:  # Octile
+        return max(dx, dy) + (DIAGONAL_COST - 1.0) * min(dx, dy)
+    return 0.0
+
+@njit(cache=True)
+def _sift_up(heap_f, heap_idx, pos):
+    f = heap_f[pos]
+    idx = heap_idx[pos]
+    while pos > 0:
+        up = (pos - 1) >> 1
+        if heap_f[up] <= f:
+            break
+        heap_f[pos] = heap_f[up]
+        heap_idx[pos] = heap_idx[up]
+        pos = up
+    heap_f[pos] = f
+    heap_idx[pos] = idx
+
+@njit(cache=True)
+def _sift_down(heap_f, heap_idx, size):
+    f = heap_f[0]
+    idx = heap_idx[0]
+    pos = 0
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap_f[child + 1] < heap_f[child]:
+            child += 1
+        if heap_f[child] >= f:
+            break
+        heap_f[pos] = heap_f[child]
+        heap_idx[pos] = heap_idx[child]
+        pos = child
+    heap_f[pos] = f
+    heap_idx[pos] = idx
+
+@njit(cache=True)
+def astar_flat(walk, weights, sx, sy, gx, gy, diagonal, heuristic_kind):
+    """
+    A* over a (height, width) walkability array
+    Returns flat cell indices (y * width + x) from start to goal, empty if unreachable
+    """
+    height, width = walk.shape
+    n = width * height
+    g_cost = np.full(n, np.inf)
+    parent = np.full(n, -1, dtype=np.int32)
+    closed = np.zeros(n, dtype=np.uint8)
+    
+    dxs = np.array([0, 1, 0, -1, 1, 1, -1, -1])
+    dys = np.array([1, 0, -1, 0, 1, -1, 1, -1])
+    num_dirs = 8 if diagonal else 4
+    
+    # Binary heap of (f, index) with lazy deletion of stale entries
+    capacity = max(16, n)
+    heap_f = np.empty(capacity, dtype=np.float64)
+    heap_idx = np.empty(capacity, dtype=np.int32)
+    start = sy * width + sx
+    goal = gy * width + gx
+    g_cost[start] = 0.0
+    heap_f[0] = _heuristic(heuristic_kind, sx, sy, gx, gy)
+    heap_idx[0] = start
+    size = 1
+    
+    while size > 0:
+        current = heap_idx[0]
+        size -= 1
+        if size > 0:
+            heap_f[0] = heap_f[size]
+            heap_idx[0] = heap_idx[size]
+            _sift_down(heap_f, heap_idx, size)
+        
+        if closed[current]:
+            continue
+        
+        if current == goal:
+            length = 1
+            node = current
+            while node != start:
+                node = parent[node]
+                length += 1
+            path = np.empty(length, dtype=np.int32)
+            node = current
+            for i in range(length - 1, -1, -1):
+                path[i] = node
+                node = parent[node]
+            return path
+        
+        closed[current] = 1
+        cx = current % width
+        cy = current // width
+        
+        for d in range(num_dirs):
+            nx = cx + dxs[d]
+            ny = cy + dys[d]
+            if nx < 0 or nx >= width or ny < 0 or ny >= height or walk[ny, nx] == 0:
+                continue
+            neighbor = ny * width + nx
+            if closed[neighbor]:
+                continue
+            
+            move_cost = DIAGONAL_COST if d >= 4 else 1.0
+            tentative_g = g_cost[current] + move_cost * weights[ny, nx]
+            if tentative_g < g_cost[neighbor]:
+                g_cost[neighbor] = tentative_g
+                parent[neighbor] = current
+                
+                if size == capacity:
+                    capacity *= 2
+                    heap_f = np.concatenate((heap_f, np.empty(capacity - size, dtype=np.float64)))
+                    heap_idx = np.concatenate((heap_idx, np.empty(capacity - size, dtype=np.int32)))
+                heap_f[size] = tentative_g + _heuristic(heuristic_kind, nx, ny, gx, gy)
+                heap_idx[size] = neighbor
+                _sift_up(heap_f, heap_idx, size)
+                size += 1
+    
+    return np.empty(0, dtype=np.int32)
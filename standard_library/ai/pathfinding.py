@@ -1,18 +1,38 @@
 """
 Mythos AI - Pathfinding algorithms
 """
-from typing import List, Tuple, Set, Dict, Optional, Callable
-from dataclasses import dataclass
+from typing import List, Tuple, Set, FrozenSet, Dict, Mapping, Optional, Callable
 import heapq
+import itertools
+from array import array
+from collections import deque
+from types import MappingProxyType
+from math import sqrt
+import numpy as np
 from standard_library.math.core import Vector2, Vector3
 
-@dataclass
+try:
+    from standard_library.ai._pathfinding_numba import astar_flat as _astar_flat
+except ImportError:  # numba is optional
+    _astar_flat = None
+
+# Neighbor offsets as (dx, dy, move_cost)
+_CARDINAL = ((0, 1, 1.0), (1, 0, 1.0), (0, -1, 1.0), (-1, 0, 1.0))
+_DIAG8 = _CARDINAL + ((1, 1, 1.414), (1, -1, 1.414), (-1, 1, 1.414), (-1, -1, 1.414))
+
 class Node:
     """Node in a pathfinding graph"""
-    position: Tuple[int, int]
-    g_cost: float = float('inf')  # Cost from start
-    h_cost: float = 0  # Heuristic cost to goal
-    parent: Optional['Node'] = None
+    __slots__ = ('position', 'g_cost', 'h_cost', 'parent')
+    
+    def __init__(self, position: Tuple[int, int], g_cost: float = float('inf'),
+                 h_cost: float = 0, parent: Optional['Node'] = None):
+        self.position = position
+        self.g_cost = g_cost  # Cost from start
+        self.h_cost = h_cost  # Heuristic cost to goal
+        self.parent = parent
+    
+    def __repr__(self):
+        return f"Node(position={self.position!r}, g_cost={self.g_cost!r}, h_cost={self.h_cost!r})"
     
     @property
     def f_cost(self) -> float:
@@ -33,45 +53,95 @@ class Grid:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.obstacles: Set[Tuple[int, int]] = set()
-        self.weights: Dict[Tuple[int, int], float] = {}
+        # Walkability bitmap, one byte per cell at index y * width + x (1 = walkable)
+        self._walk = bytearray(b'\x01') * (width * height)
+        # Blocked cells as bitmasks per row (bit x) and per column (bit y), with a
+        # sentinel bit set just past the edge so scans always find a stop
+        self._row_blocked = [1 << width] * height
+        self._col_blocked = [1 << height] * width
+        # Cell weights other than 1.0; exposed read-only so edits go through set_weight
+        self._weights: Dict[Tuple[int, int], float] = {}
+        self._weights_view = MappingProxyType(self._weights)
+        # Bumped on every mutation; find_path results are cached per version
+        self._version = 0
+        self._path_cache: Dict[tuple, Optional[Tuple[Tuple[int, int], ...]]] = {}
+    
+    def _changed(self):
+        """Record a mutation and drop cached paths"""
+        self._version += 1
+        invalidate_path_cache(self)
+    
+    @property
+    def obstacles(self) -> FrozenSet[Tuple[int, int]]:
+        """Snapshot of blocked positions (use add_obstacle/remove_obstacle to edit)"""
+        width, walk = self.width, self._walk
+        return frozenset((i % width, i // width) for i in range(len(walk)) if not walk[i])
+    
+    @property
+    def weights(self) -> Mapping[Tuple[int, int], float]:
+        """Read-only view of cell weights (use set_weight to edit)"""
+        return self._weights_view
+    
+    @property
+    def walkable_mask(self) -> np.ndarray:
+        """(height, width) bool view of the walkability bitmap, indexed [y, x]"""
+        return np.frombuffer(self._walk, dtype=np.bool_).reshape(self.height, self.width)
     
     def add_obstacle(self, x: int, y: int):
         """Add an obstacle at position"""
-        self.obstacles.add((x, y))
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self._walk[y * self.width + x] = 0
+            self._row_blocked[y] |= 1 << x
+            self._col_blocked[x] |= 1 << y
+        self._changed()
     
     def remove_obstacle(self, x: int, y: int):
         """Remove obstacle at position"""
-        self.obstacles.discard((x, y))
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self._walk[y * self.width + x] = 1
+            self._row_blocked[y] &= ~(1 << x)
+            self._col_blocked[x] &= ~(1 << y)
+        self._changed()
     
     def set_weight(self, x: int, y: int, weight: float):
-        """Set movement cost weight for a cell"""
-        self.weights[(x, y)] = weight
+        """Set movement cost weight for a cell (1.0 clears it)"""
+        if weight == 1.0:
+            self._weights.pop((x, y), None)
+        else:
+            self._weights[(x, y)] = weight
+        self._changed()
     
     def is_walkable(self, x: int, y: int) -> bool:
         """Check if position is walkable"""
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return False
-        return (x, y) not in self.obstacles
+        return self._walk[y * self.width + x] != 0
     
     def get_weight(self, x: int, y: int) -> float:
         """Get movement cost weight for a cell"""
-        return self.weights.get((x, y), 1.0)
+        return self._weights.get((x, y), 1.0)
+    
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Materialize the grid as (height, width) arrays indexed [y, x]
+        Returns (walkable int8 array, weight float64 array)
+        """
+        # Zero-copy view of the bitmap
+        walk = np.frombuffer(self._walk, dtype=np.int8).reshape(self.height, self.width)
+        weights = np.ones((self.height, self.width), dtype=np.float64)
+        for (x, y), weight in self._weights.items():
+            if 0 <= x < self.width and 0 <= y < self.height:
+                weights[y, x] = weight
+        return walk, weights
     
     def get_neighbors(self, x: int, y: int, diagonal: bool = True) -> List[Tuple[int, int]]:
         """Get walkable neighbors of a position"""
         neighbors = []
+        width, height, walk = self.width, self.height, self._walk
         
-        # Cardinal directions
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        
-        # Add diagonal directions
-        if diagonal:
-            directions.extend([(1, 1), (1, -1), (-1, 1), (-1, -1)])
-        
-        for dx, dy in directions:
+        for dx, dy, _ in (_DIAG8 if diagonal else _CARDINAL):
             nx, ny = x + dx, y + dy
-            if self.is_walkable(nx, ny):
+            if 0 <= nx < width and 0 <= ny < height and walk[ny * width + nx]:
                 neighbors.append((nx, ny))
         
         return neighbors
@@ -84,7 +154,7 @@ def heuristic_euclidean(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
     """Euclidean distance heuristic"""
     dx = pos1[0] - pos2[0]
     dy = pos1[1] - pos2[1]
-    return (dx * dx + dy * dy) ** 0.5
+    return sqrt(dx * dx + dy * dy)
 
 def heuristic_diagonal(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
     """Diagonal distance heuristic (Chebyshev)"""
@@ -92,6 +162,28 @@ def heuristic_diagonal(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
     dy = abs(pos1[1] - pos2[1])
     return max(dx, dy)
 
+def heuristic_octile(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
+    """Octile distance heuristic (exact cost on an open 8-connected grid)"""
+    dx = abs(pos1[0] - pos2[0])
+    dy = abs(pos1[1] - pos2[1])
+    # Same diagonal cost as the search itself, so the heuristic stays admissible
+    if dx > dy:
+        return dx + 0.414 * dy
+    return dy + 0.414 * dx
+
+def _heuristic_zero(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
+    """No heuristic (turns A* into Dijkstra)"""
+    return 0
+
+# Heuristics the compiled A* kernel knows how to evaluate
+_HEURISTIC_KINDS = {
+    heuristic_manhattan: 0,
+    heuristic_euclidean: 1,
+    heuristic_diagonal: 2,
+    _heuristic_zero: 3,
+    heuristic_octile: 4,
+}
+
 def astar(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int], 
           heuristic: Callable = heuristic_euclidean, diagonal: bool = True) -> Optional[List[Tuple[int, int]]]:
     """
@@ -101,54 +193,469 @@ def astar(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
     if not grid.is_walkable(*start) or not grid.is_walkable(*goal):
         return None
     
-    # Initialize
-    open_set = []
-    closed_set: Set[Tuple[int, int]] = set()
-    nodes: Dict[Tuple[int, int], Node] = {}
+    heuristic_kind = _HEURISTIC_KINDS.get(heuristic)
+    if _astar_flat is not None and heuristic_kind is not None:
+        walk, weights = grid.to_arrays()
+        flat_path = _astar_flat(walk, weights, start[0], start[1], goal[0], goal[1],
+                                diagonal, heuristic_kind)
+        if len(flat_path) == 0:
+            return None
+        width = grid.width
+        return [(int(i) % width, int(i) // width) for i in flat_path]
+    
+    if heuristic in _HEURISTIC_SOURCE:
+        htable = _heuristic_table(grid.width, grid.height, goal, heuristic)
+        key = (diagonal, heuristic, bool(grid._weights), htable is not None)
+        specialized = _ASTAR_SPECIALIZED.get(key)
+        if specialized is None:
+            specialized = _ASTAR_SPECIALIZED[key] = _specialize_astar(*key)
+        return specialized(grid, start, goal, htable)
+    
+    # Hoist attribute lookups out of the loop
+    width, height = grid.width, grid.height
+    walk = grid._walk
+    get_weight = grid._weights.get
+    directions = _DIAG8 if diagonal else _CARDINAL
+    
+    # Cells are tracked by flat index y * width + x
+    start_idx = start[1] * width + start[0]
+    goal_idx = goal[1] * width + goal[0]
     
-    start_node = Node(start, g_cost=0, h_cost=heuristic(start, goal))
-    nodes[start] = start_node
-    heapq.heappush(open_set, start_node)
+    # Heap of (f_cost, tie_breaker, index); stale entries are skipped on pop
+    open_set = [(heuristic(start, goal), 0, start_idx)]
+    closed = bytearray(width * height)  # 1 once a cell is expanded
+    g_cost: Dict[int, float] = {start_idx: 0}
+    parent: Dict[int, int] = {start_idx: -1}
+    counter = itertools.count(1)
+    
+    while open_set:
+        _, _, current = heapq.heappop(open_set)
+        if closed[current]:
+            continue
+        
+        if current == goal_idx:
+            return _flat_path(parent, current, width)
+        
+        closed[current] = 1
+        current_g = g_cost[current]
+        cy, cx = divmod(current, width)
+        
+        # Check neighbors (inlined Grid.get_neighbors / is_walkable)
+        for dx, dy, move_cost in directions:
+            nx = cx + dx
+            ny = cy + dy
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+            neighbor = ny * width + nx
+            if not walk[neighbor] or closed[neighbor]:
+                continue
+            
+            neighbor_pos = (nx, ny)
+            tentative_g = current_g + move_cost * get_weight(neighbor_pos, 1.0)
+            
+            if tentative_g < g_cost.get(neighbor, float('inf')):
+                g_cost[neighbor] = tentative_g
+                parent[neighbor] = current
+                f_cost = tentative_g + heuristic(neighbor_pos, goal)
+                heapq.heappush(open_set, (f_cost, next(counter), neighbor))
+    
+    return None  # No path found
+
+def _flat_path(parent, idx: int, width: int) -> List[Tuple[int, int]]:
+    """Follow flat-index parent links back to the start and return (x, y) positions"""
+    path = []
+    while idx != -1:
+        path.append((idx % width, idx // width))
+        idx = parent[idx]
+    path.reverse()
+    return path
+
+# Source for A* loops specialized on (diagonal, heuristic, weighted): the
+# neighbor loop is unrolled, the heuristic inlined and the weight lookup
+# dropped for unweighted grids. Same expansion order as the generic loop.
+_ASTAR_TEMPLATE = """
+def {name}(grid, start, goal, htable):
+    width, height = grid.width, grid.height
+    walk = grid._walk
+    get_weight = grid._weights.get
+    gx, gy = goal
+    heappush, heappop = heapq.heappush, heapq.heappop
+    inf = float('inf')
+    start_idx = start[1] * width + start[0]
+    goal_idx = gy * width + gx
+    open_set = [(0, 0, start_idx)]
+    closed = bytearray(width * height)
+    g_cost = {{start_idx: 0}}
+    parent = {{start_idx: -1}}
+    counter = itertools.count(1)
     
     while open_set:
-        current = heapq.heappop(open_set)
+        _, _, current = heappop(open_set)
+        if closed[current]:
+            continue
+        
+        if current == goal_idx:
+            return _flat_path(parent, current, width)
+        
+        closed[current] = 1
+        current_g = g_cost[current]
+        cy, cx = divmod(current, width)
+{neighbors}
+    return None
+"""
+
+_ASTAR_NEIGHBOR_TEMPLATE = """
+        nx = cx + {dx}
+        ny = cy + {dy}
+        neighbor = ny * width + nx
+        if {in_bounds}walk[neighbor] and not closed[neighbor]:
+            tentative_g = current_g + {move_cost}
+            if tentative_g < g_cost.get(neighbor, inf):
+                g_cost[neighbor] = tentative_g
+                parent[neighbor] = current{heuristic_setup}
+                heappush(open_set, (tentative_g + {heuristic}, next(counter), neighbor))
+"""
+
+# Inline forms of the built-in heuristics in terms of hx, hy (neighbor - goal)
+_HEURISTIC_SOURCE = {
+    heuristic_manhattan: "(abs(hx) + abs(hy))",
+    heuristic_euclidean: "sqrt(hx * hx + hy * hy)",
+    heuristic_diagonal: "max(abs(hx), abs(hy))",
+    heuristic_octile: "(abs(hx) + 0.414 * abs(hy) if abs(hx) > abs(hy) else abs(hy) + 0.414 * abs(hx))",
+    _heuristic_zero: "0",
+}
+
+def _specialize_astar(diagonal: bool, heuristic: Callable, weighted: bool, tabled: bool) -> Callable:
+    """
+    Generate and compile an A* loop for one (diagonal, heuristic, weighted,
+    tabled) combination; tabled loops read the heuristic from htable
+    """
+    if tabled:
+        heuristic_source, heuristic_setup = "htable[neighbor]", ""
+    elif heuristic is _heuristic_zero:
+        heuristic_source, heuristic_setup = "0", ""
+    else:
+        heuristic_source = _HEURISTIC_SOURCE[heuristic]
+        heuristic_setup = "\n                hx = nx - gx\n                hy = ny - gy"
+    
+    neighbors = []
+    for dx, dy, move_cost in (_DIAG8 if diagonal else _CARDINAL):
+        bounds = []
+        if dx:
+            bounds.append("nx < width" if dx > 0 else "nx >= 0")
+        if dy:
+            bounds.append("ny < height" if dy > 0 else "ny >= 0")
+        neighbors.append(_ASTAR_NEIGHBOR_TEMPLATE.format(
+            dx=dx, dy=dy,
+            in_bounds="".join(bound + " and " for bound in bounds),
+            move_cost=f"{move_cost!r} * get_weight((nx, ny), 1.0)" if weighted else repr(move_cost),
+            heuristic=heuristic_source,
+            heuristic_setup=heuristic_setup,
+        ))
+    name = f"_astar_{'diag' if diagonal else 'card'}_{heuristic.__name__.lstrip('_')}" \
+           f"{'_weighted' if weighted else ''}{'_tabled' if tabled else ''}"
+    namespace: Dict[str, Callable] = {}
+    exec(_ASTAR_TEMPLATE.format(name=name, neighbors="".join(neighbors)), globals(), namespace)
+    return namespace[name]
+
+# Specialized loops, compiled on first use
+_ASTAR_SPECIALIZED: Dict[tuple, Callable] = {}
+
+# Vectorized forms of the built-in heuristics for whole-grid tables
+_HEURISTIC_NUMPY = {
+    heuristic_manhattan: lambda hx, hy: np.abs(hx) + np.abs(hy),
+    heuristic_euclidean: lambda hx, hy: np.sqrt(hx * hx + hy * hy),
+    heuristic_diagonal: lambda hx, hy: np.maximum(np.abs(hx), np.abs(hy)),
+    heuristic_octile: lambda hx, hy: np.where(np.abs(hx) > np.abs(hy),
+                                              np.abs(hx) + 0.414 * np.abs(hy),
+                                              np.abs(hy) + 0.414 * np.abs(hx)),
+}
+
+HEURISTIC_TABLE_MAX_CELLS = 65536  # Larger grids compute the heuristic inline
+HEURISTIC_TABLE_CACHE_SIZE = 16
+
+# (width, height, goal, heuristic) -> flat heuristic table, or None if the
+# goal has only been seen once
+_HEURISTIC_TABLES: Dict[tuple, Optional[List[float]]] = {}
+
+def _heuristic_table(width: int, height: int, goal: Tuple[int, int],
+                     heuristic: Callable) -> Optional[List[float]]:
+    """
+    Heuristic distance to goal for every cell, indexed y * width + x
+    Built the second time a goal is queried, so one-off searches don't pay for it
+    """
+    if heuristic not in _HEURISTIC_NUMPY or width * height > HEURISTIC_TABLE_MAX_CELLS:
+        return None
+    
+    key = (width, height, goal, heuristic)
+    if key not in _HEURISTIC_TABLES:
+        if len(_HEURISTIC_TABLES) >= HEURISTIC_TABLE_CACHE_SIZE:
+            del _HEURISTIC_TABLES[next(iter(_HEURISTIC_TABLES))]  # Evict the oldest entry
+        _HEURISTIC_TABLES[key] = None
+        return None
+    
+    table = _HEURISTIC_TABLES[key]
+    if table is None:
+        ys, xs = np.indices((height, width))
+        values = _HEURISTIC_NUMPY[heuristic](xs - goal[0], ys - goal[1])
+        table = _HEURISTIC_TABLES[key] = values.astype(np.float64).ravel().tolist()
+    return table
+
+def astar_bidirectional(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
+                        heuristic: Callable = heuristic_euclidean,
+                        diagonal: bool = True) -> Optional[List[Tuple[int, int]]]:
+    """
+    Bidirectional A*: searches from start and goal at once and meets in the middle
+    Returns a path with the same cost as astar, or None if no path exists
+    
+    Both searches are ordered by g plus the average potential
+    (h(n, goal) - h(n, start)) / 2 (negated for the backward search),
+    which keeps them consistent with each other so the search can stop as
+    soon as the two frontier minimums add up to the best meeting cost.
+    Requires a consistent heuristic.
+    """
+    if not grid.is_walkable(*start) or not grid.is_walkable(*goal):
+        return None
+    if start == goal:
+        return [start]
+    
+    width, height = grid.width, grid.height
+    walk = grid._walk
+    get_weight = grid._weights.get
+    directions = _DIAG8 if diagonal else _CARDINAL
+    counter = itertools.count(1)
+    
+    # Index 0 searches forward from start, index 1 backward from goal
+    sources = (start, goal)
+    targets = (goal, start)
+    open_sets = ([(heuristic(start, goal) / 2, 0, start)], [(heuristic(goal, start) / 2, 0, goal)])
+    g_costs: Tuple[Dict, Dict] = ({start: 0}, {goal: 0})
+    parents: Tuple[Dict, Dict] = ({start: None}, {goal: None})
+    closed_sets: Tuple[Set, Set] = (set(), set())
+    
+    best_cost = float('inf')
+    meet = None
+    
+    while open_sets[0] and open_sets[1]:
+        # No path through the frontiers can beat the best meeting point
+        if open_sets[0][0][0] + open_sets[1][0][0] >= best_cost:
+            break
         
-        if current.position == goal:
-            # Reconstruct path
-            path = []
-            node = current
-            while node:
-                path.append(node.position)
-                node = node.parent
-            return list(reversed(path))
+        side = 0 if len(open_sets[0]) <= len(open_sets[1]) else 1
+        open_set, g_cost = open_sets[side], g_costs[side]
+        parent, closed_set = parents[side], closed_sets[side]
+        other_g = g_costs[1 - side]
+        source, target = sources[side], targets[side]
         
-        closed_set.add(current.position)
+        _, _, current = heapq.heappop(open_set)
+        if current in closed_set:
+            continue
+        closed_set.add(current)
+        current_g = g_cost[current]
+        cx, cy = current
         
-        # Check neighbors
-        for neighbor_pos in grid.get_neighbors(*current.position, diagonal):
+        for dx, dy, move_cost in directions:
+            nx = cx + dx
+            ny = cy + dy
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+            if not walk[ny * width + nx]:
+                continue
+            neighbor_pos = (nx, ny)
             if neighbor_pos in closed_set:
                 continue
             
-            # Calculate cost
-            dx = abs(neighbor_pos[0] - current.position[0])
-            dy = abs(neighbor_pos[1] - current.position[1])
-            move_cost = 1.414 if (dx + dy) == 2 else 1.0  # Diagonal vs cardinal
-            move_cost *= grid.get_weight(*neighbor_pos)
+            # Moves cost the weight of the cell entered, so the backward
+            # search pays for the cell it is leaving
+            entered = current if side else neighbor_pos
+            tentative_g = current_g + move_cost * get_weight(entered, 1.0)
             
-            tentative_g = current.g_cost + move_cost
+            if tentative_g < g_cost.get(neighbor_pos, float('inf')):
+                g_cost[neighbor_pos] = tentative_g
+                parent[neighbor_pos] = current
+                key = tentative_g + (heuristic(neighbor_pos, target) - heuristic(neighbor_pos, source)) / 2
+                heapq.heappush(open_set, (key, next(counter), neighbor_pos))
+                
+                if neighbor_pos in other_g:
+                    total = tentative_g + other_g[neighbor_pos]
+                    if total < best_cost:
+                        best_cost = total
+                        meet = neighbor_pos
+    
+    if meet is None:
+        return None
+    
+    # Forward chain up to the meeting point, then the backward chain to the goal
+    path = []
+    pos = meet
+    while pos is not None:
+        path.append(pos)
+        pos = parents[0][pos]
+    path.reverse()
+    pos = parents[1][meet]
+    while pos is not None:
+        path.append(pos)
+        pos = parents[1][pos]
+    return path
+
+def _jump_straight(grid: Grid, x: int, y: int, dx: int, dy: int,
+                   goal: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+    """
+    Horizontal or vertical jump from (x, y), scanning whole rows or columns
+    at once using the grid's blocked-cell bitmasks
+    """
+    if dx:
+        lines, line, pos, step = grid._row_blocked, y, x, dx
+        goal_line, goal_pos = goal[1], goal[0]
+    else:
+        lines, line, pos, step = grid._col_blocked, x, y, dy
+        goal_line, goal_pos = goal[0], goal[1]
+    
+    # Forced neighbor at p: the side cell at p is blocked but the next one along is open
+    forced = 0
+    for side_line in (line - 1, line + 1):
+        if 0 <= side_line < len(lines):
+            side = lines[side_line]
+            if step > 0:
+                forced |= side & ~(side >> 1)
+            else:
+                forced |= side & ~((side << 1) | 1)
+    
+    blocked = lines[line]
+    if step > 0:
+        ahead = blocked >> (pos + 1)
+        stop = pos + (ahead & -ahead).bit_length()  # First blocked cell (sentinel included)
+        ahead = forced >> (pos + 1)
+        hit = pos + (ahead & -ahead).bit_length() if ahead else stop
+        if goal_line == line and pos < goal_pos < hit:
+            hit = goal_pos
+        if hit >= stop:
+            return None
+    else:
+        behind = (1 << pos) - 1
+        stop = (blocked & behind).bit_length() - 1  # -1 when open up to the edge
+        hit = (forced & behind).bit_length() - 1
+        if goal_line == line and hit < goal_pos < pos:
+            hit = goal_pos
+        if hit <= stop:
+            return None
+    return (hit, line) if dx else (line, hit)
+
+def _jump(grid: Grid, x: int, y: int, dx: int, dy: int,
+          goal: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+    """Step from (x, y) in direction (dx, dy) until a jump point, or None if blocked"""
+    if not (dx and dy):
+        return _jump_straight(grid, x, y, dx, dy, goal)
+    
+    walkable = grid.is_walkable
+    gx, gy = goal
+    while True:
+        x += dx
+        y += dy
+        if not walkable(x, y):
+            return None
+        if x == gx and y == gy:
+            return (x, y)
+        
+        # Forced neighbors, or a jump point along either component
+        if (not walkable(x - dx, y) and walkable(x - dx, y + dy)) or \
+           (not walkable(x, y - dy) and walkable(x + dx, y - dy)):
+            return (x, y)
+        if _jump_straight(grid, x, y, dx, 0, goal) or _jump_straight(grid, x, y, 0, dy, goal):
+            return (x, y)
+
+def _jps_directions(grid: Grid, x: int, y: int, dx: int, dy: int) -> List[Tuple[int, int]]:
+    """Directions left after pruning, given the direction (dx, dy) we arrived from"""
+    if dx == 0 and dy == 0:
+        return [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+    
+    walkable = grid.is_walkable
+    if dx and dy:
+        directions = [(dx, 0), (0, dy), (dx, dy)]
+        if not walkable(x - dx, y):
+            directions.append((-dx, dy))
+        if not walkable(x, y - dy):
+            directions.append((dx, -dy))
+    elif dx:
+        directions = [(dx, 0)]
+        if not walkable(x, y + 1):
+            directions.append((dx, 1))
+        if not walkable(x, y - 1):
+            directions.append((dx, -1))
+    else:
+        directions = [(0, dy)]
+        if not walkable(x + 1, y):
+            directions.append((1, dy))
+        if not walkable(x - 1, y):
+            directions.append((-1, dy))
+    return directions
+
+def jps(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
+        heuristic: Callable = heuristic_diagonal) -> Optional[List[Tuple[int, int]]]:
+    """
+    Jump Point Search on a uniform-cost grid with diagonal movement
+    Returns the same cell-by-cell path shape as astar, or None if no path exists
+    """
+    if grid._weights:
+        # JPS assumes every cell costs the same
+        return astar(grid, start, goal, heuristic)
+    if not grid.is_walkable(*start) or not grid.is_walkable(*goal):
+        return None
+    
+    open_set = [(heuristic(start, goal), 0, start)]
+    g_cost: Dict[Tuple[int, int], float] = {start: 0}
+    parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
+    closed_set: Set[Tuple[int, int]] = set()
+    counter = 1
+    
+    while open_set:
+        _, _, current = heapq.heappop(open_set)
+        if current in closed_set:
+            continue
+        
+        if current == goal:
+            # Reconstruct path, filling in the cells between jump points
+            jump_points = []
+            pos = current
+            while pos is not None:
+                jump_points.append(pos)
+                pos = parent[pos]
+            jump_points.reverse()
             
-            if neighbor_pos not in nodes:
-                nodes[neighbor_pos] = Node(neighbor_pos)
+            path = [jump_points[0]]
+            for (x0, y0), (x1, y1) in zip(jump_points, jump_points[1:]):
+                sx = (x1 > x0) - (x1 < x0)
+                sy = (y1 > y0) - (y1 < y0)
+                while (x0, y0) != (x1, y1):
+                    x0 += sx
+                    y0 += sy
+                    path.append((x0, y0))
+            return path
+        
+        closed_set.add(current)
+        
+        cx, cy = current
+        prev = parent[current]
+        if prev is None:
+            dx = dy = 0
+        else:
+            dx = (cx > prev[0]) - (cx < prev[0])
+            dy = (cy > prev[1]) - (cy < prev[1])
+        
+        for ndx, ndy in _jps_directions(grid, cx, cy, dx, dy):
+            jump_point = _jump(grid, cx, cy, ndx, ndy, goal)
+            if jump_point is None or jump_point in closed_set:
+                continue
             
-            neighbor = nodes[neighbor_pos]
+            # Jump points always lie on a straight or diagonal line from current
+            steps = max(abs(jump_point[0] - cx), abs(jump_point[1] - cy))
+            tentative_g = g_cost[current] + steps * (1.414 if ndx and ndy else 1.0)
             
-            if tentative_g < neighbor.g_cost:
-                neighbor.parent = current
-                neighbor.g_cost = tentative_g
-                neighbor.h_cost = heuristic(neighbor_pos, goal)
-                
-                if neighbor not in open_set:
-                    heapq.heappush(open_set, neighbor)
+            if tentative_g < g_cost.get(jump_point, float('inf')):
+                g_cost[jump_point] = tentative_g
+                parent[jump_point] = current
+                heapq.heappush(open_set, (tentative_g + heuristic(jump_point, goal), counter, jump_point))
+                counter += 1
     
     return None  # No path found
 
@@ -157,7 +664,7 @@ def dijkstra(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
     """
     Dijkstra's algorithm (A* with zero heuristic)
     """
-    return astar(grid, start, goal, lambda p1, p2: 0, diagonal)
+    return astar(grid, start, goal, _heuristic_zero, diagonal)
 
 def breadth_first_search(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int], 
                          diagonal: bool = False) -> Optional[List[Tuple[int, int]]]:
@@ -168,27 +675,34 @@ def breadth_first_search(grid: Grid, start: Tuple[int, int], goal: Tuple[int, in
     if not grid.is_walkable(*start) or not grid.is_walkable(*goal):
         return None
     
-    from collections import deque
+    width, height = grid.width, grid.height
+    walk = grid._walk
+    directions = _DIAG8 if diagonal else _CARDINAL
+    start_idx = start[1] * width + start[0]
+    goal_idx = goal[1] * width + goal[0]
     
-    queue = deque([start])
-    visited: Set[Tuple[int, int]] = {start}
-    parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
+    # Flat per-cell state; parent is only meaningful where visited is set
+    visited = bytearray(width * height)
+    parent = array('i', bytes(4 * width * height))
+    visited[start_idx] = 1
+    parent[start_idx] = -1
+    queue = deque([start_idx])
     
     while queue:
         current = queue.popleft()
         
-        if current == goal:
-            # Reconstruct path
-            path = []
-            pos = goal
-            while pos is not None:
-                path.append(pos)
-                pos = parent[pos]
-            return list(reversed(path))
+        if current == goal_idx:
+            return _flat_path(parent, current, width)
         
-        for neighbor in grid.get_neighbors(*current, diagonal):
-            if neighbor not in visited:
-                visited.add(neighbor)
+        cy, cx = divmod(current, width)
+        for dx, dy, _ in directions:
+            nx = cx + dx
+            ny = cy + dy
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+            neighbor = ny * width + nx
+            if walk[neighbor] and not visited[neighbor]:
+                visited[neighbor] = 1
                 parent[neighbor] = current
                 queue.append(neighbor)
     
@@ -220,6 +734,9 @@ def smooth_path(path: List[Tuple[int, int]], grid: Grid) -> List[Tuple[int, int]
     
     return smoothed
 
+# Lines at least this many cells long are checked with NumPy instead of a Python loop
+LOS_VECTORIZE_MIN = 48
+
 def has_line_of_sight(pos1: Tuple[int, int], pos2: Tuple[int, int], grid: Grid) -> bool:
     """
     Check if there's a clear line of sight between two positions
@@ -227,15 +744,33 @@ def has_line_of_sight(pos1: Tuple[int, int], pos2: Tuple[int, int], grid: Grid)
     """
     x0, y0 = pos1
     x1, y1 = pos2
+    width, height = grid.width, grid.height
+    
+    # The line stays inside the bounding box of its endpoints
+    if not (0 <= x0 < width and 0 <= y0 < height and 0 <= x1 < width and 0 <= y1 < height):
+        return False
     
     dx = abs(x1 - x0)
     dy = abs(y1 - y0)
     sx = 1 if x0 < x1 else -1
     sy = 1 if y0 < y1 else -1
+    
+    if max(dx, dy) >= LOS_VECTORIZE_MIN:
+        # Closed form of the Bresenham walk below, evaluated for every step at once
+        major, minor = (dx, dy) if dx >= dy else (dy, dx)
+        steps = np.arange(major + 1)
+        offsets = (2 * minor * steps + major - 1) // (2 * major)
+        if dx >= dy:
+            xs, ys = x0 + sx * steps, y0 + sy * offsets
+        else:
+            xs, ys = x0 + sx * offsets, y0 + sy * steps
+        return bool(grid.walkable_mask[ys, xs].all())
+    
+    walk = grid._walk
     err = dx - dy
     
     while True:
-        if not grid.is_walkable(x0, y0):
+        if not walk[y0 * width + x0]:
             return False
         
         if x0 == x1 and y0 == y1:
@@ -249,17 +784,53 @@ def has_line_of_sight(pos1: Tuple[int, int], pos2: Tuple[int, int], grid: Grid)
             err += dx
             y0 += sy
 
+def _triarea2(a: Vector3, b: Vector3, c: Vector3) -> float:
+    """Twice the signed area of triangle abc on the XZ (ground) plane"""
+    return (c.x - a.x) * (b.z - a.z) - (b.x - a.x) * (c.z - a.z)
+
+def _point_in_polygon_xz(point: Vector3, vertices: List[Vector3]) -> bool:
+    """Even-odd point-in-polygon test on the XZ plane"""
+    inside = False
+    px, pz = point.x, point.z
+    j = len(vertices) - 1
+    for i in range(len(vertices)):
+        xi, zi = vertices[i].x, vertices[i].z
+        xj, zj = vertices[j].x, vertices[j].z
+        if (zi > pz) != (zj > pz) and px < (xj - xi) * (pz - zi) / (zj - zi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
 class NavMesh:
-    """Navigation mesh for 3D pathfinding"""
+    """
+    Navigation mesh for 3D pathfinding
+    Polygons lie on the XZ (ground) plane with Y up; connected polygons
+    should share an edge, which becomes the portal the path passes through
+    """
     def __init__(self):
         self.polygons: List[List[Vector3]] = []
         self.connections: Dict[int, List[int]] = {}
+        # Shared edge between each pair of connected polygons, stored both ways
+        self.portals: Dict[Tuple[int, int], Tuple[Vector3, Vector3]] = {}
+        self._centroid_list: List[Tuple[float, float, float]] = []
+        self._centroids: Optional[np.ndarray] = None
+    
+    @property
+    def centroids(self) -> np.ndarray:
+        """(P, 3) array of polygon centroids"""
+        if self._centroids is None or len(self._centroids) != len(self._centroid_list):
+            self._centroids = np.array(self._centroid_list, dtype=np.float64).reshape(-1, 3)
+        return self._centroids
     
     def add_polygon(self, vertices: List[Vector3]) -> int:
         """Add a polygon to the nav mesh"""
         poly_id = len(self.polygons)
         self.polygons.append(vertices)
         self.connections[poly_id] = []
+        count = len(vertices) or 1
+        self._centroid_list.append((sum(v.x for v in vertices) / count,
+                                    sum(v.y for v in vertices) / count,
+                                    sum(v.z for v in vertices) / count))
         return poly_id
     
     def connect_polygons(self, poly1: int, poly2: int):
@@ -268,12 +839,143 @@ class NavMesh:
             self.connections[poly1].append(poly2)
         if poly2 in self.connections:
             self.connections[poly2].append(poly1)
+        if poly1 in self.connections and poly2 in self.connections:
+            portal = self._shared_edge(poly1, poly2)
+            self.portals[(poly1, poly2)] = portal
+            self.portals[(poly2, poly1)] = portal
+    
+    def _centroid(self, poly_id: int) -> Vector3:
+        return Vector3(*self._centroid_list[poly_id])
+    
+    def _shared_edge(self, poly1: int, poly2: int) -> Tuple[Vector3, Vector3]:
+        """Vertices shared by two polygons, or the centroid midpoint if they share no edge"""
+        keys = {(v.x, v.y, v.z) for v in self.polygons[poly2]}
+        shared = [v for v in self.polygons[poly1] if (v.x, v.y, v.z) in keys]
+        if len(shared) >= 2:
+            return shared[0], shared[1]
+        a, b = self._centroid_list[poly1], self._centroid_list[poly2]
+        midpoint = Vector3((a[0] + b[0]) / 2, (a[1] + b[1]) / 2, (a[2] + b[2]) / 2)
+        return midpoint, midpoint
+    
+    def find_polygon(self, point: Vector3) -> Optional[int]:
+        """Polygon containing point (on the XZ plane), else the one with the nearest centroid"""
+        if not self.polygons:
+            return None
+        offsets = self.centroids - (point.x, point.y, point.z)
+        order = np.argsort(np.einsum('ij,ij->i', offsets, offsets))
+        for poly_id in order.tolist():
+            if _point_in_polygon_xz(point, self.polygons[poly_id]):
+                return poly_id
+        return int(order[0])
+    
+    def _corridor(self, start_poly: int, goal_poly: int) -> Optional[List[int]]:
+        """A* over the polygon graph using centroid distances"""
+        centroids = self._centroid_list
+        goal_c = centroids[goal_poly]
+        
+        def heuristic(poly_id: int) -> float:
+            c = centroids[poly_id]
+            return sqrt((c[0] - goal_c[0]) ** 2 + (c[1] - goal_c[1]) ** 2 + (c[2] - goal_c[2]) ** 2)
+        
+        open_set = [(heuristic(start_poly), 0, start_poly)]
+        closed = bytearray(len(self.polygons))
+        g_cost: Dict[int, float] = {start_poly: 0.0}
+        parent: Dict[int, int] = {start_poly: -1}
+        counter = itertools.count(1)
+        
+        while open_set:
+            _, _, current = heapq.heappop(open_set)
+            if closed[current]:
+                continue
+            if current == goal_poly:
+                corridor = []
+                while current != -1:
+                    corridor.append(current)
+                    current = parent[current]
+                corridor.reverse()
+                return corridor
+            closed[current] = 1
+            
+            cx, cy, cz = centroids[current]
+            for neighbor in self.connections[current]:
+                if closed[neighbor]:
+                    continue
+                nx, ny, nz = centroids[neighbor]
+                tentative_g = g_cost[current] + sqrt((nx - cx) ** 2 + (ny - cy) ** 2 + (nz - cz) ** 2)
+                if tentative_g < g_cost.get(neighbor, float('inf')):
+                    g_cost[neighbor] = tentative_g
+                    parent[neighbor] = current
+                    heapq.heappush(open_set, (tentative_g + heuristic(neighbor), next(counter), neighbor))
+        
+        return None
+    
+    def _string_pull(self, start: Vector3, goal: Vector3, corridor: List[int]) -> List[Vector3]:
+        """Simple stupid funnel algorithm over the portals along the corridor"""
+        # Portals as (left, right) seen when walking from each polygon into the next
+        portals = [(start, start)]
+        for a, b in zip(corridor, corridor[1:]):
+            p, q = self.portals[(a, b)]
+            if _triarea2(self._centroid(a), p, q) < 0:
+                p, q = q, p
+            portals.append((p, q))
+        portals.append((goal, goal))
+        
+        path = [start]
+        apex = left = right = start
+        apex_idx = left_idx = right_idx = 0
+        i = 1
+        while i < len(portals):
+            portal_left, portal_right = portals[i]
+            
+            # Tighten the right side of the funnel
+            if _triarea2(apex, right, portal_right) <= 0:
+                if right is apex or _triarea2(apex, left, portal_right) > 0:
+                    right, right_idx = portal_right, i
+                else:
+                    # Right crossed over left: left becomes a corner of the path
+                    path.append(left)
+                    apex = right = left
+                    apex_idx = right_idx = left_idx
+                    i = apex_idx + 1
+                    continue
+            
+            # Tighten the left side of the funnel
+            if _triarea2(apex, left, portal_left) >= 0:
+                if left is apex or _triarea2(apex, right, portal_left) < 0:
+                    left, left_idx = portal_left, i
+                else:
+                    path.append(right)
+                    apex = left = right
+                    apex_idx = left_idx = right_idx
+                    i = apex_idx + 1
+                    continue
+            
+            i += 1
+        
+        if path[-1] is not goal:
+            path.append(goal)
+        return path
     
     def find_path_3d(self, start: Vector3, goal: Vector3) -> Optional[List[Vector3]]:
-        """Find path in 3D space using nav mesh"""
-        # Simplified implementation
-        # Real implementation would use funnel algorithm
-        return [start, goal]
+        """
+        Find path in 3D space using nav mesh
+        Returns the string-pulled path from start to goal, or None if unreachable
+        """
+        start_poly = self.find_polygon(start)
+        goal_poly = self.find_polygon(goal)
+        if start_poly is None or goal_poly is None:
+            return None
+        
+        corridor = self._corridor(start_poly, goal_poly)
+        if corridor is None:
+            return None
+        return self._string_pull(start, goal, corridor)
+
+PATH_CACHE_SIZE = 1024  # Cached find_path results per grid
+
+def invalidate_path_cache(grid: Grid):
+    """Drop cached find_path results for a grid"""
+    grid._path_cache.clear()
 
 def find_path(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int], 
               algorithm: str = "astar", smooth: bool = True) -> Optional[List[Tuple[int, int]]]:
@@ -284,14 +986,26 @@ def find_path(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
         grid: Grid to search
         start: Start position
         goal: Goal position
-        algorithm: "astar", "dijkstra", or "bfs"
+        algorithm: "astar", "astar_bi", "jps", "dijkstra", or "bfs"
         smooth: Whether to smooth the resulting path
     
     Returns:
         Path from start to goal, or None if no path exists
+    
+    Results are cached until the grid is changed through its mutator methods.
     """
+    cache = grid._path_cache
+    key = (grid._version, start, goal, algorithm, smooth)
+    if key in cache:
+        cached = cache[key]
+        return list(cached) if cached is not None else None
+    
     if algorithm == "astar":
         path = astar(grid, start, goal)
+    elif algorithm == "astar_bi":
+        path = astar_bidirectional(grid, start, goal)
+    elif algorithm == "jps":
+        path = jps(grid, start, goal)
     elif algorithm == "dijkstra":
         path = dijkstra(grid, start, goal)
     elif algorithm == "bfs":
@@ -302,4 +1016,8 @@ def find_path(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
     if path and smooth:
         path = smooth_path(path, grid)
     
+    if len(cache) >= PATH_CACHE_SIZE:
+        del cache[next(iter(cache))]  # Evict the oldest entry
+    cache[key] = tuple(path) if path is not None else None
+    
     return path
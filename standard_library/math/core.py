@@ -4,6 +4,7 @@ Mythos Math Standard Library - Core mathematical functions
 import math
 import cmath
 from typing import Union, List, Tuple
+import numpy as np
 
 class Vector2:
     """2D Vector class"""
@@ -29,7 +30,7 @@ class Vector2:
     
     def length(self) -> float:
         """Vector magnitude"""
-        return math.sqrt(self.x ** 2 + self.y ** 2)
+        return math.hypot(self.x, self.y)
     
     def normalize(self) -> 'Vector2':
         """Return normalized vector"""
@@ -40,7 +41,7 @@ class Vector2:
     
     def distance_to(self, other: 'Vector2') -> float:
         """Distance to another vector"""
-        return (self - other).length()
+        return math.hypot(self.x - other.x, self.y - other.y)
     
     def angle(self) -> float:
         """Angle in radians"""
@@ -91,7 +92,7 @@ class Vector3:
     
     def length(self) -> float:
         """Vector magnitude"""
-        return math.sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
     
     def normalize(self) -> 'Vector3':
         """Return normalized vector"""
@@ -102,7 +103,7 @@ class Vector3:
     
     def distance_to(self, other: 'Vector3') -> float:
         """Distance to another vector"""
-        return (self - other).length()
+        return math.dist((self.x, self.y, self.z), (other.x, other.y, other.z))
     
     def __repr__(self):
         return f"Vector3({self.x}, {self.y}, {self.z})"
@@ -123,12 +124,59 @@ class Matrix4:
     
     def multiply(self, other: 'Matrix4') -> 'Matrix4':
         """Matrix multiplication"""
-        result = [0] * 16
-        for i in range(4):
-            for j in range(4):
-                for k in range(4):
-                    result[i * 4 + j] += self.elements[i * 4 + k] * other.elements[k * 4 + j]
-        return Matrix4(result)
+        # Unrolled row-major 4x4 product
+        (a00, a01, a02, a03,
+         a10, a11, a12, a13,
+         a20, a21, a22, a23,
+         a30, a31, a32, a33) = self.elements
+        (b00, b01, b02, b03,
+         b10, b11, b12, b13,
+         b20, b21, b22, b23,
+         b30, b31, b32, b33) = other.elements
+        return Matrix4([
+            a00 * b00 + a01 * b10 + a02 * b20 + a03 * b30,
+            a00 * b01 + a01 * b11 + a02 * b21 + a03 * b31,
+            a00 * b02 + a01 * b12 + a02 * b22 + a03 * b32,
+            a00 * b03 + a01 * b13 + a02 * b23 + a03 * b33,
+            a10 * b00 + a11 * b10 + a12 * b20 + a13 * b30,
+            a10 * b01 + a11 * b11 + a12 * b21 + a13 * b31,
+            a10 * b02 + a11 * b12 + a12 * b22 + a13 * b32,
+            a10 * b03 + a11 * b13 + a12 * b23 + a13 * b33,
+            a20 * b00 + a21 * b10 + a22 * b20 + a23 * b30,
+            a20 * b01 + a21 * b11 + a22 * b21 + a23 * b31,
+            a20 * b02 + a21 * b12 + a22 * b22 + a23 * b32,
+            a20 * b03 + a21 * b13 + a22 * b23 + a23 * b33,
+            a30 * b00 + a31 * b10 + a32 * b20 + a33 * b30,
+            a30 * b01 + a31 * b11 + a32 * b21 + a33 * b31,
+            a30 * b02 + a31 * b12 + a32 * b22 + a33 * b32,
+            a30 * b03 + a31 * b13 + a32 * b23 + a33 * b33,
+        ])
+    
+    def __matmul__(self, other: 'Matrix4') -> 'Matrix4':
+        return self.multiply(other)
+    
+    @staticmethod
+    def multiply_batch(matrices: List['Matrix4']) -> 'Matrix4':
+        """Multiply a chain of matrices left to right using NumPy"""
+        if not matrices:
+            return Matrix4()
+        stack = np.array([m.elements for m in matrices], dtype=np.float64).reshape(-1, 4, 4)
+        # Pairwise reduction: one batched matmul per level, log2(N) levels
+        while len(stack) > 1:
+            paired = np.matmul(stack[0:-1:2], stack[1::2])
+            if len(stack) % 2:
+                paired = np.concatenate((paired, stack[-1:]))
+            stack = paired
+        return Matrix4.from_numpy(stack[0])
+    
+    def to_numpy(self) -> np.ndarray:
+        """Return elements as a 4x4 float64 array"""
+        return np.array(self.elements, dtype=np.float64).reshape(4, 4)
+    
+    @staticmethod
+    def from_numpy(array: np.ndarray) -> 'Matrix4':
+        """Create matrix from a 4x4 (or flat 16-element) array"""
+        return Matrix4(np.asarray(array, dtype=np.float64).reshape(16).tolist())
     
     def translate(self, x: float, y: float, z: float) -> 'Matrix4':
         """Create translation matrix"""
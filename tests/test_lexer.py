@@ -1,6 +1,7 @@
 """
 Tests for Mythos Lexer
 """
+import sys
 import unittest
 from compiler.lexer.lexer import Lexer, TokenType
 
@@ -46,6 +47,22 @@ class TestLexer(unittest.TestCase):
         for token in tokens[:-1]:  # Exclude EOF
             self.assertEqual(token.type, TokenType.KEYWORD)
     
+    def test_keywords_interned(self):
+        """Test keyword values are interned"""
+        lexer = Lexer("if " + "".join(["wh", "ile"]))
+        tokens = lexer.tokenize()
+        
+        self.assertIs(tokens[0].value, sys.intern("if"))
+        self.assertIs(tokens[1].value, sys.intern("while"))
+    
+    def test_identifiers_interned(self):
+        """Test repeated identifiers share one interned string"""
+        lexer = Lexer("total = total + " + "".join(["to", "tal"]))
+        tokens = lexer.tokenize()
+        
+        self.assertIs(tokens[0].value, tokens[2].value)
+        self.assertIs(tokens[4].value, sys.intern("total"))
+    
     def test_operators(self):
         """Test operator tokenization"""
         lexer = Lexer("+ - * / ^ %")
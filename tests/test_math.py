@@ -0,0 +1,174 @@
+"""
+Tests for Mythos Math Standard Library
+"""
+import unittest
+import numpy as np
+from standard_library.math.core import Matrix4, Vector2, Vector3
+from standard_library.math.physics import (
+    PhysicsBody2D, PhysicsBody3D, PhysicsWorld2D, PhysicsWorld3D, elastic_collision_1d,
+    _divide_or_zero, velocity, projectile_motion, projectile_motion_batch
+)
+
+def chain(matrices):
+    """Multiply matrices left to right with Matrix4.multiply"""
+    result = Matrix4()
+    for matrix in matrices:
+        result = result.multiply(matrix)
+    return result
+
+class TestMatrix4(unittest.TestCase):
+    def setUp(self):
+        m = Matrix4()
+        self.matrices = [
+            m.translate(1, 2, 3),
+            m.rotate_x(0.3),
+            m.scale(2, 0.5, 1.5),
+            m.rotate_y(-1.1),
+            m.rotate_z(0.7),
+            m.translate(-4, 0, 2),
+            Matrix4([float(i + 1) for i in range(16)]),
+        ]
+    
+    def assertMatrixAlmostEqual(self, a, b):
+        for x, y in zip(a.elements, b.elements):
+            self.assertAlmostEqual(x, y, places=9)
+    
+    def test_multiply(self):
+        """Test multiply against a row-major reference product"""
+        a, b = self.matrices[6], self.matrices[1]
+        expected = [
+            sum(a.elements[r * 4 + k] * b.elements[k * 4 + c] for k in range(4))
+            for r in range(4) for c in range(4)
+        ]
+        self.assertEqual(a.multiply(b).elements, expected)
+        self.assertEqual((a @ b).elements, expected)
+    
+    def test_multiply_batch(self):
+        """Test the pairwise batch product matches chained multiply"""
+        # Odd and even lengths exercise the carried last matrix
+        for count in range(1, len(self.matrices) + 1):
+            batch = self.matrices[:count]
+            self.assertMatrixAlmostEqual(Matrix4.multiply_batch(batch), chain(batch))
+        
+        # Order matters: reversing the chain changes the product
+        reversed_batch = Matrix4.multiply_batch(self.matrices[::-1])
+        self.assertMatrixAlmostEqual(reversed_batch, chain(self.matrices[::-1]))
+        self.assertFalse(np.allclose(reversed_batch.elements, chain(self.matrices).elements))
+    
+    def test_multiply_batch_small(self):
+        """Test empty and single-matrix batches"""
+        self.assertEqual(Matrix4.multiply_batch([]).elements, Matrix4().elements)
+        single = Matrix4.multiply_batch([self.matrices[0]])
+        self.assertEqual(single.elements, self.matrices[0].elements)
+    
+    def test_numpy_round_trip(self):
+        """Test to_numpy/from_numpy keep row-major order"""
+        matrix = self.matrices[6]
+        array = matrix.to_numpy()
+        
+        self.assertEqual(array.shape, (4, 4))
+        self.assertEqual(array[0, 3], 4.0)
+        self.assertEqual(array[3, 0], 13.0)
+        self.assertEqual(Matrix4.from_numpy(array).elements, matrix.elements)
+        self.assertEqual(Matrix4.from_numpy(array.reshape(16)).elements, matrix.elements)
+        self.assertMatrixAlmostEqual(
+            Matrix4.from_numpy(matrix.to_numpy() @ self.matrices[1].to_numpy()),
+            matrix @ self.matrices[1]
+        )
+
+class TestPhysicsWorld(unittest.TestCase):
+    CASES = [
+        (PhysicsWorld2D, PhysicsBody2D, Vector2),
+        (PhysicsWorld3D, PhysicsBody3D, Vector3),
+    ]
+    
+    def test_step_matches_bodies(self):
+        """Test world steps integrate like the per-body classes"""
+        for world_class, body_class, vector in self.CASES:
+            with self.subTest(dimensions=world_class.DIMENSIONS):
+                dims = world_class.DIMENSIONS
+                world = world_class(capacity=1)
+                bodies = []
+                # Adding past the initial capacity grows the arrays
+                for i in range(5):
+                    mass = float(i)
+                    position = vector(*[float(i + d) for d in range(dims)])
+                    idx = world.add_body(position, mass=mass)
+                    self.assertEqual(idx, i)
+                    bodies.append(body_class(vector(*[float(i + d) for d in range(dims)]), mass=mass))
+                
+                for _ in range(10):
+                    for i, body in enumerate(bodies):
+                        force = vector(*[float(i - d) for d in range(dims)])
+                        world.apply_force(i, force)
+                        world.apply_force(i, force)
+                        body.apply_force(force)
+                        body.apply_force(force)
+                        body.update(0.1)
+                    world.step(0.1)
+                
+                self.assertEqual(world.positions.shape, (5, dims))
+                for i, body in enumerate(bodies):
+                    self.assertIsInstance(world.get_position(i), vector)
+                    np.testing.assert_allclose(world.positions[i], world._components(body.position))
+                    np.testing.assert_allclose(world.velocities[i], world._components(body.velocity))
+                
+                # Massless body 0 never moves
+                np.testing.assert_array_equal(world.positions[0], np.arange(dims, dtype=float))
+    
+    def test_collision(self):
+        """Test two bodies meet and bounce apart with elastic velocities"""
+        for world_class, _, vector in self.CASES:
+            with self.subTest(dimensions=world_class.DIMENSIONS):
+                zeros = [0.0] * (world_class.DIMENSIONS - 1)
+                world = world_class()
+                a = world.add_body(vector(0.0, *zeros), mass=1.0, velocity=vector(2.0, *zeros))
+                b = world.add_body(vector(10.0, *zeros), mass=3.0, velocity=vector(-2.0, *zeros))
+                
+                steps = 0
+                while world.positions[a, 0] < world.positions[b, 0]:
+                    world.step(0.25)
+                    steps += 1
+                self.assertEqual(steps, 10)
+                self.assertEqual(world.get_position(a).x, world.get_position(b).x)
+                
+                v1, v2 = elastic_collision_1d(1.0, world.velocities[a, 0], 3.0, world.velocities[b, 0])
+                world.velocities[a, 0], world.velocities[b, 0] = v1, v2
+                world.step(0.25)
+                
+                self.assertEqual(world.get_velocity(a).x, -4.0)
+                self.assertEqual(world.get_velocity(b).x, 0.0)
+                self.assertLess(world.positions[a, 0], world.positions[b, 0])
+                np.testing.assert_array_equal(world.positions[:, 1:], 0.0)
+
+class TestPhysicsFunctions(unittest.TestCase):
+    def test_divide_or_zero(self):
+        """Test zero denominators give 0 for scalars and arrays"""
+        self.assertEqual(_divide_or_zero(6, 3), 2)
+        self.assertEqual(_divide_or_zero(6, 0), 0)
+        self.assertEqual(velocity(10, 0), 0)
+        
+        with np.errstate(all='raise'):
+            result = _divide_or_zero(np.array([6.0, 1.0, -2.0]), np.array([3.0, 0.0, 0.0]))
+            np.testing.assert_array_equal(result, [2.0, 0.0, 0.0])
+            # Scalar numerator broadcasts against an array denominator
+            np.testing.assert_array_equal(_divide_or_zero(4, np.array([0, 2])), [0.0, 2.0])
+            np.testing.assert_array_equal(velocity(np.array([5.0, 5.0]), 0), [0.0, 0.0])
+    
+    def test_projectile_motion_batch(self):
+        """Test the batch version matches scalar projectile_motion"""
+        speeds = np.array([10.0, 25.0, 3.5, 40.0, 12.0])
+        angles = np.array([0.0, 15.0, 45.0, 60.0, 90.0])
+        batch = projectile_motion_batch(speeds, angles)
+        
+        for i, (speed, angle) in enumerate(zip(speeds.tolist(), angles.tolist())):
+            expected = projectile_motion(speed, angle)
+            for values, value in zip(batch, expected):
+                self.assertAlmostEqual(values[i], value, places=9)
+        
+        # Arrays passed to the scalar function dispatch to the batch version
+        for values, expected in zip(projectile_motion(speeds, angles, 1.62), projectile_motion_batch(speeds, angles, 1.62)):
+            np.testing.assert_array_equal(values, expected)
+
+if __name__ == '__main__':
+    unittest.main()
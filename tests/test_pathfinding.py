@@ -0,0 +1,230 @@
+"""
+Tests for Mythos Pathfinding
+"""
+import unittest
+from standard_library.ai import pathfinding
+from standard_library.ai.pathfinding import (
+    Grid, astar, heuristic_manhattan, heuristic_euclidean, heuristic_diagonal, heuristic_octile, astar_bidirectional, jps, find_path, invalidate_path_cache, has_line_of_sight, NavMesh
+)
+from standard_library.math.core import Vector3
+
+def path_cost(path, grid=None):
+    """Cost of a cell-by-cell path with 1.414 diagonal steps, weighted by grid"""
+    cost = 0.0
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        step = 1.414 if x0 != x1 and y0 != y1 else 1.0
+        cost += step * grid.get_weight(x1, y1) if grid else step
+    return cost
+
+class TestPathfinding(unittest.TestCase):
+    def setUp(self):
+        # 10x10 grid with a wall at x=5 and a gap at y=8
+        self.grid = Grid(10, 10)
+        for y in range(10):
+            if y != 8:
+                self.grid.add_obstacle(5, y)
+    
+    def test_astar(self):
+        """Test A* finds a path around the wall"""
+        path = astar(self.grid, (0, 0), (9, 0))
+        
+        self.assertEqual(path[0], (0, 0))
+        self.assertEqual(path[-1], (9, 0))
+        self.assertIn((5, 8), path)
+    
+    def test_jps_matches_astar_cost(self):
+        """Test Jump Point Search returns an optimal cell-by-cell path"""
+        path = jps(self.grid, (0, 0), (9, 0))
+        
+        self.assertEqual(path[0], (0, 0))
+        self.assertEqual(path[-1], (9, 0))
+        for (x0, y0), (x1, y1) in zip(path, path[1:]):
+            self.assertLessEqual(max(abs(x1 - x0), abs(y1 - y0)), 1)
+            self.assertTrue(self.grid.is_walkable(x1, y1))
+        self.assertAlmostEqual(path_cost(path), path_cost(astar(self.grid, (0, 0), (9, 0))))
+    
+    def test_astar_bidirectional(self):
+        """Test bidirectional A* finds a path of the same length as A*"""
+        path = astar_bidirectional(self.grid, (0, 0), (9, 9))
+        
+        self.assertEqual(path[0], (0, 0))
+        self.assertEqual(path[-1], (9, 9))
+        self.assertEqual(len(path), len(astar(self.grid, (0, 0), (9, 9))))
+        self.assertIn((5, 8), path)
+
+    def test_no_path(self):
+        """Test unreachable goals return None"""
+        self.grid.add_obstacle(5, 8)
+        
+        self.assertIsNone(astar(self.grid, (0, 0), (9, 0)))
+        self.assertIsNone(jps(self.grid, (0, 0), (9, 0)))
+    
+    def test_find_path_jps(self):
+        """Test find_path dispatches to JPS"""
+        path = find_path(self.grid, (0, 0), (9, 9), algorithm="jps", smooth=False)
+        
+        self.assertEqual(path[0], (0, 0))
+        self.assertEqual(path[-1], (9, 9))
+
+    def test_find_path_cache(self):
+        """Test find_path results are cached until the grid changes"""
+        path = find_path(self.grid, (0, 0), (9, 0), smooth=False)
+        path.append((-1, -1))  # Callers get their own copy
+        self.assertEqual(find_path(self.grid, (0, 0), (9, 0), smooth=False)[-1], (9, 0))
+        
+        self.grid.add_obstacle(5, 8)
+        self.assertIsNone(find_path(self.grid, (0, 0), (9, 0), smooth=False))
+        
+        self.grid.remove_obstacle(5, 8)
+        self.assertIsNotNone(find_path(self.grid, (0, 0), (9, 0), smooth=False))
+
+    def test_weights_read_only(self):
+        """Test weights can only change through set_weight, which drops cached paths"""
+        path = find_path(self.grid, (0, 7), (9, 9), smooth=False)
+        with self.assertRaises(TypeError):
+            self.grid.weights[(5, 8)] = 50.0
+        
+        self.grid.set_weight(5, 8, 50.0)
+        self.assertEqual(self.grid.weights, {(5, 8): 50.0})
+        weighted = find_path(self.grid, (0, 7), (9, 9), smooth=False)
+        self.assertEqual(weighted, astar(self.grid, (0, 7), (9, 9)))
+        # Optimal for the new weights, unlike the path cached before set_weight
+        self.assertLess(path_cost(weighted, self.grid), path_cost(path, self.grid))
+        
+        self.grid.set_weight(5, 8, 1.0)
+        self.assertEqual(dict(self.grid.weights), {})
+        self.assertEqual(path_cost(find_path(self.grid, (0, 7), (9, 9), smooth=False)), path_cost(path))
+    
+    def test_obstacles_snapshot(self):
+        """Test the obstacles property reflects the walkability bitmap"""
+        self.assertIn((5, 0), self.grid.obstacles)
+        self.assertNotIn((5, 8), self.grid.obstacles)
+        self.assertFalse(self.grid.walkable_mask[0, 5])
+        self.assertTrue(self.grid.walkable_mask[8, 5])
+
+    def test_line_of_sight(self):
+        """Test short and long (vectorized) line of sight checks agree"""
+        self.assertFalse(has_line_of_sight((0, 0), (9, 2), self.grid))
+        self.assertTrue(has_line_of_sight((0, 8), (9, 8), self.grid))
+        
+        grid = Grid(100, 100)
+        self.assertTrue(has_line_of_sight((0, 0), (99, 40), grid))
+        grid.add_obstacle(50, 20)
+        self.assertFalse(has_line_of_sight((0, 0), (99, 40), grid))
+        self.assertTrue(has_line_of_sight((0, 1), (99, 41), grid))
+
+class TestPurePythonAstar(unittest.TestCase):
+    """Test the Python A* loops against the numba kernel"""
+    
+    HEURISTICS = [
+        heuristic_manhattan, heuristic_euclidean, heuristic_diagonal,
+        heuristic_octile, pathfinding._heuristic_zero,
+    ]
+    GOALS = [(9, 0), (9, 9), (0, 9), (7, 3)]
+    
+    def setUp(self):
+        self.grid = Grid(10, 10)
+        for y in range(10):
+            if y != 8:
+                self.grid.add_obstacle(5, y)
+        self.weighted = Grid(10, 10)
+        for y in range(10):
+            if y != 8:
+                self.weighted.add_obstacle(5, y)
+        self.weighted.set_weight(3, 3, 5.0)
+        self.weighted.set_weight(6, 8, 3.0)
+        self.weighted.set_weight(2, 5, 2.0)
+        self.astar_flat = pathfinding._astar_flat
+    
+    def tearDown(self):
+        pathfinding._astar_flat = self.astar_flat
+    
+    def python_astar(self, *args):
+        pathfinding._astar_flat = None
+        try:
+            return astar(*args)
+        finally:
+            pathfinding._astar_flat = self.astar_flat
+    
+    def assertValidPath(self, path, grid, start, goal, diagonal):
+        self.assertEqual((path[0], path[-1]), (start, goal))
+        for (x0, y0), (x1, y1) in zip(path, path[1:]):
+            self.assertTrue(grid.is_walkable(x1, y1))
+            if diagonal:
+                self.assertEqual(max(abs(x1 - x0), abs(y1 - y0)), 1)
+            else:
+                self.assertEqual(abs(x1 - x0) + abs(y1 - y0), 1)
+    
+    def test_matches_compiled_kernel(self):
+        """Test the specialized and tabled loops find paths as cheap as the kernel's"""
+        for grid in (self.grid, self.weighted):
+            for heuristic in self.HEURISTICS:
+                for diagonal in (True, False):
+                    for goal in self.GOALS:
+                        with self.subTest(heuristic=heuristic.__name__, diagonal=diagonal,
+                                          goal=goal, weighted=bool(grid.weights)):
+                            # The second and third searches use the heuristic table
+                            specialized = self.python_astar(grid, (0, 0), goal, heuristic, diagonal)
+                            tabled = self.python_astar(grid, (0, 0), goal, heuristic, diagonal)
+                            self.assertEqual(tabled, self.python_astar(grid, (0, 0), goal, heuristic, diagonal))
+                            self.assertValidPath(tabled, grid, (0, 0), goal, diagonal)
+                            self.assertEqual(specialized, tabled)
+                            
+                            # The kernel's heap may break equal-cost ties differently
+                            if self.astar_flat is not None:
+                                kernel = astar(grid, (0, 0), goal, heuristic, diagonal)
+                                self.assertAlmostEqual(path_cost(tabled, grid), path_cost(kernel, grid))
+    
+    def test_generic_loop(self):
+        """Test the loop for custom heuristics matches the specialized loop"""
+        def custom(pos1, pos2):
+            return heuristic_euclidean(pos1, pos2)
+        
+        for grid in (self.grid, self.weighted):
+            for diagonal in (True, False):
+                for goal in self.GOALS:
+                    path = self.python_astar(grid, (0, 0), goal, custom, diagonal)
+                    self.assertEqual(path, self.python_astar(grid, (0, 0), goal, heuristic_euclidean, diagonal))
+                    self.assertValidPath(path, grid, (0, 0), goal, diagonal)
+    
+    def test_no_path(self):
+        """Test the Python loops return None for unreachable goals"""
+        self.grid.add_obstacle(5, 8)
+        
+        self.assertIsNone(self.python_astar(self.grid, (0, 0), (9, 0)))
+        self.assertIsNone(self.python_astar(self.grid, (0, 0), (9, 0), lambda a, b: 0))
+        self.assertIsNone(self.python_astar(self.grid, (0, 0), (5, 0)))
+
+class TestNavMesh(unittest.TestCase):
+    """Test nav mesh pathfinding"""
+    
+    def setUp(self):
+        # L-shaped corridor: along X, then up Z
+        self.mesh = NavMesh()
+        a = self.mesh.add_polygon([Vector3(0, 0, 0), Vector3(10, 0, 0), Vector3(10, 0, 2), Vector3(0, 0, 2)])
+        b = self.mesh.add_polygon([Vector3(10, 0, 0), Vector3(12, 0, 0), Vector3(12, 0, 2), Vector3(10, 0, 2)])
+        c = self.mesh.add_polygon([Vector3(10, 0, 2), Vector3(12, 0, 2), Vector3(12, 0, 12), Vector3(10, 0, 12)])
+        self.mesh.connect_polygons(a, b)
+        self.mesh.connect_polygons(b, c)
+    
+    def test_path_turns_at_inner_corner(self):
+        """Test the path is pulled tight around the corner"""
+        path = self.mesh.find_path_3d(Vector3(1, 0, 1), Vector3(11, 0, 11))
+        
+        self.assertEqual(len(path), 3)
+        self.assertEqual((path[1].x, path[1].z), (10, 2))
+    
+    def test_straight_path(self):
+        """Test a path with line of sight has no corners"""
+        path = self.mesh.find_path_3d(Vector3(1, 0, 1), Vector3(11, 0, 1))
+        
+        self.assertEqual(len(path), 2)
+    
+    def test_unconnected(self):
+        """Test no path between unconnected polygons"""
+        self.mesh.add_polygon([Vector3(20, 0, 20), Vector3(22, 0, 20), Vector3(22, 0, 22)])
+        
+        self.assertIsNone(self.mesh.find_path_3d(Vector3(1, 0, 1), Vector3(21.5, 0, 20.5)))
+
+if __name__ == '__main__':
+    unittest.main()
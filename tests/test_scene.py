@@ -0,0 +1,60 @@
+"""
+Tests for Mythos Scene Management
+"""
+import unittest
+from engine.scene.scene import Entity, Scene
+
+class TestScene(unittest.TestCase):
+    def test_entity_transforms(self):
+        """Test entities start with their own default transforms"""
+        first, second = Entity(), Entity()
+        first.position.x = 5
+        first.scale.y = 2
+        
+        self.assertEqual((second.position.x, second.scale.y), (0, 1))
+        self.assertIsNot(first.rotation, second.rotation)
+    
+    def test_remove_entity(self):
+        """Test removal keeps the other entities"""
+        scene = Scene()
+        entities = [Entity(f"E{i}") for i in range(4)]
+        for entity in entities:
+            scene.add_entity(entity)
+        
+        scene.remove_entity(entities[1])
+        scene.remove_entity(entities[1])
+        
+        self.assertEqual(sorted(e.name for e in scene.entities), ["E0", "E2", "E3"])
+        self.assertNotIn(entities[1], scene.root.children)
+    
+    def test_remove_entity_in_two_scenes(self):
+        """Test an entity added to two scenes can be removed from each"""
+        first, second = Scene("A"), Scene("B")
+        other = Entity("Other")
+        entity = Entity()
+        first.add_entity(entity)
+        first.add_entity(other)
+        second.add_entity(entity)
+        
+        first.remove_entity(entity)
+        self.assertEqual(first.entities, [other])
+        self.assertEqual(second.entities, [entity])
+        
+        second.remove_entity(entity)
+        self.assertEqual(second.entities, [])
+    
+    def test_remove_entity_added_twice(self):
+        """Test an entity added twice to one scene needs two removals"""
+        scene = Scene()
+        entity = Entity()
+        scene.add_entity(entity)
+        scene.add_entity(Entity("Other"))
+        scene.add_entity(entity)
+        
+        scene.remove_entity(entity)
+        self.assertEqual([e.name for e in scene.entities].count("Entity"), 1)
+        scene.remove_entity(entity)
+        self.assertEqual([e.name for e in scene.entities], ["Other"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+"""
+Tests for Mythos type annotations
+"""
+import os
+import unittest
+
+try:
+    from mypy import api as mypy_api
+except ImportError:  # mypy is a dev dependency
+    mypy_api = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules compiled with mypyc when building with MYTHOS_MYPYC=1
+MYPYC_MODULES = ["compiler/lexer/lexer.py", "compiler/parser/parser.py"]
+
+@unittest.skipIf(mypy_api is None, "mypy is not installed")
+@unittest.skipUnless(os.path.exists(os.path.join(ROOT, MYPYC_MODULES[0])),
+                     "source tree not available (running against an installed wheel)")
+class TestTypes(unittest.TestCase):
+    def test_mypyc_modules_type_check(self):
+        """Test the mypyc-compiled modules pass mypy"""
+        paths = [os.path.join(ROOT, path) for path in MYPYC_MODULES]
+        stdout, stderr, status = mypy_api.run(["--cache-dir", os.devnull, *paths])
+        
+        self.assertEqual(status, 0, stdout + stderr)
+
+if __name__ == '__main__':
+    unittest.main()
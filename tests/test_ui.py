@@ -0,0 +1,193 @@
+"""
+Tests for Mythos UI Framework
+"""
+import io
+import unittest
+from web.frontend.ui import (
+    UIElement, button, card, column, container, image, input_field, link, list_items, page, row, text
+)
+
+class TestUI(unittest.TestCase):
+    def test_element(self):
+        """Test props, styles and events render as attributes"""
+        elem = UIElement("section")
+        elem.set_prop("id", "main").set_style("color", "red").on("click", lambda e: None)
+        elem.add_child(text("hi", "span"))
+        
+        self.assertEqual(
+            elem.render(),
+            '<section id="main" style="color: red" data-events="click"><span>hi</span></section>'
+        )
+    
+    def test_void_elements(self):
+        """Test img and input render as self-closing tags"""
+        self.assertEqual(image("a.png", "A").render(), '<img src="a.png" alt="A" />')
+        self.assertEqual(input_field("text", "name").render(), '<input type="text" placeholder="name" />')
+    
+    def test_components(self):
+        """Test text, link, list and button rendering"""
+        title = text("Title", "h3").set_style("margin-top", "0")
+        self.assertEqual(title.render(), '<h3 style="margin-top: 0">Title</h3>')
+        self.assertEqual(link("/x", "go").render(), '<a href="/x">go</a>')
+        self.assertEqual(list_items(["a", "b"], True).render(), '<ol><li>a</li><li>b</li></ol>')
+        self.assertEqual(list_items([]).render(), '<ul></ul>')
+        self.assertTrue(button("OK").render().endswith('cursor: pointer;">OK</button>'))
+    
+    def test_escaping(self):
+        """Test text and attribute values are HTML-escaped"""
+        self.assertEqual(text("a < b & c").render(), '<p>a &lt; b &amp; c</p>')
+        self.assertEqual(link('/?q="x"', "<b>").render(), '<a href="/?q=&quot;x&quot;">&lt;b&gt;</a>')
+        self.assertEqual(list_items(["it's"]).render(), '<ul><li>it&#39;s</li></ul>')
+        self.assertIn('<title>A &amp; B</title>', page("A & B").render())
+    
+    def test_layouts(self):
+        """Test layout containers carry their styles"""
+        self.assertEqual(row().render(), '<div style="display: flex; flex-direction: row"></div>')
+        self.assertEqual(column().render(), '<div style="display: flex; flex-direction: column"></div>')
+        self.assertIn('<h3 style="margin-top: 0">T</h3><p>C</p></div>', card("T", "C").render())
+    
+    def test_shared_layout_styles(self):
+        """Test restyling one row leaves other rows untouched"""
+        styled, plain = row(), row()
+        styled.set_style("gap", "1px")
+        
+        self.assertEqual(styled.render(), '<div style="display: flex; flex-direction: row; gap: 1px"></div>')
+        self.assertEqual(plain.render(), '<div style="display: flex; flex-direction: row"></div>')
+    
+    def test_styles_dict(self):
+        """Test styles is a mutable dict, including a layout's defaults"""
+        layout = row()
+        layout.styles['gap'] = '2px'
+        elem = UIElement("p")
+        elem.styles['color'] = 'red'
+        
+        self.assertEqual(layout.render(), '<div style="display: flex; flex-direction: row; gap: 2px"></div>')
+        self.assertEqual(elem.render(), '<p style="color: red"></p>')
+        self.assertEqual(column().styles, {"display": "flex", "flex-direction": "column"})
+        self.assertEqual(row().render(), '<div style="display: flex; flex-direction: row"></div>')
+    
+    def test_containers(self):
+        """Test children/props/events are usable on a fresh element and after a render"""
+        elem = UIElement("div")
+        self.assertEqual((elem.children, elem.props, elem.events), ([], {}, {}))
+        self.assertEqual([child for child in UIElement("div").children], [])
+        
+        elem.props['id'] = 'a'
+        self.assertEqual(elem.render(), '<div id="a"></div>')
+        elem.props['id'] = 'b'
+        elem.events['click'] = lambda e: None
+        self.assertEqual(elem.render(), '<div id="b" data-events="click"></div>')
+        elem.children.append(text("x"))
+        self.assertEqual(elem.render(), '<div id="b" data-events="click"><p>x</p></div>')
+        elem.props = {}
+        self.assertEqual(elem.render(), '<div data-events="click"><p>x</p></div>')
+    
+    def test_styles_dict_after_render(self):
+        """Test changing the styles dict after a render shows up in every ancestor"""
+        elem = text("hi")
+        outer = container().add_child(row().add_child(elem))
+        before = outer.render()
+        elem.styles['color'] = 'red'
+        
+        self.assertEqual(elem.render(), '<p style="color: red">hi</p>')
+        self.assertEqual(outer.render(), before.replace('<p>', '<p style="color: red">'))
+        del outer.children[0].styles['flex-direction']
+        self.assertEqual(outer.render(), '<div><div style="display: flex"><p style="color: red">hi</p></div></div>')
+    
+    def test_render_cache_invalidation(self):
+        """Test changes deep in a rendered tree show up on the next render"""
+        btn = button("Old")
+        title = text("Title", "h3")
+        outer = container().add_child(title).add_child(row().add_child(btn))
+        first = outer.render()
+        
+        self.assertIs(outer.render(), first)
+        
+        btn.text = "New"
+        self.assertIn('>New</button>', outer.render())
+        title.content = "Heading"
+        self.assertIn('>Heading</h3>', outer.render())
+        btn.set_prop("id", "ok")
+        self.assertIn('<button id="ok" ', outer.render())
+    
+    def test_shared_child_invalidation(self):
+        """Test an element under several parents refreshes all of them"""
+        btn = button("Old")
+        first = container().add_child(row().add_child(btn))
+        second = container().add_child(btn)
+        self.assertIn('>Old</button>', first.render())
+        self.assertIn('>Old</button>', second.render())
+        
+        btn.text = "New"
+        self.assertIn('>New</button>', first.render())
+        self.assertIn('>New</button>', second.render())
+        
+        # Moving a child under a third parent keeps the earlier ones live
+        third = container().add_child(btn)
+        third.render()
+        btn.set_prop("id", "b")
+        for parent in (first, second, third):
+            self.assertIn('<button id="b"', parent.render())
+    
+    def test_deep_nesting(self):
+        """Test trees deeper than the recursion limit render"""
+        root = node = container()
+        for _ in range(2000):
+            child = container()
+            node.add_child(child)
+            node = child
+        
+        html = root.render()
+        self.assertTrue(html.startswith('<div><div>'))
+        self.assertEqual(html.count('</div>'), 2001)
+    
+    def test_chain_cache_size(self):
+        """Test a chain-shaped tree does not cache one copy of the page per ancestor"""
+        nodes = [container() for _ in range(2000)]
+        for parent, child in zip(nodes, nodes[1:]):
+            parent.add_child(child)
+        leaf = text("leaf")
+        nodes[-1].add_child(leaf)
+        
+        html = nodes[0].render()
+        cached = sum(len(node._cached_html) for node in nodes if node._cached_html is not None)
+        self.assertLess(cached, 4 * len(html))
+        
+        leaf.content = "changed"
+        self.assertEqual(nodes[0].render(), html.replace("leaf", "changed"))
+    
+    def test_page(self):
+        """Test full page rendering"""
+        app = page("Demo").add_style("p{}").add_element(container())
+        html = app.render()
+        
+        self.assertTrue(html.startswith('<!DOCTYPE html>\n<html lang="en">'))
+        self.assertIn('<title>Demo</title>\n    <style>p{}</style>\n</head>', html)
+        self.assertIn('<body>\n    <div style="font-family: Arial, sans-serif; margin: 0; padding: 20px"><div></div></div>\n</body>', html)
+        self.assertTrue(html.endswith('</html>'))
+    
+    def test_event_delegation(self):
+        """Test events render as one attribute and pull in the delegate script"""
+        elem = UIElement("div").on("click", print).on("mouseover", print)
+        self.assertEqual(elem.render(), '<div data-events="click mouseover"></div>')
+        
+        self.assertNotIn('data-events', page().add_element(container()).render())
+        html = page().add_style("p{}").add_element(elem).render()
+        self.assertIn("<style>p{}</style>\n<script>\ndocument.addEventListener('DOMContentLoaded'", html)
+        self.assertIn('handleEvent(event)', html)
+    
+    def test_render_bytes(self):
+        """Test render_bytes writes the same HTML as UTF-8"""
+        app = page("Café").add_script("go()").add_element(text("ünïcode " * 20000))
+        app.add_element(UIElement("div").on("click", print))
+        sink = io.BytesIO()
+        app.render_bytes(sink)
+        self.assertEqual(sink.getvalue(), app.render().encode('utf-8'))
+        
+        sink = io.BytesIO()
+        elem = app.body
+        elem.render_bytes(sink)
+        self.assertEqual(sink.getvalue().decode('utf-8'), elem.render())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,229 @@
+"""
+Tests for Mythos Virtual Machine
+"""
+import io
+import importlib.util
+import unittest
+from contextlib import redirect_stdout
+from compiler.lexer.lexer import Lexer
+from compiler.parser.parser import Parser
+from compiler.bytecode.compiler import BytecodeCompiler, OpCode, FunctionCode
+from runtime.vm import VirtualMachine, MythosFunction, CallFrame
+from tools.debugger import Profiler
+
+def compile_source(source):
+    """Compile source to a bytecode dict"""
+    compiler = BytecodeCompiler()
+    compiler.compile(Parser(Lexer(source).tokenize()).parse())
+    return compiler.get_bytecode()
+
+def run(source, **vm_options):
+    """Compile and run source, returning (vm, printed output)"""
+    bytecode = compile_source(source)
+    
+    vm = VirtualMachine(**vm_options)
+    output = io.StringIO()
+    with redirect_stdout(output):
+        vm.execute(bytecode['instructions'], bytecode['constants'])
+    return vm, output.getvalue()
+
+class TestVirtualMachine(unittest.TestCase):
+    def test_arithmetic(self):
+        """Test arithmetic operators"""
+        vm, _ = run("a = 1 + 2 * 3\nb = 10 / 4\nc = 7 % 3\nd = -a\ne = 2 ^ 3")
+        
+        self.assertEqual(vm.globals['a'], 7)
+        self.assertEqual(vm.globals['b'], 2.5)
+        self.assertEqual(vm.globals['c'], 1)
+        self.assertEqual(vm.globals['d'], -7)
+        self.assertEqual(vm.globals['e'], 8)
+    
+    def test_comparison_and_logic(self):
+        """Test comparison and logical operators"""
+        vm, _ = run("a = 1 < 2 and 3 >= 3\nb = 1 == 2 or not true\nc = 2 != 2")
+        
+        self.assertIs(vm.globals['a'], True)
+        self.assertIs(vm.globals['b'], False)
+        self.assertIs(vm.globals['c'], False)
+    
+    def test_while_and_if(self):
+        """Test loops and branches"""
+        vm, _ = run("i = 0\nevens = 0\nwhile i < 10 {\n  if i % 2 == 0 {\n    evens = evens + 1\n  }\n  i = i + 1\n}")
+        
+        self.assertEqual(vm.globals['i'], 10)
+        self.assertEqual(vm.globals['evens'], 5)
+    
+    def test_objects_and_arrays(self):
+        """Test object members and array indexing"""
+        vm, _ = run('o = {a: 1, b: "two"}\narr = [10, 20, 30]\nx = o.b\ny = arr[1] + o.a')
+        
+        self.assertEqual(vm.globals['x'], "two")
+        self.assertEqual(vm.globals['y'], 21)
+    
+    def test_print(self):
+        """Test the print builtin"""
+        _, output = run('print("Sum:", 10 + 20)')
+        
+        self.assertEqual(output, "Sum: 30\n")
+    
+    def test_function_calls(self):
+        """Test nested Mythos function calls"""
+        vm, _ = run(
+            "function double(x) {\n return x * 2\n}\n"
+            "function quad(x) {\n return double(double(x))\n}\n"
+            "r = quad(3)\ns = double(5) + 1"
+        )
+        
+        self.assertEqual(vm.globals['r'], 12)
+        self.assertEqual(vm.globals['s'], 11)
+        self.assertEqual(vm.stack, [])
+        self.assertEqual(vm.call_stack, [])
+    
+    def test_function_locals(self):
+        """Test function locals are kept apart from globals"""
+        vm, _ = run(
+            "x = 10\ny = 0\n"
+            "function f(a) {\n y = a + x\n return y * 2\n}\n"
+            "r = f(1)"
+        )
+        
+        self.assertEqual(vm.globals['r'], 22)
+        self.assertEqual(vm.globals['y'], 0)
+        self.assertNotIn('a', vm.globals)
+    
+    def test_function_constants(self):
+        """Test the compiler emits plain function code that the VM wraps once"""
+        source = (
+            "i = 0\nwhile i < 3 {\n"
+            " function outer(a) {\n  function inner(b) {\n   return b * 2\n  }\n  return inner(a) + 1\n }\n"
+            " if i == 0 {\n  first = outer\n }\n"
+            " i = i + 1\n}\nsame = first == outer\nr = outer(4)"
+        )
+        bytecode = compile_source(source)
+        codes = [c for c in bytecode['constants'] if isinstance(c, FunctionCode)]
+        self.assertEqual([code.name for code in codes], ['outer'])
+        self.assertEqual(codes[0].local_names, ['a', 'inner'])
+        self.assertIsInstance(codes[0].constants[0], FunctionCode)
+        
+        vm = VirtualMachine()
+        vm.execute(bytecode['instructions'], bytecode['constants'])
+        self.assertEqual(vm.globals['r'], 9)
+        self.assertIsInstance(vm.globals['outer'], MythosFunction)
+        # The declaration ran three times but loads one prebuilt function
+        self.assertIs(vm.globals['same'], True)
+    
+    def test_set_variable_without_slot(self):
+        """Test names without a local slot stay in the current frame"""
+        vm = VirtualMachine()
+        vm.globals['x'] = 1
+        vm.current_frame = CallFrame(MythosFunction('f', ['a'], [], []), 0)
+        vm.set_variable('a', 2)
+        vm.set_variable('x', 3)
+        vm.set_variable('z', 4)
+        
+        self.assertEqual((vm.get_variable('a'), vm.get_variable('x'), vm.get_variable('z')), (2, 3, 4))
+        self.assertEqual(vm.current_frame.variables(), {'a': 2, 'x': 3, 'z': 4})
+        self.assertEqual(vm.globals['x'], 1)
+        self.assertNotIn('z', vm.globals)
+        
+        vm.current_frame = None
+        self.assertEqual(vm.get_variable('x'), 1)
+        self.assertRaises(NameError, vm.get_variable, 'z')
+    
+    def test_numeric_loop(self):
+        """Test a numeric loop keeps Python int/float/bool results"""
+        source = (
+            "i = 0\nt = 0\nf = 0.5\nbig = 1\n"
+            "while i < 100 {\n t = t + i % 7\n f = f * 2\n big = big * 3\n i = i + 1\n}\n"
+            "done = i >= 100"
+        )
+        for jit in (False, True):
+            vm, _ = run(source, numeric_jit=jit)
+            
+            self.assertEqual(vm.globals['t'], sum(i % 7 for i in range(100)))
+            self.assertIs(type(vm.globals['t']), int)
+            self.assertEqual(vm.globals['f'], 0.5 * 2 ** 100)
+            self.assertEqual(vm.globals['big'], 3 ** 100)  # Past int64
+            self.assertIs(vm.globals['done'], True)
+    
+    def test_numeric_jit_opt_in(self):
+        """Test the Numba path is only taken when enabled"""
+        bytecode = compile_source("i = 0\nwhile i < 10 {\n i = i + 1\n}")
+        vm = VirtualMachine(numeric_jit=False)
+        vm._execute_numeric = lambda instructions, constants: self.fail("JIT used while disabled")
+        vm.execute(bytecode['instructions'], bytecode['constants'])
+        
+        self.assertEqual(vm.globals['i'], 10)
+    
+    @unittest.skipUnless(importlib.util.find_spec('numba'), "numba not installed")
+    def test_numeric_fast_path(self):
+        """Test numeric loops run on the Numba kernel"""
+        bytecode = compile_source("i = 0\nt = 0.0\nwhile i < 10 {\n t = t + i / 2\n i = i + 1\n}")
+        vm = VirtualMachine()
+        
+        self.assertTrue(vm._execute_numeric(bytecode['instructions'], bytecode['constants']))
+        self.assertEqual(vm.globals['t'], 22.5)
+        self.assertEqual(vm.globals['i'], 10)
+    
+    def test_math_builtins(self):
+        """Test inlined math builtins and user functions shadowing them"""
+        vm, _ = run("a = sqrt(16)\nb = abs(-3) + floor(2.5)\nc = cos(0)")
+        
+        self.assertEqual(vm.globals['a'], 4.0)
+        self.assertEqual(vm.globals['b'], 5)
+        self.assertEqual(vm.globals['c'], 1.0)
+        
+        vm, _ = run("function sqrt(x) {\n return x + 1\n}\nr = sqrt(1)")
+        self.assertEqual(vm.globals['r'], 2)
+        
+        # Redefined by separately compiled code, as in the REPL
+        definition = compile_source("function sqrt(x) {\n return x + 1\n}")
+        call = compile_source("r = sqrt(1)")
+        vm = VirtualMachine()
+        vm.execute(definition['instructions'], definition['constants'])
+        vm.execute(call['instructions'], call['constants'])
+        self.assertEqual(vm.globals['r'], 2)
+        
+        # Rebound to a Python callable: same stack effect as the inlined call
+        call = compile_source("r = sqrt(4)\nsqrt(9)")
+        vm = VirtualMachine()
+        vm.globals['sqrt'] = lambda x: x * 10
+        vm.execute(call['instructions'], call['constants'])
+        self.assertEqual(vm.globals['r'], 40)
+        self.assertEqual(vm.stack, [])
+    
+    def test_expression_statements(self):
+        """Test call results used as statements are discarded"""
+        vm, output = run(
+            "function log(x) {\n print(x)\n}\n"
+            "i = 0\nwhile i < 5 {\n sqrt(4)\n len([1, 2])\n log(i)\n i = i + 1\n}\n"
+            "n = len([1, 2, 3])\nnothing = log(5)"
+        )
+        
+        self.assertEqual(output, "0\n1\n2\n3\n4\n5\n")
+        self.assertEqual(vm.globals['n'], 3)
+        self.assertIsNone(vm.globals['nothing'])
+        self.assertEqual(vm.stack, [])
+    
+    def test_profiler_counts_instructions(self):
+        """Test an attached profiler counts executed opcodes"""
+        bytecode = compile_source("i = 0\nwhile i < 3 {\n i = i + 1\n}")
+        vm = VirtualMachine()
+        profiler = Profiler()
+        with redirect_stdout(io.StringIO()):
+            profiler.start(vm)
+            vm.execute(bytecode['instructions'], bytecode['constants'])
+            profiler.stop()
+        
+        counts = profiler.instruction_counts
+        self.assertEqual(counts[OpCode.ADD], 3)
+        self.assertEqual(counts[OpCode.LT], 4)
+        self.assertIs(vm._dispatch, vm._dispatch_fast)
+    
+    def test_division_by_zero(self):
+        """Test division by zero raises"""
+        with self.assertRaises(ZeroDivisionError):
+            run("x = 1 / 0")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 Mythos Debugger - Debug Mythos programs
 """
 from typing import Dict, List, Set, Optional, Any
+from collections import Counter, defaultdict
 from compiler.bytecode.compiler import OpCode, Instruction
 from runtime.vm import VirtualMachine
 
@@ -136,7 +137,7 @@ class Debugger:
         # Local variables
         if self.vm.current_frame:
             print("  Local:")
-            for name, value in self.vm.current_frame.locals.items():
+            for name, value in self.vm.current_frame.variables().items():
                 print(f"    {name} = {value}")
         
         # Global variables
@@ -157,8 +158,10 @@ class Debugger:
         """Evaluate expression (simplified)"""
         # In real implementation, would parse and evaluate properly
         # For now, just try to get variable value
-        if self.vm.current_frame and expression in self.vm.current_frame.locals:
-            return self.vm.current_frame.locals[expression]
+        if self.vm.current_frame:
+            local_vars = self.vm.current_frame.variables()
+            if expression in local_vars:
+                return local_vars[expression]
         if expression in self.vm.globals:
             return self.vm.globals[expression]
         raise NameError(f"Variable '{expression}' not found")
@@ -180,33 +183,49 @@ class Debugger:
 class Profiler:
     """Performance profiler for Mythos"""
     def __init__(self):
-        self.function_times: Dict[str, float] = {}
-        self.function_calls: Dict[str, int] = {}
-        self.instruction_counts: Dict[OpCode, int] = {}
+        self.function_times: Dict[str, float] = defaultdict(float)
+        self.function_calls: Dict[str, int] = Counter()
+        # Executed instruction counts, indexed by opcode value
+        self.opcode_counts: List[int] = [0] * (max(OpCode) + 1)
         self.enabled = False
+        self.vm: Optional[VirtualMachine] = None
     
-    def start(self):
-        """Start profiling"""
+    def start(self, vm: VirtualMachine = None):
+        """Start profiling, counting every instruction vm executes"""
         self.enabled = True
         self.function_times.clear()
         self.function_calls.clear()
-        self.instruction_counts.clear()
+        self.opcode_counts = [0] * (max(OpCode) + 1)
+        if vm is not None:
+            self._attach(vm)
         print("Profiler started")
     
     def stop(self):
         """Stop profiling"""
         self.enabled = False
+        if self.vm is not None:
+            self.vm._dispatch = self.vm._dispatch_fast
+            self.vm = None
         print("Profiler stopped")
     
+    def _attach(self, vm: VirtualMachine):
+        """Install counting handlers in vm; the VM pays nothing when detached"""
+        counts = self.opcode_counts
+        
+        def counting(opcode, handler):
+            def counted(arg, constants):
+                counts[opcode] += 1
+                return handler(arg, constants)
+            return counted
+        
+        vm._dispatch = [counting(opcode, handler) for opcode, handler in enumerate(vm._dispatch_fast)]
+        self.vm = vm
+    
     def record_function_call(self, function_name: str, duration: float):
         """Record function call"""
         if not self.enabled:
             return
         
-        if function_name not in self.function_times:
-            self.function_times[function_name] = 0.0
-            self.function_calls[function_name] = 0
-        
         self.function_times[function_name] += duration
         self.function_calls[function_name] += 1
     
@@ -215,10 +234,12 @@ class Profiler:
         if not self.enabled:
             return
         
-        if opcode not in self.instruction_counts:
-            self.instruction_counts[opcode] = 0
-        
-        self.instruction_counts[opcode] += 1
+        self.opcode_counts[opcode] += 1
+    
+    @property
+    def instruction_counts(self) -> Dict[OpCode, int]:
+        """Executed instruction counts by opcode (opcodes seen at least once)"""
+        return {OpCode(i): count for i, count in enumerate(self.opcode_counts) if count}
     
     def print_report(self):
         """Print profiling report"""
@@ -238,14 +259,15 @@ class Profiler:
                 print(f"{func_name:<30} {calls:<10} {total_time:<15.6f} {avg_time:<15.6f}")
         
         # Instruction statistics
-        if self.instruction_counts:
+        instruction_counts = self.instruction_counts
+        if instruction_counts:
             print("\nInstruction Statistics:")
             print(f"{'Instruction':<30} {'Count':<15}")
             print("-" * 45)
             
-            total_instructions = sum(self.instruction_counts.values())
-            for opcode in sorted(self.instruction_counts.keys(), key=lambda x: self.instruction_counts[x], reverse=True):
-                count = self.instruction_counts[opcode]
+            total_instructions = sum(instruction_counts.values())
+            for opcode in sorted(instruction_counts.keys(), key=lambda x: instruction_counts[x], reverse=True):
+                count = instruction_counts[opcode]
                 percentage = (count / total_instructions) * 100 if total_instructions > 0 else 0
                 print(f"{opcode.name:<30} {count:<10} ({percentage:.2f}%)")
             
@@ -1,99 +1,406 @@
 """
 Mythos UI Framework - Build UIs without HTML/CSS
 """
-from typing import List, Dict, Any, Optional, Callable
+from __future__ import annotations
+import sys
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Callable, BinaryIO, Mapping
+
+def _esc(value: Any) -> str:
+    """Escape a value for use in HTML text or a quoted attribute"""
+    # Chained str.replace beats str.translate here: each call is a C scan
+    # that returns the string itself when there is nothing to replace
+    return (str(value).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            .replace('"', '&quot;').replace("'", '&#39;'))
+
+# Characters encoded per write by render_bytes
+_BYTES_CHUNK = 1 << 16
+
+def _write_encoded(write: Callable, html: str):
+    """Write html as UTF-8 in bounded chunks instead of one full-size bytes copy"""
+    for i in range(0, len(html), _BYTES_CHUNK):
+        write(html[i:i + _BYTES_CHUNK].encode('utf-8'))
+
+# Default button styles, appended after any user styles
+_BUTTON_DEFAULT_STYLE_ATTR = ' style="padding: 10px 20px; background: #007bff; color: white; border: none; border-radius: 4px; cursor: pointer;"'
+
+# Elements list their events here instead of one on<event> attribute each
+_EVENTS_ATTR = ' data-events="'
+
+# Document-level delegate calling handleEvent(event) for every element on the
+# event path whose data-events names the event; listens in the capture phase
+# so non-bubbling events (focus, blur, ...) are seen too
+_EVENT_DELEGATE_SCRIPT = """<script>
+document.addEventListener('DOMContentLoaded', function () {
+    var types = {};
+    document.querySelectorAll('[data-events]').forEach(function (elem) {
+        elem.getAttribute('data-events').split(' ').forEach(function (type) {
+            if (types[type]) return;
+            types[type] = true;
+            document.addEventListener(type, function (event) {
+                for (var node = event.target; node && node.getAttribute; node = node.parentNode) {
+                    var names = node.getAttribute('data-events');
+                    if (names && names.split(' ').indexOf(type) >= 0) handleEvent(event);
+                }
+            }, true);
+        });
+    });
+});
+</script>"""
+
+# Tags rendered as <tag ... /> with no children or closing tag
+_VOID_TAGS = frozenset(('img', 'input', 'br', 'hr'))
+
+# tag -> (open prefix, closing tag, is void), shared by all elements
+_TAG_TEMPLATES: Dict[str, tuple] = {}
+
+def _tag_template(tag: str) -> tuple:
+    """Get the precomputed open/close strings for a tag"""
+    template = _TAG_TEMPLATES.get(tag)
+    if template is None:
+        void = tag in _VOID_TAGS
+        template = _TAG_TEMPLATES[tag] = ('<' + tag, '' if void else '</' + tag + '>', void)
+    return template
+
+# Layout defaults; a Row/Column renders the shared attribute until its styles are touched
+_ROW_STYLES = MappingProxyType({"display": "flex", "flex-direction": "row"})
+_COLUMN_STYLES = MappingProxyType({"display": "flex", "flex-direction": "column"})
+_ROW_STYLE_ATTR = ' style="display: flex; flex-direction: row"'
+_COLUMN_STYLE_ATTR = ' style="display: flex; flex-direction: column"'
+
+def _invalidating(name: str) -> property:
+    """Attribute property that drops the element's cached HTML when assigned"""
+    attr = '_' + name
+    
+    def fget(self):
+        return getattr(self, attr)
+    
+    def fset(self, value):
+        setattr(self, attr, value)
+        self._invalidate()
+    
+    return property(fget, fset)
+
+def _container(name: str, factory: Callable, caches: tuple = ()) -> property:
+    """Public view of a container slot, created on first access
+    
+    Reading or assigning it drops the element's cached HTML and the named
+    attribute caches, since the caller may change the container.
+    """
+    attr = '_' + name
+    
+    def fget(self):
+        value = getattr(self, attr)
+        if value is None:
+            value = factory()
+            setattr(self, attr, value)
+        for cache in caches:
+            setattr(self, cache, None)
+        self._invalidate()
+        return value
+    
+    def fset(self, value):
+        setattr(self, attr, value)
+        for cache in caches:
+            setattr(self, cache, None)
+        self._invalidate()
+    
+    return property(fget, fset)
 
 class UIElement:
-    """Base UI element"""
+    """Base UI element
+    
+    Rendered HTML is cached on the rendered element and on subtrees at
+    least twice the size of any cache below them (see _render_into), and
+    dropped when the element or one of its descendants changes through
+    add_child/set_prop/set_style/on. Caches nest, so each part of the HTML
+    is held O(log n) times for n elements, not once per ancestor.
+    An element may sit under several parents; all of them are invalidated.
+    children/props/styles/events are created on first access, since most
+    elements are leaves with few or no props. Reading one drops the cache,
+    since the caller may change it; a reference kept across a render is not
+    tracked, and children appended directly (not via add_child) do not
+    invalidate this element when they change.
+    """
+    __slots__ = ('_type', '_open', '_close', '_void', '_children', '_props', '_styles', '_events',
+                 '_parent', '_more_parents', '_cached_html', '_cached_size', '_attrs_str',
+                 '_style_attr')
+    
+    # False for elements whose _emit_open renders their own content
+    _renders_children = True
+    
+    # Styles copied into the styles dict when it is created
+    _default_styles: Optional[Mapping[str, str]] = None
+    
     def __init__(self, element_type: str):
+        self._parent: Optional['UIElement'] = None
+        self._more_parents: Optional[List['UIElement']] = None
+        self._cached_html: Optional[str] = None
+        self._cached_size = 0  # Fragments joined into _cached_html
+        self._attrs_str: Optional[str] = None
+        self._style_attr: Optional[str] = None
         self.type = element_type
-        self.children: List['UIElement'] = []
-        self.props: Dict[str, Any] = {}
-        self.styles: Dict[str, str] = {}
-        self.events: Dict[str, Callable] = {}
+        self._children: Optional[List['UIElement']] = None
+        self._props: Optional[Dict[str, Any]] = None
+        self._styles: Optional[Dict[str, str]] = None
+        self._events: Optional[Dict[str, Callable]] = None
+    
+    @property
+    def type(self) -> str:
+        """Tag name"""
+        return self._type
+    
+    @type.setter
+    def type(self, tag: str):
+        self._type = tag
+        self._open, self._close, self._void = _tag_template(tag)
+        self._invalidate()
+    
+    children = _container('children', list)
+    props = _container('props', dict, ('_attrs_str',))
+    events = _container('events', dict)
+    
+    @property
+    def styles(self) -> Dict[str, str]:
+        """Style dict, created on first access"""
+        styles = self._styles
+        if styles is None:
+            defaults = self._default_styles
+            styles = self._styles = dict(defaults) if defaults else {}
+        # The caller may change the dict, so drop the cached style attribute and HTML
+        self._style_attr = None
+        self._invalidate()
+        return styles
+    
+    @styles.setter
+    def styles(self, styles: Dict[str, str]):
+        self._styles = styles
+        self._style_attr = None
+        self._invalidate()
+    
+    def _invalidate(self):
+        """Drop cached HTML for this element and its ancestors"""
+        node = self
+        pending = None
+        while True:
+            node._cached_html = None
+            more = node._more_parents
+            if more:
+                # Shared element: its other parents' chains are walked too
+                if pending is None:
+                    pending = []
+                pending.extend(more)
+            node = node._parent
+            if node is None:
+                if not pending:
+                    return
+                node = pending.pop()
     
     def add_child(self, child: 'UIElement'):
         """Add child element"""
-        self.children.append(child)
+        parent = child._parent
+        if parent is None:
+            child._parent = self
+        elif parent is not self:
+            more = child._more_parents
+            if more is None:
+                child._more_parents = [self]
+            elif self not in more:
+                more.append(self)
+        children = self._children
+        if children is None:
+            children = self._children = []
+        children.append(child)
+        self._invalidate()
         return self
     
     def set_prop(self, key: str, value: Any):
         """Set property"""
-        self.props[key] = value
+        if type(key) is str:
+            key = sys.intern(key)
+        props = self._props
+        if props is None:
+            props = self._props = {}
+        props[key] = value
+        self._attrs_str = None
+        self._invalidate()
         return self
     
     def set_style(self, key: str, value: str):
         """Set style"""
+        if type(key) is str:
+            key = sys.intern(key)
         self.styles[key] = value
         return self
     
     def on(self, event: str, handler: Callable):
         """Add event handler"""
-        self.events[event] = handler
+        events = self._events
+        if events is None:
+            events = self._events = {}
+        events[event] = handler
+        self._invalidate()
         return self
     
     def render(self) -> str:
         """Render to HTML"""
-        # Build attributes
-        attrs = []
-        for key, value in self.props.items():
-            attrs.append(f'{key}="{value}"')
-        
-        # Build styles
-        if self.styles:
-            style_str = '; '.join([f'{k}: {v}' for k, v in self.styles.items()])
-            attrs.append(f'style="{style_str}"')
-        
-        # Build event handlers (would be converted to JavaScript)
-        for event, handler in self.events.items():
-            attrs.append(f'on{event}="handleEvent(event)"')
+        html = self._cached_html
+        if html is None:
+            out = []
+            size = self._render_into(out)
+            html = self._cached_html
+            if html is None:
+                html = self._cached_html = ''.join(out)
+                self._cached_size = size
+        return html
+    
+    def render_bytes(self, sink: BinaryIO):
+        """Render to HTML and write it to a binary sink as UTF-8"""
+        _write_encoded(sink.write, self.render())
+    
+    def _get_attrs_str(self) -> str:
+        """Props as ' key="value"' attributes, cached until set_prop"""
+        attrs = self._attrs_str
+        if attrs is None:
+            props = self._props
+            attrs = ''.join([f' {k}="{_esc(v)}"' for k, v in props.items()]) if props else ''
+            self._attrs_str = attrs
+        return attrs
+    
+    def _get_style_attr(self) -> str:
+        """Styles as a ' style="..."' attribute, cached until set_style"""
+        style = self._style_attr
+        if style is None:
+            styles = self._styles if self._styles is not None else self._default_styles
+            if styles:
+                style_str = '; '.join([f'{k}: {_esc(v)}' for k, v in styles.items()])
+                style = f' style="{style_str}"'
+            else:
+                style = ''
+            self._style_attr = style
+        return style
+    
+    def _render_into(self, out: list) -> int:
+        """Append HTML fragments for this element and its subtree to out
         
-        attrs_str = ' '.join(attrs)
+        Walks the tree with an explicit stack. A frame [node, start, reused,
+        cached] marks where an open node's closing tag goes: its subtree's
+        fragments are out[start:], reused adds the fragments folded into
+        reused caches, and cached is the largest subtree cached below it.
+        The subtree is cached only if it has at least twice as many
+        fragments, so nested caches double in size and each fragment is held
+        by O(log n) of them; one render costs O(n log n) time and cache
+        memory even for deep, chain-shaped trees. Returns the subtree's size
+        in fragments.
+        """
+        base = len(out)
+        frames = [[None, base, 0, 0]]  # Collects the caller's totals
+        stack = [self]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node = pop()
+            if node.__class__ is list:
+                node, start, reused, cached = node
+                node._emit_close(out)
+                size = len(out) - start + reused
+                if size >= 2 * cached:
+                    node._cached_html = ''.join(out[start:])
+                    node._cached_size = cached = size
+                frames.pop()
+                parent = frames[-1]
+                parent[2] += reused
+                if cached > parent[3]:
+                    parent[3] = cached
+                continue
+            
+            html = node._cached_html
+            if html is not None:
+                out.append(html)
+                size = node._cached_size
+                parent = frames[-1]
+                parent[2] += size - 1
+                if size > parent[3]:
+                    parent[3] = size
+                continue
+            
+            children = node._children
+            if not children or not node._renders_children or node._void:
+                # Leaves are cheap to rebuild and covered by their parent's cache
+                node._emit_open(out)
+                node._emit_close(out)
+                continue
+            
+            frame = [node, len(out), 0, 0]
+            frames.append(frame)
+            push(frame)
+            node._emit_open(out)
+            stack.extend(reversed(children))
+        return len(out) - base + frames[0][2]
+    
+    def _emit_open(self, out: list):
+        """Append the opening tag"""
+        out.append(self._open)
+        attrs = self._get_attrs_str()
+        style = self._get_style_attr()
+        if attrs:
+            out.append(attrs)
+        if style:
+            out.append(style)
         
-        # Render children
-        children_html = ''.join([child.render() for child in self.children])
+        # Event names go in one attribute read by the page's delegate script
+        events = self._events
+        if events:
+            out.extend((_EVENTS_ATTR, _esc(' '.join(events)), '"'))
         
         # Self-closing tags
-        if self.type in ('img', 'input', 'br', 'hr'):
-            return f'<{self.type} {attrs_str} />'
-        
-        return f'<{self.type} {attrs_str}>{children_html}</{self.type}>'
+        out.append(' />' if self._void else '>')
+    
+    def _emit_close(self, out: list):
+        """Append the closing tag (empty for void elements)"""
+        out.append(self._close)
 
 class Text(UIElement):
     """Text element"""
+    __slots__ = ('_content',)
+    
     def __init__(self, content: str, tag: str = "p"):
         super().__init__(tag)
         self.content = content
     
-    def render(self) -> str:
-        attrs_str = ' '.join([f'{k}="{v}"' for k, v in self.props.items()])
-        if self.styles:
-            style_str = '; '.join([f'{k}: {v}' for k, v in self.styles.items()])
-            attrs_str += f' style="{style_str}"'
-        return f'<{self.type} {attrs_str}>{self.content}</{self.type}>'
+    content = _invalidating('content')
+    _renders_children = False
+    
+    def _emit_open(self, out: list):
+        out.extend((self._open, self._get_attrs_str(), self._get_style_attr(), '>', _esc(self.content)))
+    
+    def _emit_close(self, out: list):
+        out.append(self._close)
 
 class Button(UIElement):
     """Button element"""
+    __slots__ = ('_text',)
+    
     def __init__(self, text: str, on_click: Callable = None):
         super().__init__("button")
         self.text = text
         if on_click:
             self.on("click", on_click)
     
-    def render(self) -> str:
-        attrs_str = ' '.join([f'{k}="{v}"' for k, v in self.props.items()])
-        if self.styles:
-            style_str = '; '.join([f'{k}: {v}' for k, v in self.styles.items()])
-            attrs_str += f' style="{style_str}"'
-        
-        # Add default button styles
-        default_styles = "padding: 10px 20px; background: #007bff; color: white; border: none; border-radius: 4px; cursor: pointer;"
-        attrs_str += f' style="{default_styles}"'
-        
-        return f'<button {attrs_str}>{self.text}</button>'
+    text = _invalidating('text')
+    _renders_children = False
+    
+    def _emit_open(self, out: list):
+        out.extend(('<button', self._get_attrs_str(), self._get_style_attr(),
+                    _BUTTON_DEFAULT_STYLE_ATTR, '>', _esc(self.text)))
+    
+    def _emit_close(self, out: list):
+        out.append('</button>')
 
 class Input(UIElement):
     """Input element"""
+    __slots__ = ()
+    
     def __init__(self, input_type: str = "text", placeholder: str = "", value: str = ""):
         super().__init__("input")
         self.set_prop("type", input_type)
@@ -104,25 +411,33 @@ class Input(UIElement):
 
 class Container(UIElement):
     """Container element (div)"""
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("div")
 
 class Row(UIElement):
     """Horizontal layout container"""
+    __slots__ = ()
+    _default_styles = _ROW_STYLES
+    
     def __init__(self):
         super().__init__("div")
-        self.set_style("display", "flex")
-        self.set_style("flex-direction", "row")
+        self._style_attr = _ROW_STYLE_ATTR
 
 class Column(UIElement):
     """Vertical layout container"""
+    __slots__ = ()
+    _default_styles = _COLUMN_STYLES
+    
     def __init__(self):
         super().__init__("div")
-        self.set_style("display", "flex")
-        self.set_style("flex-direction", "column")
+        self._style_attr = _COLUMN_STYLE_ATTR
 
 class Image(UIElement):
     """Image element"""
+    __slots__ = ()
+    
     def __init__(self, src: str, alt: str = ""):
         super().__init__("img")
         self.set_prop("src", src)
@@ -130,30 +445,45 @@ class Image(UIElement):
 
 class Link(UIElement):
     """Link element"""
+    __slots__ = ('_text',)
+    
     def __init__(self, href: str, text: str):
         super().__init__("a")
         self.set_prop("href", href)
         self.text = text
     
-    def render(self) -> str:
-        attrs_str = ' '.join([f'{k}="{v}"' for k, v in self.props.items()])
-        return f'<a {attrs_str}>{self.text}</a>'
+    text = _invalidating('text')
+    _renders_children = False
+    
+    def _emit_open(self, out: list):
+        out.extend(('<a', self._get_attrs_str(), '>', _esc(self.text)))
+    
+    def _emit_close(self, out: list):
+        out.append('</a>')
 
 class List(UIElement):
     """List element"""
+    __slots__ = ('_items',)
+    
     def __init__(self, items: List[str], ordered: bool = False):
         super().__init__("ol" if ordered else "ul")
-        for item in items:
-            li = UIElement("li")
-            li.props["_content"] = item
-            self.add_child(li)
+        # Items are kept as plain strings rather than <li> elements
+        self._items = list(items)
     
-    def render(self) -> str:
-        items_html = ''.join([f'<li>{child.props.get("_content", "")}</li>' for child in self.children])
-        return f'<{self.type}>{items_html}</{self.type}>'
+    _renders_children = False
+    
+    def _emit_open(self, out: list):
+        out.extend((self._open, '>'))
+        for item in self._items:
+            out.extend(('<li>', _esc(item), '</li>'))
+    
+    def _emit_close(self, out: list):
+        out.append(self._close)
 
 class Card(Container):
     """Card component"""
+    __slots__ = ()
+    
     def __init__(self, title: str = "", content: str = ""):
         super().__init__()
         self.set_style("border", "1px solid #ddd")
@@ -173,17 +503,41 @@ class Card(Container):
 
 class Grid(UIElement):
     """Grid layout"""
+    __slots__ = ()
+    
     def __init__(self, columns: int = 3, gap: str = "10px"):
         super().__init__("div")
         self.set_style("display", "grid")
         self.set_style("grid-template-columns", f"repeat({columns}, 1fr)")
         self.set_style("gap", gap)
 
+# Static page boilerplate around the title, head elements and body
+_PAGE_PREFIX = ('<!DOCTYPE html>\n'
+                '<html lang="en">\n'
+                '<head>\n'
+                '    <meta charset="UTF-8">\n'
+                '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+                '    <title>')
+_PAGE_HEAD = '</title>\n    '
+_PAGE_BODY = '\n</head>\n<body>\n    '
+_PAGE_SUFFIX = '\n</body>\n</html>'
+_PAGE_PREFIX_BYTES = _PAGE_PREFIX.encode('utf-8')
+_PAGE_HEAD_BYTES = _PAGE_HEAD.encode('utf-8')
+_PAGE_BODY_BYTES = _PAGE_BODY.encode('utf-8')
+_PAGE_SUFFIX_BYTES = _PAGE_SUFFIX.encode('utf-8')
+
 class Page:
-    """Full page component"""
+    """Full page component
+    
+    add_style/add_script fold each head element into one joined string as
+    it is added; appending to head_elements directly bypasses that.
+    """
     def __init__(self, title: str = "Mythos App"):
         self.title = title
         self.head_elements: List[str] = []
+        self._head_html = ''
+        self._scanned_body: Optional[str] = None
+        self._body_has_events = False
         self.body = Container()
         self.body.set_style("font-family", "Arial, sans-serif")
         self.body.set_style("margin", "0")
@@ -196,77 +550,64 @@ class Page:
     
     def add_style(self, css: str):
         """Add custom CSS"""
-        self.head_elements.append(f"<style>{css}</style>")
+        self._add_head(f"<style>{css}</style>")
         return self
     
     def add_script(self, js: str):
         """Add custom JavaScript"""
-        self.head_elements.append(f"<script>{js}</script>")
+        self._add_head(f"<script>{js}</script>")
         return self
     
+    def _add_head(self, html: str):
+        """Append a head element and fold it into the joined head HTML"""
+        self._head_html = self._head_html + '\n' + html if self.head_elements else html
+        self.head_elements.append(html)
+    
+    def _head_for(self, body: str) -> str:
+        """Head HTML, plus the event delegate script if the body has events"""
+        if body is not self._scanned_body:
+            # Escaping keeps a literal data-events=" out of text and values,
+            # and an unchanged body is the same cached string object
+            self._scanned_body = body
+            self._body_has_events = _EVENTS_ATTR in body
+        head = self._head_html
+        if self._body_has_events:
+            head = head + '\n' + _EVENT_DELEGATE_SCRIPT if head else _EVENT_DELEGATE_SCRIPT
+        return head
+    
     def render(self) -> str:
         """Render full HTML page"""
-        head_content = '\n'.join(self.head_elements)
-        body_content = self.body.render()
-        
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{self.title}</title>
-    {head_content}
-</head>
-<body>
-    {body_content}
-</body>
-</html>"""
-
-# Helper functions
-def text(content: str, tag: str = "p") -> Text:
-    """Create text element"""
-    return Text(content, tag)
-
-def button(text: str, on_click: Callable = None) -> Button:
-    """Create button"""
-    return Button(text, on_click)
-
-def input_field(input_type: str = "text", placeholder: str = "", value: str = "") -> Input:
-    """Create input field"""
-    return Input(input_type, placeholder, value)
-
-def container() -> Container:
-    """Create container"""
-    return Container()
-
-def row() -> Row:
-    """Create row layout"""
-    return Row()
-
-def column() -> Column:
-    """Create column layout"""
-    return Column()
-
-def image(src: str, alt: str = "") -> Image:
-    """Create image"""
-    return Image(src, alt)
-
-def link(href: str, text: str) -> Link:
-    """Create link"""
-    return Link(href, text)
-
-def list_items(items: List[str], ordered: bool = False) -> List:
-    """Create list"""
-    return List(items, ordered)
-
-def card(title: str = "", content: str = "") -> Card:
-    """Create card"""
-    return Card(title, content)
-
-def grid(columns: int = 3, gap: str = "10px") -> Grid:
-    """Create grid layout"""
-    return Grid(columns, gap)
+        body = self.body.render()
+        return ''.join((
+            _PAGE_PREFIX, _esc(self.title),
+            _PAGE_HEAD, self._head_for(body),
+            _PAGE_BODY, body,
+            _PAGE_SUFFIX,
+        ))
+    
+    def render_bytes(self, sink: BinaryIO):
+        """Render full HTML page and write it to a binary sink as UTF-8"""
+        body = self.body.render()
+        write = sink.write
+        write(_PAGE_PREFIX_BYTES)
+        write(_esc(self.title).encode('utf-8'))
+        write(_PAGE_HEAD_BYTES)
+        _write_encoded(write, self._head_for(body))
+        write(_PAGE_BODY_BYTES)
+        _write_encoded(write, body)
+        write(_PAGE_SUFFIX_BYTES)
 
-def page(title: str = "Mythos App") -> Page:
-    """Create page"""
-    return Page(title)
+# Helper functions: the classes are the factories, so aliasing them
+# saves a Python call frame per element
+text = Text
+button = Button
+input_field = Input
+container = Container
+row = Row
+column = Column
+image = Image
+link = Link
+list_items = List
+card = Card
+grid = Grid
+page = Page